@@ -14,6 +14,7 @@
 #    under the License.
 
 from oslo_config import cfg
+from oslo_config import types
 
 from tempest import config  # noqa
 
@@ -55,6 +56,44 @@ CongressHAGroup = [
     cfg.IntOpt("replica_port",
                default=4001,
                help="The listening port for a replica congress server. "),
+    cfg.ListOpt("pe_replica_endpoints",
+                default=[],
+                help="Base URLs of every Congress API server of a "
+                     "replicated policy engine deployment. Replica sync "
+                     "barriers query each of them directly. When empty, "
+                     "the catalog endpoint is sampled several times "
+                     "instead, which does not prove that every replica "
+                     "is in sync: set it for replicated deployments."),
+    cfg.BoolOpt("discover_replicas",
+                default=False,
+                help="When pe_replica_endpoints is empty, use every "
+                     "endpoint of the policy service in the catalog as a "
+                     "replica, if there is more than one."),
+    cfg.StrOpt("replica_balancing",
+               default="round_robin",
+               choices=["round_robin", "least_latency"],
+               help="How the replicated Congress client spreads reads over "
+                    "the replicas: in turn, or to the replica with the "
+                    "lowest recent latency."),
+    cfg.IntOpt("replica_sync_samples",
+               default=3,
+               min=1,
+               help="Number of reads of the catalog endpoint per sync "
+                    "barrier round when pe_replica_endpoints is empty."),
+    cfg.IntOpt("replica_sync_timeout",
+               default=120,
+               help="Maximum time in seconds to wait for all policy engine "
+                    "replicas to agree."),
+    cfg.IntOpt("reactive_action_timeout",
+               default=60,
+               help="Maximum time in seconds to wait, once the policy "
+                    "engine replicas agree on the rows triggering a "
+                    "reactive enforcement action, for its effect."),
+    cfg.IntOpt("replica_divergence_timeout",
+               default=30,
+               help="Time in seconds replicas with the same rules may keep "
+                    "reporting different, unchanging rows before a sync "
+                    "barrier fails."),
 ]
 
 congressz3_group = cfg.OptGroup(name="congressz3", title="Congress Z3 Options")
@@ -67,3 +106,179 @@ CongressZ3Group = [
                 default=True,
                 help="builtins supported by Z3 engine"),
 ]
+
+congress_benchmark_group = cfg.OptGroup(
+    name="congress_benchmark", title="Congress Benchmark Options")
+
+CongressBenchmarkGroup = [
+    cfg.BoolOpt('enabled',
+                default=False,
+                help="Run the Congress benchmarks. They load the deployment "
+                     "heavily and are skipped by default."),
+    cfg.StrOpt('results_dir',
+               default='.',
+               help="Directory the JSON results of the benchmarks are "
+                    "written to, one file per benchmark."),
+    cfg.ListOpt('rule_counts',
+                item_type=types.Integer(min=1),
+                default=[10, 100, 1000, 10000],
+                help="Numbers of rules inserted into a policy by the rule "
+                     "insertion benchmark."),
+    cfg.IntOpt('concurrency',
+               default=8,
+               min=1,
+               help="Number of requests the benchmarks keep in flight in "
+                    "their concurrent runs."),
+    cfg.ListOpt('ingestion_row_counts',
+                item_type=types.Integer(min=1),
+                default=[1000, 10000, 100000],
+                help="Numbers of rows pushed at once to a doctor datasource "
+                     "by the row ingestion benchmark."),
+    cfg.IntOpt('webhook_alarms',
+               default=500,
+               min=1,
+               help="Number of distinct alarms raised then cleared through "
+                    "webhooks by the webhook ingestion benchmark."),
+    cfg.ListOpt('webhook_rates',
+                item_type=types.Float(min=0),
+                default=[10.0, 50.0, 200.0, 0.0],
+                help="Webhook send rates per second replayed by the webhook "
+                     "ingestion benchmark. 0 sends as fast as the "
+                     "concurrency allows."),
+    cfg.ListOpt('z3_graph_shapes',
+                item_type=types.String(
+                    choices=['chain', 'tree', 'random', 'dense']),
+                default=['chain', 'tree', 'random', 'dense'],
+                help="Shapes of the link graphs whose transitive closure "
+                     "is computed by the Z3 scaling benchmark, among chain, "
+                     "tree, random and dense."),
+    cfg.ListOpt('z3_edge_counts',
+                item_type=types.Integer(min=1),
+                default=[100, 1000, 10000],
+                help="Edge counts of the graphs generated by the Z3 scaling "
+                     "benchmark."),
+    cfg.IntOpt('z3_max_closure',
+               default=1000000,
+               min=1,
+               help="Graphs whose transitive closure has more pairs are "
+                    "not loaded by the Z3 scaling benchmark."),
+    cfg.IntOpt('z3_max_unrolled_depth',
+               default=100,
+               min=1,
+               help="The nonrecursive engine cannot evaluate the recursive "
+                    "path rules, so the Z3 scaling benchmark compares Z3 "
+                    "with the closure unrolled to the longest shortest "
+                    "path of the graph, on graphs where it is at most this "
+                    "long."),
+    cfg.IntOpt('enforcement_changes',
+               default=50,
+               min=1,
+               help="Number of triggering changes pushed at each rate by "
+                    "the reactive enforcement benchmark. Each one makes "
+                    "Congress set a metadata item of a test server, so "
+                    "keep it within the nova metadata items quota."),
+    cfg.ListOpt('enforcement_rates',
+                item_type=types.Float(min=0),
+                default=[0.5, 1.0, 2.0, 5.0],
+                help="Triggering changes per second pushed by the reactive "
+                     "enforcement benchmark. 0 pushes them as fast as "
+                     "possible."),
+    cfg.IntOpt('enforcement_settle',
+               default=120,
+               help="Seconds the reactive enforcement benchmark waits, "
+                    "after the last change, for the actions not executed "
+                    "yet before counting them as dropped."),
+    cfg.FloatOpt('enforcement_poll_interval',
+                 default=0.5,
+                 help="Seconds between two polls of the policy table and "
+                      "the executed actions by the reactive enforcement "
+                      "benchmark, which bounds the resolution of its "
+                      "latencies."),
+    cfg.IntOpt('timeout',
+               default=600,
+               min=1,
+               help="Maximum time in seconds a benchmark waits for pushed "
+                    "data to show up in Congress tables."),
+]
+
+congress_group = cfg.OptGroup(name="congress",
+                              title="Congress Client Options")
+
+CongressGroup = [
+    cfg.BoolOpt('persistent_connections',
+                default=False,
+                help="Reuse pooled keep-alive HTTP connections for Congress "
+                     "API calls instead of opening one per request."),
+    cfg.IntOpt('connection_pool_size',
+               default=10,
+               min=1,
+               help="Maximum number of keep-alive connections kept per "
+                    "Congress API endpoint when persistent_connections "
+                    "is enabled."),
+    cfg.IntOpt('bulk_request_workers',
+               default=8,
+               min=1,
+               help="Maximum number of concurrent requests issued by the "
+                    "Congress client bulk helpers."),
+    cfg.IntOpt('datasource_cache_ttl',
+               default=60,
+               min=0,
+               help="Seconds a datasource listing is reused to resolve "
+                    "datasource names and ids. 0 lists the datasources on "
+                    "every lookup."),
+    cfg.BoolOpt('prefetch_datasource_schemas',
+                default=False,
+                help="Fetch the schemas of all the tables of a datasource "
+                     "in one request the first time one of them is needed, "
+                     "instead of one request per table."),
+    cfg.IntOpt('response_cache_size',
+               default=32,
+               min=0,
+               help="Number of datasource and policy row listings whose "
+                    "last response is kept, so unchanged listings are "
+                    "served without being decoded again (or downloaded, "
+                    "when the API supports ETags). 0 disables the cache."),
+    cfg.BoolOpt('compact_rows',
+                default=False,
+                help="Return datasource and policy row listings as compact "
+                     "RowSets of interned tuples instead of lists of "
+                     "{'data': [...]} dicts. row['data'] still works, but "
+                     "holds a tuple instead of a list."),
+    cfg.IntOpt('request_retries',
+               default=0,
+               min=0,
+               help="Times the Congress client retries a GET request that "
+                    "could not reach the server, with exponential backoff. "
+                    "0 disables retries."),
+    cfg.FloatOpt('request_retry_backoff',
+                 default=0.5,
+                 min=0,
+                 help="Base delay in seconds between retries of a request, "
+                      "doubled at every retry."),
+    cfg.IntOpt('circuit_breaker_threshold',
+               default=0,
+               min=0,
+               help="Consecutive connection failures after which requests "
+                    "to a Congress API endpoint fail immediately, until "
+                    "circuit_breaker_reset seconds have passed. 0 disables "
+                    "the circuit breaker."),
+    cfg.FloatOpt('circuit_breaker_reset',
+                 default=5.0,
+                 min=0,
+                 help="Seconds requests to a failing Congress API endpoint "
+                      "are refused before one is let through to probe it."),
+    cfg.StrOpt('json_codec',
+               default='jsonutils',
+               choices=['jsonutils', 'json', 'orjson', 'ujson', 'auto'],
+               help="JSON library used by the Congress client to encode "
+                    "request bodies and decode responses. orjson and ujson "
+                    "must be installed separately; auto uses the fastest "
+                    "one installed."),
+    cfg.StrOpt('request_report_file',
+               help="File the per-endpoint latency, status and response "
+                    "size metrics of the Congress client are written to "
+                    "as JSON at the end of the run. '%(pid)s' is replaced "
+                    "by the process id, so that parallel test workers "
+                    "write separate reports. Per-test metrics are always "
+                    "attached to the test results."),
+]
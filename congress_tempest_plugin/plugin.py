@@ -40,6 +40,11 @@ class CongressTempestPlugin(plugins.TempestPlugin):
                                   config_congress.CongressHAGroup)
         config.register_opt_group(conf, config_congress.congressz3_group,
                                   config_congress.CongressZ3Group)
+        config.register_opt_group(conf, config_congress.congress_group,
+                                  config_congress.CongressGroup)
+        config.register_opt_group(conf,
+                                  config_congress.congress_benchmark_group,
+                                  config_congress.CongressBenchmarkGroup)
 
     def get_opt_lists(self):
         return [
@@ -51,4 +56,8 @@ class CongressTempestPlugin(plugins.TempestPlugin):
              config_congress.ServiceAvailableGroup),
             (config_congress.congress_feature_group.name,
              config_congress.CongressFeatureGroup),
+            (config_congress.congress_group.name,
+             config_congress.CongressGroup),
+            (config_congress.congress_benchmark_group.name,
+             config_congress.CongressBenchmarkGroup),
         ]
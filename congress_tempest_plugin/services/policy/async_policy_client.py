@@ -0,0 +1,179 @@
+# Copyright 2026 OpenStack Foundation
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import asyncio
+from concurrent import futures
+import functools
+import inspect
+import itertools
+
+from tempest.lib.common import rest_client
+
+from congress_tempest_plugin.services.policy import policy_client
+
+# rows handed over per executor round-trip by the row iterators
+_ROW_BATCH = 1000
+
+
+def _mirror(name):
+    """Coroutine method running PolicyClient.<name> off the event loop."""
+    method = getattr(policy_client.PolicyClient, name)
+
+    @functools.wraps(method)
+    async def call(self, *args, **kwargs):
+        return await self._call(getattr(self.client, name), *args, **kwargs)
+    return call
+
+
+def _mirror_policy_client(cls):
+    """Add a coroutine mirror of every PolicyClient API call to cls.
+
+    The public methods PolicyClient defines on top of RestClient are
+    mirrored, unless cls already defines them.
+    """
+    for name, value in vars(policy_client.PolicyClient).items():
+        if (name.startswith('_') or not inspect.isfunction(value) or
+                hasattr(rest_client.RestClient, name) or name in vars(cls)):
+            continue
+        setattr(cls, name, _mirror(name))
+    return cls
+
+
+@_mirror_policy_client
+class AsyncPolicyClient(object):
+    """asyncio front end to the Congress policy API.
+
+    Every PolicyClient call is available as a coroutine.  Requests go
+    through a PolicyClient with pooled keep-alive connections, so tokens
+    come from the tempest auth provider and responses are checked the same
+    way, and run on a bounded executor: up to max_concurrency requests are
+    in flight however many coroutines are awaiting.  This lets a single
+    thread drive dozens of requests with asyncio.gather or the *_many
+    helpers.
+    """
+
+    def __init__(self, auth_provider, service, region, *args,
+                 max_concurrency=8, **kwargs):
+        kwargs.setdefault('persistent_connections', True)
+        kwargs.setdefault('pool_size', max_concurrency)
+        kwargs.setdefault('bulk_workers', max_concurrency)
+        self._setup(policy_client.PolicyClient(
+            auth_provider, service, region, *args, **kwargs),
+            max_concurrency)
+
+    def _setup(self, client, max_concurrency):
+        self.client = client
+        self.max_concurrency = max_concurrency
+        self._executor = futures.ThreadPoolExecutor(
+            max_workers=max_concurrency)
+
+    @classmethod
+    def from_client(cls, client, max_concurrency=None):
+        """Wrap an existing PolicyClient, sharing its auth and transport."""
+        self = cls.__new__(cls)
+        self._setup(client, max_concurrency or client.bulk_workers)
+        return self
+
+    async def _call(self, func, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, functools.partial(func, *args, **kwargs))
+
+    async def run(self, func, *args, **kwargs):
+        """Await a blocking func(*args, **kwargs) on the request executor.
+
+        Meant for checks that make several PolicyClient calls in a row;
+        they count against max_concurrency like any other request.
+        """
+        return await self._call(func, *args, **kwargs)
+
+    def close(self):
+        self._executor.shutdown(wait=True)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def get_request_stats(self):
+        return self.client.get_request_stats()
+
+    def get_endpoint_report(self):
+        return self.client.get_endpoint_report()
+
+    def get_response_cache_stats(self):
+        return self.client.get_response_cache_stats()
+
+    async def _iter(self, rows):
+        def batch():
+            return list(itertools.islice(rows, _ROW_BATCH))
+        try:
+            while True:
+                chunk = await self._call(batch)
+                for row in chunk:
+                    yield row
+                if len(chunk) < _ROW_BATCH:
+                    return
+        finally:
+            await self._call(rows.close)
+
+    def iter_policy_rows(self, policy_name, table):
+        """Asynchronously yield the rows of a policy table as decoded."""
+        return self._iter(self.client.iter_policy_rows(policy_name, table))
+
+    def iter_datasource_rows(self, datasource_name, table_name):
+        """Asynchronously yield the rows of a datasource table as decoded."""
+        return self._iter(
+            self.client.iter_datasource_rows(datasource_name, table_name))
+
+    async def gather_map(self, func, items):
+        """Await func(item) for all items concurrently, keyed by item.
+
+        Raises BulkRequestError with the per-item exceptions and the
+        results of the items that succeeded if any of the calls fails.
+        """
+        items = list(items)
+        outcomes = await asyncio.gather(*[func(item) for item in items],
+                                        return_exceptions=True)
+        results = {}
+        errors = {}
+        for item, outcome in zip(items, outcomes):
+            if isinstance(outcome, Exception):
+                errors[item] = outcome
+            else:
+                results[item] = outcome
+        if errors:
+            raise policy_client.BulkRequestError(errors, results)
+        return results
+
+    async def list_datasource_rows_many(self, datasource_name, tables):
+        """Fetch the rows of several tables, as a table to rows dict."""
+        async def fetch(table):
+            body = await self.list_datasource_rows(datasource_name, table)
+            return body['results']
+        return await self.gather_map(fetch, tables)
+
+    async def list_policy_rows_many(self, policy_name, tables):
+        """Fetch the rows of several policy tables, keyed by table."""
+        async def fetch(table):
+            body = await self.list_policy_rows(policy_name, table)
+            return body['results']
+        return await self.gather_map(fetch, tables)
+
+    async def list_datasource_status_many(self, datasources):
+        """Fetch the status of several datasources, keyed by datasource."""
+        return await self.gather_map(self.list_datasource_status,
+                                     datasources)
@@ -0,0 +1,105 @@
+# Copyright 2026 OpenStack Foundation
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""JSON codecs used by PolicyClient to (de)serialize request bodies.
+
+'jsonutils' (oslo.serialization, the default) and 'json' (the standard
+library) are always available; 'orjson' and 'ujson' are used only when
+they are installed.  'auto' picks the fastest installed one.
+"""
+
+import importlib
+import json
+
+from oslo_serialization import jsonutils
+from tempest.lib import exceptions
+
+
+class Codec(object):
+    """A named pair of dumps/loads functions."""
+
+    def __init__(self, name, dumps, loads):
+        self.name = name
+        self.dumps = dumps
+        self.loads = loads
+
+    def __repr__(self):
+        return 'Codec(%s)' % self.name
+
+
+def _jsonutils():
+    return Codec('jsonutils', jsonutils.dumps, jsonutils.loads)
+
+
+def _json():
+    return Codec('json', json.dumps, json.loads)
+
+
+def _orjson():
+    orjson = importlib.import_module('orjson')
+    return Codec('orjson', orjson.dumps, orjson.loads)
+
+
+def _ujson():
+    ujson = importlib.import_module('ujson')
+    return Codec('ujson', ujson.dumps, ujson.loads)
+
+
+CODECS = {
+    'jsonutils': _jsonutils,
+    'json': _json,
+    'orjson': _orjson,
+    'ujson': _ujson,
+}
+# tried in this order by 'auto'
+PREFERENCE = ('orjson', 'ujson', 'json')
+
+_loaded = {}
+
+
+def get_codec(name='jsonutils'):
+    """Return the codec called name, or the fastest installed for 'auto'.
+
+    Raises InvalidConfiguration for an unknown codec or one whose library
+    is not installed.
+    """
+    if name == 'auto':
+        for candidate in PREFERENCE:
+            if candidate in available_codecs():
+                return get_codec(candidate)
+    codec = _loaded.get(name)
+    if codec is None:
+        if name not in CODECS:
+            raise exceptions.InvalidConfiguration(
+                'Unknown JSON codec %s, expected one of: %s' % (
+                    name, ', '.join(sorted(CODECS) + ['auto'])))
+        try:
+            codec = _loaded[name] = CODECS[name]()
+        except ImportError as e:
+            raise exceptions.InvalidConfiguration(
+                'JSON codec %s is not installed: %s' % (name, e))
+    return codec
+
+
+def available_codecs():
+    """Return the names of the codecs whose library is installed."""
+    names = []
+    for name in sorted(CODECS):
+        try:
+            get_codec(name)
+        except exceptions.InvalidConfiguration:
+            continue
+        names.append(name)
+    return names
@@ -13,10 +13,196 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
-from oslo_serialization import jsonutils as json
+from concurrent import futures
+import functools
+import hashlib
+import inspect
+import random
+import threading
+import time
+
 from tempest.lib.common import rest_client
+from tempest.lib import exceptions
+from urllib3 import exceptions as urllib3_exceptions
+
+from congress_tempest_plugin.services.policy import instrumentation
+from congress_tempest_plugin.services.policy import json_codec
+from congress_tempest_plugin.services.policy import rows
+from congress_tempest_plugin.services.policy import streaming
+from congress_tempest_plugin.services.policy import trace as policy_trace
+from congress_tempest_plugin.services.policy import transport
+
+
+class BulkRequestError(exceptions.TempestException):
+    message = "Bulk request failed for: %(failed)s"
+
+    def __init__(self, errors, results):
+        super(BulkRequestError, self).__init__(
+            failed=', '.join('%s (%s)' % (item, error)
+                             for item, error in sorted(errors.items())))
+        self.errors = errors
+        self.results = results
+
+
+class CircuitOpenError(exceptions.TempestException):
+    message = ("Not sending %(method)s %(url)s: %(endpoint)s is failing, "
+               "next attempt in %(retry_in).1fs")
+
+
+# requests retried on connection failures
+IDEMPOTENT_METHODS = frozenset(['GET', 'HEAD', 'OPTIONS'])
+# statuses of a proxy or load balancer in front of an unreachable server
+UNAVAILABLE_STATUSES = frozenset([502, 503, 504])
+# whether RestClient.get can stream the response body, which older tempest
+# releases cannot do
+GET_STREAMS = 'chunked' in inspect.signature(
+    rest_client.RestClient.get).parameters
+
+
+def is_connection_failure(error):
+    """Tell whether error means the server could not be reached."""
+    if isinstance(error, exceptions.UnexpectedResponseCode):
+        status = getattr(getattr(error, 'resp', None), 'status', None)
+        return status in UNAVAILABLE_STATUSES
+    return isinstance(error, (OSError, urllib3_exceptions.HTTPError))
+
+
+def run_concurrently(func, items, max_workers=8):
+    """Call func on every item over a bounded thread pool, keyed by item.
+
+    Raises BulkRequestError carrying the per-item exceptions and the
+    results of the items that succeeded if any call fails.
+    """
+    items = list(items)
+    if not items:
+        return {}
+    results = {}
+    errors = {}
+    with futures.ThreadPoolExecutor(
+            max_workers=min(max_workers, len(items))) as executor:
+        jobs = dict((executor.submit(func, item), item) for item in items)
+        for job in futures.as_completed(jobs):
+            try:
+                results[jobs[job]] = job.result()
+            except Exception as e:
+                errors[jobs[job]] = e
+    if errors:
+        raise BulkRequestError(errors, results)
+    return results
+
+
+class DatasourceRegistry(object):
+    """Cache of the datasource list of an endpoint, indexed by name and id.
+
+    Filled by every PolicyClient.list_datasources call and dropped whenever
+    a datasource is created or deleted through any client of the endpoint.
+    A generation counter keeps a listing that raced with such a change from
+    being stored.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.generation = 0
+        self._indexes = {'name': {}, 'id': {}}
+        self._loaded_at = None
+
+    def invalidate(self):
+        with self._lock:
+            self.generation += 1
+            self._loaded_at = None
+
+    def store(self, datasources, generation):
+        with self._lock:
+            if generation != self.generation:
+                return
+            self._indexes = {
+                'name': dict((ds['name'], ds) for ds in datasources),
+                'id': dict((ds['id'], ds) for ds in datasources),
+            }
+            self._loaded_at = time.time()
+
+    def get(self, field, value, ttl):
+        """Return the cached datasource whose field is value.
+
+        None is returned when there is no such datasource or the cached
+        listing is older than ttl seconds.
+        """
+        with self._lock:
+            if (self._loaded_at is None or
+                    time.time() - self._loaded_at >= ttl):
+                return None
+            return self._indexes[field].get(value)
+
+
+class DatasourceRegistries(object):
+    """Process-wide datasource registries, one per endpoint."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._registries = {}
+
+    def get(self, endpoint):
+        with self._lock:
+            registry = self._registries.get(endpoint)
+            if registry is None:
+                registry = self._registries[endpoint] = DatasourceRegistry()
+            return registry
+
+
+DATASOURCE_REGISTRIES = DatasourceRegistries()
+
+
+class TableSchema(tuple):
+    """Column specs of a datasource table, with each column's position.
+
+    Behaves as the 'columns' list returned by the API and adds index, a
+    dict mapping column names to their position in the table rows.
+    """
+
+    def __new__(cls, columns):
+        self = super(TableSchema, cls).__new__(cls, columns)
+        self.index = dict((c['name'], i) for i, c in enumerate(self))
+        return self
+
+
+class SchemaCache(object):
+    """Process-wide cache of datasource table schemas.
+
+    Entries are keyed by (datasource, table) as passed by the caller, so a
+    datasource looked up by both name and id is cached twice.  Schemas do
+    not change while a datasource exists; the cache is dropped whenever a
+    datasource is created or deleted.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._schemas = {}
+
+    def get(self, datasource, table):
+        with self._lock:
+            return self._schemas.get((datasource, table))
+
+    def store(self, datasource, table, schema):
+        with self._lock:
+            self._schemas[(datasource, table)] = schema
 
+    def invalidate(self):
+        with self._lock:
+            self._schemas = {}
 
+
+SCHEMA_CACHE = SchemaCache()
+
+
+def _url_templates(cls):
+    cls.url_templates = instrumentation.URLTemplates(
+        value for name, value in vars(cls).items()
+        if not name.startswith('_') and isinstance(value, str) and
+        value.startswith('/v1/'))
+    return cls
+
+
+@_url_templates
 class PolicyClient(rest_client.RestClient):
 
     policy = '/v1/policies'
@@ -45,6 +231,141 @@ class PolicyClient(rest_client.RestClient):
     driver = '/v1/system/drivers'
     driver_path = '/v1/system/drivers/%s'
 
+    def __init__(self, auth_provider, service, region, *args,
+                 persistent_connections=False, pool_size=10,
+                 bulk_workers=8, endpoint_override=None,
+                 datasource_cache_ttl=60, prefetch_schemas=False,
+                 response_cache_size=32, compact_rows=False, metrics=None,
+                 codec='jsonutils', retries=0, retry_backoff=0.5,
+                 breaker_threshold=0, breaker_reset=5.0, **kwargs):
+        super(PolicyClient, self).__init__(
+            auth_provider, service, region, *args, **kwargs)
+        self.bulk_workers = bulk_workers
+        self.datasource_cache_ttl = datasource_cache_ttl
+        self._datasource_registry = None
+        self.prefetch_schemas = prefetch_schemas
+        self.schema_cache = SCHEMA_CACHE
+        self.endpoint_override = endpoint_override
+        self.metrics = metrics or instrumentation.REQUEST_METRICS
+        # the requests of this client, also recorded in metrics
+        self.stats = instrumentation.RequestMetrics(parent=self.metrics)
+        self.codec = json_codec.get_codec(codec)
+        self.response_cache = transport.ResponseCache(response_cache_size)
+        self.compact_rows = compact_rows
+        self.retries = retries
+        self.retry_backoff = retry_backoff
+        self.breaker_threshold = breaker_threshold
+        self.breaker_reset = breaker_reset
+        self._breaker = None
+        # NOTE: keep tempest's closing transport when going through a proxy,
+        # connection reuse is up to the proxy in that case.
+        if persistent_connections and not kwargs.get('proxy_url'):
+            self.http_obj = transport.PooledHttp(
+                disable_ssl_certificate_validation=self.dscv,
+                ca_certs=kwargs.get('ca_certs'),
+                timeout=kwargs.get('http_timeout'),
+                follow_redirects=kwargs.get('follow_redirects', True),
+                pool_size=pool_size)
+
+    @property
+    def circuit_breaker(self):
+        """The breaker of the endpoint of this client, None if disabled."""
+        if self._breaker is None and self.breaker_threshold:
+            self._breaker = transport.CIRCUIT_BREAKERS.get(
+                self.endpoint_override or self.base_url,
+                self.breaker_threshold, self.breaker_reset)
+        return self._breaker
+
+    @property
+    def datasource_registry(self):
+        """The datasource registry of the endpoint of this client.
+
+        It is keyed by the catalog endpoint rather than endpoint_override,
+        so that the clients of the replicas of a deployment share it.
+        """
+        if self._datasource_registry is None:
+            self._datasource_registry = DATASOURCE_REGISTRIES.get(
+                self.base_url)
+        return self._datasource_registry
+
+    def request(self, method, url, *args, **kwargs):
+        """Send a request through the circuit breaker of the endpoint.
+
+        Requests are refused with CircuitOpenError while the circuit is
+        open.  Idempotent requests failing to reach the server are retried
+        up to retries times, with exponential backoff and jitter.
+        """
+        breaker = self.circuit_breaker
+        attempts = 1 + (self.retries if method in IDEMPOTENT_METHODS else 0)
+        for attempt in range(attempts):
+            if breaker is not None:
+                retry_in = breaker.allow()
+                if retry_in:
+                    raise CircuitOpenError(
+                        method=method, url=url, retry_in=retry_in,
+                        endpoint=breaker.endpoint)
+            try:
+                result = self._timed_request(method, url, *args, **kwargs)
+            except Exception as e:
+                if not is_connection_failure(e):
+                    if breaker is not None:
+                        breaker.record_success()
+                    raise
+                if breaker is not None:
+                    breaker.record_failure()
+                if attempt + 1 >= attempts:
+                    raise
+                time.sleep(self.retry_backoff * (2 ** attempt) *
+                           random.uniform(0.5, 1.0))
+                continue
+            if breaker is not None:
+                breaker.record_success()
+            return result
+
+    def _timed_request(self, method, url, *args, **kwargs):
+        start = time.time()
+        failed = True
+        status = 'error'
+        size = 0
+        try:
+            resp, body = super(PolicyClient, self).request(
+                method, url, *args, **kwargs)
+            failed = False
+            status = resp.status
+            size = len(body or b'')
+            return resp, body
+        except exceptions.RestClientException as e:
+            status = getattr(getattr(e, 'resp', None), 'status', status)
+            raise
+        finally:
+            self.stats.record(
+                '%s %s' % (method, self.url_templates.template(url)),
+                status, time.time() - start, size, failed=failed)
+
+    def _request(self, method, url, headers=None, body=None, **kwargs):
+        if not self.endpoint_override:
+            return super(PolicyClient, self)._request(
+                method, url, headers=headers, body=body, **kwargs)
+        # Authenticate through the catalog, but send the request to the
+        # overridden endpoint (e.g. one replica of a replicated deployment).
+        _, req_headers, req_body = self.auth_provider.auth_request(
+            method, url, headers, body, self.filters)
+        resp, resp_body = self.raw_request(
+            self.endpoint_override.rstrip('/') + url, method,
+            headers=req_headers, body=req_body, **kwargs)
+        self.response_checker(method, resp, resp_body)
+        return resp, resp_body
+
+    def get_request_stats(self):
+        """Return timing counters for the requests sent by this client."""
+        summary = self.stats.totals()
+        if isinstance(self.http_obj, transport.PooledHttp):
+            summary['connections_opened'] = self.http_obj.connections_opened()
+        else:
+            # the closing transport opens one connection per request
+            summary['connections_opened'] = summary['count']
+        return summary
+
     def _add_params_to_url(self, url, params):
         for key in params:
             url = url + '?{param_name}={param_value}'.format(
@@ -53,13 +374,91 @@ class PolicyClient(rest_client.RestClient):
 
     def _resp_helper(self, resp, body=None):
         if body:
-            body = json.loads(body)
+            body = self.codec.loads(body)
         return rest_client.ResponseBody(resp, body)
 
+    def _get_cached(self, url, convert=None):
+        """GET url, reusing the decoded body when the response is unchanged.
+
+        The last body of each URL is kept in an LRU cache.  If the server
+        gave an ETag the request is made conditional and a 304 is served
+        from the cache; otherwise a body whose digest matches the cached
+        one is not decoded again.  Bodies served from the cache are shared
+        between callers and must not be modified.
+
+        convert, if given, is applied to newly decoded bodies and its result
+        is what gets cached.
+        """
+        if not self.response_cache.size:
+            resp, body = self.get(url)
+            body = self.codec.loads(body) if body else None
+            if convert is not None:
+                body = convert(body)
+            return rest_client.ResponseBody(resp, body)
+        entry = self.response_cache.get(url)
+        if entry is not None and entry.etag:
+            resp, body = self.get(url, headers={'If-None-Match': entry.etag},
+                                  extra_headers=True)
+        else:
+            resp, body = self.get(url)
+        if resp.status == 304 and entry is not None:
+            self.response_cache.record(True, not_modified=True)
+            return rest_client.ResponseBody(resp, entry.body)
+        digest = hashlib.blake2b(body, digest_size=16).digest()
+        if entry is not None and entry.digest == digest:
+            self.response_cache.record(True)
+            decoded = entry.body
+        else:
+            self.response_cache.record(False)
+            decoded = self.codec.loads(body) if body else None
+            if convert is not None:
+                decoded = convert(decoded)
+        self.response_cache.store(url, transport.CachedResponse(
+            resp.get('etag'), digest, decoded))
+        return rest_client.ResponseBody(resp, decoded)
+
+    def get_endpoint_report(self):
+        """Return latency, status and size metrics by endpoint template."""
+        return self.metrics.report()
+
+    def get_response_cache_stats(self):
+        """Return the hit/miss counters of the row response cache."""
+        return self.response_cache.summary()
+
+    def _iter_results(self, url, chunk_size=65536):
+        """Stream the 'results' array of a GET response, one item at a time.
+
+        The response is read and decoded incrementally instead of being
+        loaded whole.  Stopping the iteration early closes the connection.
+        Tempest releases whose RestClient.get cannot stream (chunked) get
+        the whole response, which is then iterated.
+        """
+        if not GET_STREAMS:
+            _, body = self.get(url)
+            for item in self.codec.loads(body)['results']:
+                yield item
+            return
+        resp, _ = self.get(url, chunked=True)
+        done = False
+        try:
+            for item in streaming.iter_json_array(
+                    resp.stream(chunk_size), 'results'):
+                yield item
+            done = True
+        finally:
+            if done:
+                resp.release_conn()
+            else:
+                resp.close()
+
+    def _run_bulk(self, func, items, max_workers=None):
+        return run_concurrently(func, items,
+                                max_workers=max_workers or self.bulk_workers)
+
     def create_policy(self, body, params=None):
         if params is None:
             params = {}
-        body = json.dumps(body)
+        body = self.codec.dumps(body)
         resp, body = self.post(
             self._add_params_to_url(self.policy, params), body=body)
         return self._resp_helper(resp, body)
@@ -75,7 +474,7 @@ class PolicyClient(rest_client.RestClient):
         return self._resp_helper(resp, body)
 
     def create_library_policy(self, body):
-        body = json.dumps(body)
+        body = self.codec.dumps(body)
         resp, body = self.post(
             self.library_policy, body=body)
         return self._resp_helper(resp, body)
@@ -91,7 +490,7 @@ class PolicyClient(rest_client.RestClient):
         return self._resp_helper(resp, body)
 
     def create_policy_rule(self, policy_name, body=None):
-        body = json.dumps(body)
+        body = self.codec.dumps(body)
         resp, body = self.post(
             self.policy_rules % policy_name, body=body)
         return self._resp_helper(resp, body)
@@ -101,6 +500,29 @@ class PolicyClient(rest_client.RestClient):
             self.policy_rules_path % (policy_name, rule_id))
         return self._resp_helper(resp, body)
 
+    def create_policy_rules_bulk(self, policy_name, rules,
+                                 max_workers=None):
+        """Create several rules of a policy concurrently.
+
+        rules are rule strings or rule bodies as passed to
+        create_policy_rule.  Returns the created rules in the order of
+        rules.  On failure, BulkRequestError errors and results are keyed
+        by the position of the rule in rules.
+        """
+        bodies = [{'rule': rule} if isinstance(rule, str) else rule
+                  for rule in rules]
+        results = self._run_bulk(
+            lambda i: self.create_policy_rule(policy_name, bodies[i]),
+            range(len(bodies)), max_workers=max_workers)
+        return [results[i] for i in range(len(bodies))]
+
+    def delete_policy_rules_bulk(self, policy_name, rule_ids,
+                                 max_workers=None):
+        """Delete several rules of a policy concurrently, keyed by id."""
+        return self._run_bulk(
+            lambda rule_id: self.delete_policy_rule(policy_name, rule_id),
+            rule_ids, max_workers=max_workers)
+
     def show_policy_rule(self, policy_name, rule_id):
         resp, body = self.get(
             self.policy_rules_path % (policy_name, rule_id))
@@ -111,8 +533,41 @@ class PolicyClient(rest_client.RestClient):
             query = self.policy_rows_trace
         else:
             query = self.policy_rows
-        resp, body = self.get(query % (policy_name, table))
-        return self._resp_helper(resp, body)
+        convert = rows.compact_body if self.compact_rows else None
+        return self._get_cached(query % (policy_name, table), convert=convert)
+
+    def trace_policy_rows(self, policy_name, tables):
+        """Query policy tables with tracing and parse the traces.
+
+        Returns a trace.PolicyTrace whose call trees are those of the
+        queries of every table of tables, in order.
+        """
+        roots = []
+        unparsed = 0
+        for table in tables:
+            body = self.list_policy_rows(policy_name, table, trace=True)
+            parsed = policy_trace.parse(body.get('trace'))
+            roots.extend(parsed.roots)
+            unparsed += parsed.unparsed
+        return policy_trace.PolicyTrace(roots, unparsed)
+
+    def hot_policy_rules(self, policy_name, tables=None, limit=10):
+        """Rank the rules of a policy by the cost of their evaluation.
+
+        The given tables, all the tables of the policy by default, are
+        queried with tracing; see trace.hot_rules for the report format.
+        """
+        if tables is None:
+            tables = [t['id'] for t in
+                      self.list_policy_tables(policy_name)['results']]
+        rules = self.list_policy_rules(policy_name)['results']
+        return policy_trace.hot_rules(
+            self.trace_policy_rows(policy_name, tables), rules,
+            policy_name=policy_name, limit=limit)
+
+    def iter_policy_rows(self, policy_name, table):
+        """Yield the rows of a policy table as they are decoded."""
+        return self._iter_results(self.policy_rows % (policy_name, table))
 
     def list_policy_rules(self, policy_name):
         resp, body = self.get(self.policy_rules % (policy_name))
@@ -135,7 +590,7 @@ class PolicyClient(rest_client.RestClient):
         return self._resp_helper(resp, body)
 
     def execute_policy_action(self, policy_name, action, trace, delta, body):
-        body = json.dumps(body)
+        body = self.codec.dumps(body)
         uri = "?action=%s&trace=%s&delta=%s" % (action, trace, delta)
         resp, body = self.post(
             (self.policy_path % policy_name) + str(uri), body=body)
@@ -146,17 +601,62 @@ class PolicyClient(rest_client.RestClient):
         return self._resp_helper(resp, body)
 
     def list_datasources(self):
+        generation = self.datasource_registry.generation
         resp, body = self.get(self.datasources)
-        return self._resp_helper(resp, body)
+        body = self._resp_helper(resp, body)
+        self.datasource_registry.store(body['results'], generation)
+        return body
+
+    def _find_datasource(self, field, value):
+        datasource = self.datasource_registry.get(
+            field, value, self.datasource_cache_ttl)
+        if datasource is None:
+            # unknown or expired, the datasource may have been added since
+            for datasource in self.list_datasources()['results']:
+                if datasource[field] == value:
+                    return datasource
+            return None
+        return datasource
+
+    def get_datasource_id(self, datasource_name):
+        """Return the id of the named datasource, None if there is none."""
+        datasource = self._find_datasource('name', datasource_name)
+        return datasource['id'] if datasource else None
+
+    def get_datasource_name(self, datasource_id):
+        """Return the name of a datasource by id, None if there is none."""
+        datasource = self._find_datasource('id', datasource_id)
+        return datasource['name'] if datasource else None
 
     def list_datasource_tables(self, datasource_name):
         resp, body = self.get(self.datasource_tables % (datasource_name))
         return self._resp_helper(resp, body)
 
     def list_datasource_rows(self, datasource_name, table_name):
-        resp, body = self.get(self.datasource_rows %
-                              (datasource_name, table_name))
-        return self._resp_helper(resp, body)
+        convert = None
+        if self.compact_rows:
+            schema = self.get_datasource_table_schema(datasource_name,
+                                                      table_name)
+            convert = functools.partial(rows.compact_body, columns=schema)
+        return self._get_cached(self.datasource_rows %
+                                (datasource_name, table_name),
+                                convert=convert)
+
+    def iter_datasource_rows(self, datasource_name, table_name):
+        """Yield the rows of a datasource table as they are decoded."""
+        return self._iter_results(
+            self.datasource_rows % (datasource_name, table_name))
+
+    def list_datasource_rows_bulk(self, datasource_name, tables,
+                                  max_workers=None):
+        """Fetch the rows of several datasource tables concurrently.
+
+        Returns a dict mapping each table name to its list of rows.
+        """
+        return self._run_bulk(
+            lambda table: self.list_datasource_rows(
+                datasource_name, table)['results'],
+            tables, max_workers=max_workers)
 
     def list_datasource_status(self, datasource_name):
         resp, body = self.get(self.datasource_status % datasource_name)
@@ -171,36 +671,67 @@ class PolicyClient(rest_client.RestClient):
                               (datasource_name, table_name))
         return self._resp_helper(resp, body)
 
+    def get_datasource_table_schema(self, datasource_name, table_name):
+        """Return the cached TableSchema of a datasource table.
+
+        On a miss with prefetch_schemas set, the schemas of all the tables
+        of the datasource are fetched and cached in a single request.
+        """
+        schema = self.schema_cache.get(datasource_name, table_name)
+        if schema is None and self.prefetch_schemas:
+            self.prefetch_datasource_schemas(datasource_name)
+            schema = self.schema_cache.get(datasource_name, table_name)
+        if schema is None:
+            schema = TableSchema(self.show_datasource_table_schema(
+                datasource_name, table_name)['columns'])
+            self.schema_cache.store(datasource_name, table_name, schema)
+        return schema
+
+    def prefetch_datasource_schemas(self, datasource_name):
+        """Cache the schemas of every table of a datasource."""
+        tables = self.show_datasource_schema(datasource_name)['tables']
+        for table in tables:
+            self.schema_cache.store(datasource_name, table['table_id'],
+                                    TableSchema(table['columns']))
+
     def show_datasource_table(self, datasource_name, table_id):
         resp, body = self.get(self.datasource_table_path %
                               (datasource_name, table_id))
         return self._resp_helper(resp, body)
 
     def create_datasource(self, body=None):
-        body = json.dumps(body)
-        resp, body = self.post(
-            self.datasources, body=body)
+        body = self.codec.dumps(body)
+        try:
+            resp, body = self.post(
+                self.datasources, body=body)
+        finally:
+            self.datasource_registry.invalidate()
+            self.schema_cache.invalidate()
         return self._resp_helper(resp, body)
 
     def delete_datasource(self, datasource):
-        resp, body = self.delete(
-            self.datasource_path % datasource)
+        try:
+            resp, body = self.delete(
+                self.datasource_path % datasource)
+        finally:
+            self.datasource_registry.invalidate()
+            self.schema_cache.invalidate()
         return self._resp_helper(resp, body)
 
     def update_datasource_row(self, datasource_name, table_id, rows):
-        body = json.dumps(rows)
+        body = self.codec.dumps(rows)
         resp, body = self.put(
             self.datasource_rows % (datasource_name, table_id), body)
         return self._resp_helper(resp)
 
     def send_datasource_webhook(self, datasource_name, body):
-        body = json.dumps(body)
+        body = self.codec.dumps(body)
         resp, body = self.post(
             self.datasource_webhook % datasource_name, body=body)
         return self._resp_helper(resp)
 
     def execute_datasource_action(self, service_name, action, body):
-        body = json.dumps(body)
+        body = self.codec.dumps(body)
         uri = "?action=%s" % (action)
         resp, body = self.post(
             (self.datasource_path % service_name) + str(uri), body=body)
@@ -215,7 +746,7 @@ class PolicyClient(rest_client.RestClient):
         return self._resp_helper(resp, body)
 
     def request_refresh(self, driver, body=None):
-        body = json.dumps(body)
+        body = self.codec.dumps(body)
         resp, body = self.post(self.datasource_path %
                                (driver) + "?action=request-refresh",
                                body=body)
@@ -0,0 +1,287 @@
+# Copyright 2026 OpenStack Foundation
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import functools
+import itertools
+import threading
+import time
+
+from oslo_log import log as logging
+from tempest.lib import exceptions
+
+from congress_tempest_plugin.services.policy import policy_client
+
+LOG = logging.getLogger(__name__)
+
+# weight of the latest call in the per-replica latency moving average
+_EWMA_WEIGHT = 0.3
+
+
+def is_replica_failure(error):
+    """Tell whether error means the replica, not the request, failed."""
+    return (isinstance(error, policy_client.CircuitOpenError) or
+            policy_client.is_connection_failure(error))
+
+
+def discover_endpoints(auth_provider, service_types, region=None,
+                       endpoint_type='publicURL'):
+    """Return the URLs of every catalog endpoint of the service types.
+
+    Both identity v2 and v3 catalogs are supported.  Endpoints are
+    returned in catalog order, without duplicates.
+    """
+    _, auth_data = auth_provider.auth_data
+    interface = endpoint_type.replace('URL', '')
+    urls = []
+    for service in (auth_data.get('catalog') or
+                    auth_data.get('serviceCatalog') or []):
+        if service.get('type') not in service_types:
+            continue
+        for endpoint in service.get('endpoints', []):
+            if region and region not in (endpoint.get('region'),
+                                         endpoint.get('region_id')):
+                continue
+            if 'interface' in endpoint:
+                url = (endpoint['url']
+                       if endpoint['interface'] == interface else None)
+            else:
+                url = endpoint.get(endpoint_type)
+            if url and url not in urls:
+                urls.append(url)
+    return urls
+
+
+class ReplicaStats(object):
+    """Latency of the calls sent to one replica.
+
+    Calls the replica failed to serve are counted as errors but left out
+    of the moving average: a dead replica fails fast, which would make it
+    look like the quickest one.  Instead the replica is marked failing
+    until it serves a call again, which restarts its average.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.total_time = 0.0
+        self.ewma = None
+        self.failing = False
+        # sequence number of the last read sent to the replica
+        self.last_read = 0
+
+    def record(self, elapsed, failed=False):
+        self.count += 1
+        self.total_time += elapsed
+        if failed:
+            self.errors += 1
+            self.failing = True
+            return
+        self.ewma = (elapsed if self.ewma is None or self.failing else
+                     _EWMA_WEIGHT * elapsed + (1 - _EWMA_WEIGHT) * self.ewma)
+        self.failing = False
+
+    def rank(self):
+        """Sort key of the replica, healthy and quickest first."""
+        return (self.failing, self.ewma or 0.0)
+
+    def summary(self):
+        return {'count': self.count,
+                'errors': self.errors,
+                'mean_time': (self.total_time / self.count
+                              if self.count else 0.0),
+                'recent_time': self.ewma or 0.0,
+                'failing': self.failing}
+
+
+def _read(name):
+    """Read method sent to the replica picked by the balancing strategy."""
+    method = getattr(policy_client.PolicyClient, name)
+
+    @functools.wraps(method)
+    def call(self, *args, **kwargs):
+        return self._balanced_call(name, *args, **kwargs)
+    return call
+
+
+def _write(name):
+    """Write method sent to the primary replica."""
+    method = getattr(policy_client.PolicyClient, name)
+
+    @functools.wraps(method)
+    def call(self, *args, **kwargs):
+        return self._call(self.replicas[0], name, *args, **kwargs)
+    return call
+
+
+class ReplicatedPolicyClient(object):
+    """Congress client spreading its calls over every API replica.
+
+    One PolicyClient is built per endpoint, authenticated through the
+    catalog and sending its requests to that endpoint.  Writes go to the
+    first (primary) replica; reads are balanced over the replicas either
+    round_robin or to the least_latency one, by moving average of recent
+    calls.  A read the replica fails to serve (connection failure,
+    unavailable status or open circuit) is sent to the other replicas in
+    turn, healthiest first.  fan_out sends one read to every replica in
+    parallel, e.g. to check that they agree.
+
+    :param endpoints: API base URLs of the replicas; by default every
+        endpoint of the service types found in the catalog
+    :param service_types: catalog service types of the replicas, service
+        by default
+    :param reprobe_interval: with least_latency, every reprobe_interval-th
+        read goes to the replica left unread the longest, so that the
+        latency of the others (or the recovery of a failing one) is
+        measured again; 0 never re-probes
+    """
+
+    STRATEGIES = ('round_robin', 'least_latency')
+
+    def __init__(self, auth_provider, service, region, *args,
+                 endpoints=None, service_types=None, strategy='round_robin',
+                 reprobe_interval=20, **kwargs):
+        if strategy not in self.STRATEGIES:
+            raise exceptions.InvalidConfiguration(
+                'Unknown replica balancing strategy %s' % strategy)
+        if endpoints is None:
+            endpoints = discover_endpoints(
+                auth_provider, service_types or [service], region,
+                kwargs.get('endpoint_type', 'publicURL'))
+        if not endpoints:
+            raise exceptions.EndpointNotFound(
+                'No Congress API endpoint found for %s' %
+                (service_types or [service]))
+        self.strategy = strategy
+        self.reprobe_interval = reprobe_interval
+        self.endpoints = list(endpoints)
+        self.replicas = [
+            policy_client.PolicyClient(auth_provider, service, region,
+                                       *args, endpoint_override=endpoint,
+                                       **kwargs)
+            for endpoint in self.endpoints]
+        self.bulk_workers = self.replicas[0].bulk_workers
+        self._lock = threading.Lock()
+        self._cycle = itertools.cycle(self.replicas)
+        self._stats = dict((id(r), ReplicaStats()) for r in self.replicas)
+        self._reads = 0
+
+    def _call(self, replica, name, *args, **kwargs):
+        start = time.time()
+        failed = True
+        try:
+            result = getattr(replica, name)(*args, **kwargs)
+            failed = False
+            return result
+        finally:
+            elapsed = time.time() - start
+            with self._lock:
+                self._stats[id(replica)].record(elapsed, failed=failed)
+
+    def _balanced_call(self, name, *args, **kwargs):
+        replica = self.pick()
+        with self._lock:
+            fallbacks = sorted(
+                (r for r in self.replicas if r is not replica),
+                key=lambda r: self._stats[id(r)].rank())
+        for fallback in fallbacks:
+            try:
+                return self._call(replica, name, *args, **kwargs)
+            except Exception as e:
+                if not is_replica_failure(e):
+                    raise
+                LOG.warning('%s failed on replica %s, trying %s: %s',
+                            name, replica.endpoint_override,
+                            fallback.endpoint_override, e)
+            replica = fallback
+        return self._call(replica, name, *args, **kwargs)
+
+    def pick(self):
+        """Return the replica the next read should go to."""
+        with self._lock:
+            if self.strategy == 'round_robin':
+                return next(self._cycle)
+            self._reads += 1
+            untried = [r for r in self.replicas
+                       if self._stats[id(r)].ewma is None and
+                       not self._stats[id(r)].failing]
+            if untried:
+                replica = untried[0]
+            elif (self.reprobe_interval and
+                    self._reads % self.reprobe_interval == 0):
+                replica = min(self.replicas,
+                              key=lambda r: self._stats[id(r)].last_read)
+            else:
+                replica = min(self.replicas,
+                              key=lambda r: self._stats[id(r)].rank())
+            self._stats[id(replica)].last_read = self._reads
+            return replica
+
+    def fan_out(self, name, *args, **kwargs):
+        """Call PolicyClient.<name> on every replica in parallel.
+
+        Returns a dict mapping each replica endpoint to its result, and
+        raises BulkRequestError, keyed by endpoint, if any call fails.
+        """
+        by_endpoint = dict(zip(self.endpoints, self.replicas))
+        return policy_client.run_concurrently(
+            lambda endpoint: self._call(by_endpoint[endpoint], name,
+                                        *args, **kwargs),
+            self.endpoints, max_workers=self.bulk_workers)
+
+    def get_replica_latency(self):
+        """Return the latency of the calls sent to each replica endpoint."""
+        with self._lock:
+            return dict((endpoint, self._stats[id(replica)].summary())
+                        for endpoint, replica in zip(self.endpoints,
+                                                     self.replicas))
+
+    list_policy = _read('list_policy')
+    show_policy = _read('show_policy')
+    list_policy_rules = _read('list_policy_rules')
+    show_policy_rule = _read('show_policy_rule')
+    list_policy_rows = _read('list_policy_rows')
+    list_policy_tables = _read('list_policy_tables')
+    list_policy_status = _read('list_policy_status')
+    show_policy_table = _read('show_policy_table')
+    list_library_policy = _read('list_library_policy')
+    show_library_policy = _read('show_library_policy')
+    list_datasources = _read('list_datasources')
+    get_datasource_id = _read('get_datasource_id')
+    get_datasource_name = _read('get_datasource_name')
+    list_datasource_tables = _read('list_datasource_tables')
+    list_datasource_rows = _read('list_datasource_rows')
+    list_datasource_status = _read('list_datasource_status')
+    show_datasource_schema = _read('show_datasource_schema')
+    show_datasource_table_schema = _read('show_datasource_table_schema')
+    get_datasource_table_schema = _read('get_datasource_table_schema')
+    show_datasource_table = _read('show_datasource_table')
+    list_drivers = _read('list_drivers')
+    show_driver = _read('show_driver')
+
+    create_policy = _write('create_policy')
+    delete_policy = _write('delete_policy')
+    create_library_policy = _write('create_library_policy')
+    delete_library_policy = _write('delete_library_policy')
+    create_policy_rule = _write('create_policy_rule')
+    delete_policy_rule = _write('delete_policy_rule')
+    create_policy_rules_bulk = _write('create_policy_rules_bulk')
+    delete_policy_rules_bulk = _write('delete_policy_rules_bulk')
+    execute_policy_action = _write('execute_policy_action')
+    create_datasource = _write('create_datasource')
+    delete_datasource = _write('delete_datasource')
+    update_datasource_row = _write('update_datasource_row')
+    send_datasource_webhook = _write('send_datasource_webhook')
+    execute_datasource_action = _write('execute_datasource_action')
+    request_refresh = _write('request_refresh')
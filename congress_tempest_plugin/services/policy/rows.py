@@ -0,0 +1,180 @@
+# Copyright 2026 OpenStack Foundation
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Compact in-memory form of the rows of a Congress table.
+
+The API returns every row as a {'data': [...]} dict.  A RowSet keeps each
+row as a tuple with interned strings inside a slotted Row, and shares one
+column index between all the rows, so large tables take a fraction of the
+memory and compare as sets of tuples.
+"""
+
+import sys
+
+
+class Row(object):
+    """One table row, hashable and compared by its values.
+
+    row['data'] returns the values tuple like the API dict does; values are
+    looked up by column name with row.value(name) when the table schema is
+    known.
+    """
+
+    __slots__ = ('data', '_index')
+
+    def __init__(self, data, index=None):
+        self.data = data
+        self._index = index
+
+    def __getitem__(self, key):
+        if key == 'data':
+            return self.data
+        raise KeyError(key)
+
+    def __contains__(self, key):
+        return key == 'data'
+
+    def get(self, key, default=None):
+        return self.data if key == 'data' else default
+
+    def items(self):
+        # lets jsonutils serialize the row back into its API form
+        return [('data', list(self.data))]
+
+    def value(self, name):
+        """Return the value of the named column."""
+        if self._index is None:
+            raise KeyError('no schema known for column %s' % name)
+        return self.data[self._index[name]]
+
+    def __eq__(self, other):
+        if isinstance(other, Row):
+            return self.data == other.data
+        return NotImplemented
+
+    def __ne__(self, other):
+        if isinstance(other, Row):
+            return self.data != other.data
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(self.data)
+
+    def __repr__(self):
+        return 'Row(%r)' % (self.data,)
+
+
+def _intern(value):
+    return sys.intern(value) if type(value) is str else value
+
+
+class RowSet(object):
+    """The rows of a table, in API order, with set operations on values.
+
+    :param rows: API rows ({'data': [...]}), Row objects or value sequences
+    :param columns: the table columns (TableSchema or list of column specs),
+        None when they are unknown as for policy tables
+    """
+
+    __slots__ = ('rows', 'columns', 'index', '_values', '_normalized')
+
+    def __init__(self, rows, columns=None):
+        self.columns = (tuple(c['name'] for c in columns)
+                        if columns is not None else None)
+        self.index = (dict((name, i) for i, name in enumerate(self.columns))
+                      if self.columns is not None else None)
+        memo = {}
+        compact = []
+        for row in rows:
+            if isinstance(row, Row):
+                data = row.data
+            elif isinstance(row, dict):
+                data = row['data']
+            else:
+                data = row
+            data = tuple(_intern(v) for v in data)
+            # equal rows share one tuple; 1, 1.0 and True are equal but
+            # are different values
+            data = memo.setdefault((data, tuple(map(type, data))), data)
+            compact.append(Row(data, self.index))
+        self.rows = compact
+        self._values = None
+        self._normalized = None
+
+    def __len__(self):
+        return len(self.rows)
+
+    def __iter__(self):
+        return iter(self.rows)
+
+    def __getitem__(self, i):
+        return self.rows[i]
+
+    def __contains__(self, row):
+        if isinstance(row, Row):
+            row = row.data
+        elif isinstance(row, dict):
+            row = row['data']
+        return tuple(row) in self.values()
+
+    def __repr__(self):
+        return 'RowSet(%d rows, columns=%r)' % (len(self.rows), self.columns)
+
+    def values(self):
+        """Return the frozenset of the row value tuples."""
+        if self._values is None:
+            self._values = frozenset(row.data for row in self.rows)
+        return self._values
+
+    def normalized(self):
+        """Return the frozenset of the rows with every value as a str."""
+        if self._normalized is None:
+            # from the rows rather than values(), where 1 and True merge
+            self._normalized = frozenset(
+                tuple(str(v) for v in row.data) for row in self.rows)
+        return self._normalized
+
+    def difference(self, other):
+        """Return the value tuples of this set absent from other."""
+        if isinstance(other, RowSet):
+            other = other.values()
+        return self.values().difference(other)
+
+    __sub__ = difference
+
+    def position(self, name):
+        """Return the position of the named column in the rows."""
+        if self.index is None:
+            raise KeyError('no schema known for column %s' % name)
+        return self.index[name]
+
+    def column(self, name):
+        """Return the values of the named column, one per row."""
+        i = self.position(name)
+        return [row.data[i] for row in self.rows]
+
+    def by(self, name):
+        """Return a dict mapping the values of a column to their row."""
+        i = self.position(name)
+        return dict((row.data[i], row) for row in self.rows)
+
+
+def compact_body(body, columns=None):
+    """Return a row listing body with its 'results' as a RowSet."""
+    if not body or 'results' not in body:
+        return body
+    compact = dict(body)
+    compact['results'] = RowSet(body['results'], columns)
+    return compact
@@ -0,0 +1,117 @@
+# Copyright 2026 OpenStack Foundation
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Incremental decoding of the JSON array held by a key of a response.
+
+Only the array elements are decoded and yielded one at a time; the text
+buffer never holds much more than one element and one network chunk, so
+memory use does not grow with the size of the array.
+"""
+
+import codecs
+import json
+
+_WHITESPACE = ' \t\n\r'
+# drop consumed text once this many characters have been decoded
+_COMPACT_AT = 1 << 16
+
+
+class _Reader(object):
+    """Text buffer over an iterator of byte chunks."""
+
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+        self._decoder = codecs.getincrementaldecoder('utf-8')()
+        self._decode = json.JSONDecoder().raw_decode
+        self.buf = ''
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self):
+        if self.eof:
+            return False
+        if self.pos >= _COMPACT_AT:
+            self.buf = self.buf[self.pos:]
+            self.pos = 0
+        for chunk in self._chunks:
+            text = self._decoder.decode(chunk)
+            if text:
+                self.buf += text
+                return True
+        self.buf += self._decoder.decode(b'', final=True)
+        self.eof = True
+        return False
+
+    def peek(self):
+        """Return the next non-blank character, '' at the end of input."""
+        while True:
+            buf = self.buf
+            while self.pos < len(buf) and buf[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(buf):
+                return buf[self.pos]
+            if not self._fill():
+                return ''
+
+    def expect(self, chars):
+        char = self.peek()
+        if not char or char not in chars:
+            raise ValueError('Expected one of %r at offset %d, got %r'
+                             % (chars, self.pos, char))
+        self.pos += 1
+        return char
+
+    def value(self):
+        """Decode the next complete JSON value."""
+        self.peek()
+        while True:
+            try:
+                value, end = self._decode(self.buf, self.pos)
+            except ValueError:
+                if not self._fill():
+                    raise
+                continue
+            # a value ending the buffer may be a truncated number
+            if end < len(self.buf) or not self._fill():
+                self.pos = end
+                return value
+
+
+def iter_json_array(chunks, key='results'):
+    """Yield the elements of the array stored under key in a JSON object.
+
+    :param chunks: iterable of the bytes of the response body
+    :param key: top-level key of the array; other keys are skipped
+    """
+    reader = _Reader(chunks)
+    reader.expect('{')
+    if reader.peek() == '}':
+        return
+    while True:
+        name = reader.value()
+        reader.expect(':')
+        if name == key and reader.peek() == '[':
+            reader.expect('[')
+            if reader.peek() == ']':
+                reader.pos += 1
+            else:
+                while True:
+                    yield reader.value()
+                    if reader.expect(',]') == ']':
+                        break
+        else:
+            reader.value()
+        if reader.expect(',}') == '}':
+            return
@@ -0,0 +1,315 @@
+# Copyright 2026 OpenStack Foundation
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Parse and profile the evaluation traces of Congress policy queries.
+
+The top-down evaluator traces one event per line, indented with one '| '
+per level of recursion and optionally prefixed by the abbreviated policy
+name::
+
+    Clas  : Call: error(x)
+    Clas  : | Call: nova:servers(x, y)
+    Clas  : | Exit: nova:servers("a", "b")
+    Clas  : Exit: error("a")
+
+parse() turns it into a tree of calls, with the answers (Exit), failures
+(Fail) and re-entries (Redo) of each.  Calls of a negated literal such as
+'not p(x)' are kept apart from the calls of p, and profiled as 'not p'.
+Congress does not timestamp trace lines; lines starting with a '[seconds]'
+timestamp are accepted so that durations can be derived from instrumented
+traces.
+"""
+
+import re
+
+_LINE = re.compile(
+    r'^(?:\[(?P<time>\d+(?:\.\d*)?)\]\s*)?'
+    r'(?:(?P<policy>[^|:\s][^|:]*?)\s*:\s)?'
+    r'(?P<indent>(?:\|\s?)*)'
+    r'(?P<event>Call|Exit|Fail|Redo):\s*'
+    r'(?P<literal>.*)$')
+_TABLE = re.compile(r'^\s*(?P<not>not\s+)?(?P<table>[\w:.\-]+)')
+_RULE_HEAD = re.compile(r'^\s*(?:execute\[)?(?P<table>[\w:.\-]+)\s*\(')
+
+
+class TraceNode(object):
+    """One call of a table during the evaluation, with its sub-calls."""
+
+    __slots__ = ('table', 'negated', 'literal', 'depth', 'parent',
+                 'children', 'exits', 'fails', 'redos', 'start', 'end')
+
+    def __init__(self, table, literal, depth, parent=None, start=None,
+                 negated=False):
+        self.table = table
+        self.negated = negated
+        self.literal = literal
+        self.depth = depth
+        self.parent = parent
+        self.children = []
+        self.exits = 0
+        self.fails = 0
+        self.redos = 0
+        self.start = start
+        self.end = start
+
+    @property
+    def name(self):
+        """The table, prefixed with 'not ' for a negated literal."""
+        return _table_name(self.table, self.negated)
+
+    @property
+    def duration(self):
+        if self.start is None or self.end is None:
+            return None
+        return self.end - self.start
+
+    def walk(self):
+        """Yield this node and all its descendants, depth first."""
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(reversed(node.children))
+
+    def __repr__(self):
+        return 'TraceNode(%s, depth=%d, exits=%d, fails=%d)' % (
+            self.literal, self.depth, self.exits, self.fails)
+
+
+def _table_name(table, negated=False):
+    return 'not %s' % table if negated else table
+
+
+class TableProfile(object):
+    """Aggregated trace events of one table, or of its negation."""
+
+    def __init__(self, table, negated=False):
+        self.table = table
+        self.negated = negated
+        self.calls = 0
+        self.exits = 0
+        self.fails = 0
+        self.redos = 0
+        self.subcalls = 0
+        self.max_fanout = 0
+        self.min_depth = None
+        self.max_depth = 0
+        self.time = None
+
+    def add(self, node):
+        self.calls += 1
+        self.exits += node.exits
+        self.fails += node.fails
+        self.redos += node.redos
+        self.subcalls += len(node.children)
+        self.max_fanout = max(self.max_fanout, len(node.children))
+        self.min_depth = (node.depth if self.min_depth is None
+                          else min(self.min_depth, node.depth))
+        self.max_depth = max(self.max_depth, node.depth)
+        duration = node.duration
+        if duration is not None:
+            self.time = (self.time or 0.0) + duration
+
+    @property
+    def name(self):
+        return _table_name(self.table, self.negated)
+
+    @property
+    def mean_fanout(self):
+        return float(self.subcalls) / self.calls if self.calls else 0.0
+
+    def summary(self):
+        return {'table': self.table,
+                'negated': self.negated,
+                'calls': self.calls,
+                'exits': self.exits,
+                'fails': self.fails,
+                'redos': self.redos,
+                'mean_fanout': self.mean_fanout,
+                'max_fanout': self.max_fanout,
+                'min_depth': self.min_depth,
+                'max_depth': self.max_depth,
+                'time': self.time}
+
+
+class PolicyTrace(object):
+    """Call tree of a traced query, and per-table profiles of it."""
+
+    def __init__(self, roots, unparsed=0):
+        self.roots = roots
+        self.unparsed = unparsed
+
+    def nodes(self):
+        for root in self.roots:
+            for node in root.walk():
+                yield node
+
+    def profile(self):
+        """Return a dict mapping each traced table to its TableProfile.
+
+        Negated calls of a table p are profiled separately, as 'not p'.
+        """
+        profiles = {}
+        for node in self.nodes():
+            profile = profiles.get(node.name)
+            if profile is None:
+                profile = profiles[node.name] = TableProfile(node.table,
+                                                             node.negated)
+            profile.add(node)
+        return profiles
+
+    def max_depth(self):
+        return max([node.depth for node in self.nodes()] or [0])
+
+    def hot_tables(self, limit=10):
+        """Return the profiles of the costliest tables, costliest first.
+
+        Tables are ranked by evaluation time when the trace is timed, and
+        by the number of calls and answers otherwise.
+        """
+        return sorted(self.profile().values(), key=_cost,
+                      reverse=True)[:limit]
+
+
+def _cost(profile):
+    return (profile.time or 0.0, profile.calls + profile.exits,
+            profile.fails)
+
+
+def parse(text):
+    """Build the PolicyTrace of the trace text of a policy query."""
+    roots = []
+    # open calls, by depth
+    stack = []
+    unparsed = 0
+    for line in (text or '').splitlines():
+        match = _LINE.match(line.strip())
+        if match is None:
+            if line.strip():
+                unparsed += 1
+            continue
+        depth = match.group('indent').count('|')
+        literal = match.group('literal').strip()
+        table = _TABLE.match(literal)
+        negated = bool(table and table.group('not'))
+        table = table.group('table') if table else literal
+        when = match.group('time')
+        when = float(when) if when is not None else None
+        event = match.group('event')
+
+        if event == 'Call':
+            del stack[depth:]
+            parent = stack[-1] if stack else None
+            node = TraceNode(table, literal, depth, parent, when,
+                             negated)
+            (parent.children if parent else roots).append(node)
+            # keep the stack aligned with depths even when levels are
+            # skipped, so that later events find their call
+            while len(stack) < depth:
+                stack.append(parent)
+            stack.append(node)
+            continue
+
+        node = _open_call(roots, stack, depth, _table_name(table, negated))
+        if node is None:
+            unparsed += 1
+            continue
+        if when is not None:
+            node.end = when
+        # the events of a call may follow those of its later siblings
+        # when the evaluator backtracks into it
+        del stack[depth:]
+        if event == 'Exit':
+            node.exits += 1
+            stack.append(node)
+        elif event == 'Fail':
+            node.fails += 1
+        else:
+            node.redos += 1
+            stack.append(node)
+    return PolicyTrace(roots, unparsed)
+
+
+def _open_call(roots, stack, depth, name):
+    """Return the latest call of name at depth under the current parent."""
+    if depth < len(stack) and stack[depth] is not None and (
+            stack[depth].name == name):
+        return stack[depth]
+    if depth == 0:
+        siblings = roots
+    elif depth <= len(stack) and stack[depth - 1] is not None:
+        siblings = stack[depth - 1].children
+    else:
+        return None
+    for node in reversed(siblings):
+        if node.name == name:
+            return node
+    return None
+
+
+def rule_head_table(rule):
+    """Return the table defined by the text of a Datalog rule."""
+    match = _RULE_HEAD.match(rule)
+    return match.group('table') if match else None
+
+
+def hot_rules(policy_trace, rules, policy_name=None, limit=10):
+    """Rank rules by the cost of evaluating the table they define.
+
+    :param policy_trace: the PolicyTrace of one or more queries
+    :param rules: the rules of the policy, as listed by the API
+    :param policy_name: name of the policy, so that tables qualified with
+        it in the trace match its rules
+    :returns: a list of dicts holding the profile summary of a table and
+        the ids and texts of the rules defining it, costliest first.  The
+        negated calls of a table get an entry of their own, with negated
+        set.
+    """
+    by_table = {}
+    for rule in rules:
+        table = rule_head_table(rule.get('rule', ''))
+        if table is not None:
+            by_table.setdefault(table, []).append(rule)
+    prefix = '%s:' % policy_name if policy_name else None
+    profiles = {}
+    for profile in policy_trace.profile().values():
+        table = profile.table
+        if prefix and table.startswith(prefix):
+            table = table[len(prefix):]
+        if table not in by_table:
+            continue
+        key = (table, profile.negated)
+        merged = profiles.get(key)
+        if merged is None:
+            profiles[key] = profile
+        else:
+            for attr in ('calls', 'exits', 'fails', 'redos', 'subcalls'):
+                setattr(merged, attr,
+                        getattr(merged, attr) + getattr(profile, attr))
+            merged.max_fanout = max(merged.max_fanout, profile.max_fanout)
+            merged.max_depth = max(merged.max_depth, profile.max_depth)
+            merged.min_depth = min(merged.min_depth, profile.min_depth)
+            if profile.time is not None:
+                merged.time = (merged.time or 0.0) + profile.time
+    report = []
+    for (table, _), profile in sorted(profiles.items(),
+                                      key=lambda item: _cost(item[1]),
+                                      reverse=True)[:limit]:
+        entry = profile.summary()
+        entry['table'] = table
+        entry['rules'] = [{'id': r.get('id'), 'rule': r.get('rule')}
+                          for r in by_table[table]]
+        report.append(entry)
+    return report
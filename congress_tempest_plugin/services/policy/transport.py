@@ -0,0 +1,223 @@
+# Copyright 2026 OpenStack Foundation
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import collections
+import threading
+import time
+
+import urllib3
+
+
+class _Response(dict):
+    """Response headers in the format returned by tempest's ClosingHttp."""
+
+    def __init__(self, info, url):
+        for key, value in info.headers.items():
+            self[str(key).lower()] = value
+        self.status = info.status
+        self['status'] = str(self.status)
+        self.reason = info.reason
+        self.version = info.version
+        self['content-location'] = url
+
+
+class PooledHttp(urllib3.poolmanager.PoolManager):
+    """Keep-alive replacement for tempest's ClosingHttp.
+
+    ClosingHttp sends 'connection: close' and drops its pools after every
+    request, so each call pays for a new TCP (and TLS) handshake.  This
+    transport keeps up to pool_size connections open per endpoint and reuses
+    them across requests and threads.
+    """
+
+    def __init__(self, disable_ssl_certificate_validation=False,
+                 ca_certs=None, timeout=None, follow_redirects=True,
+                 pool_size=10):
+        self.follow_redirects = follow_redirects
+        kwargs = {'maxsize': pool_size}
+
+        if disable_ssl_certificate_validation:
+            urllib3.disable_warnings()
+            kwargs['cert_reqs'] = 'CERT_NONE'
+        elif ca_certs:
+            kwargs['cert_reqs'] = 'CERT_REQUIRED'
+            kwargs['ca_certs'] = ca_certs
+
+        if timeout:
+            kwargs['timeout'] = timeout
+
+        super(PooledHttp, self).__init__(**kwargs)
+
+    def request(self, url, method, *args, **kwargs):
+        if self.follow_redirects:
+            retry = urllib3.util.Retry(raise_on_redirect=False, redirect=5)
+        else:
+            retry = urllib3.util.Retry(redirect=False)
+        r = super(PooledHttp, self).request(method, url, retries=retry,
+                                            *args, **kwargs)
+
+        if not kwargs.get('preload_content', True):
+            return r, b''
+        return _Response(r, url), r.data
+
+    def connections_opened(self):
+        """Number of connections opened by the pools still alive."""
+        total = 0
+        for key in list(self.pools.keys()):
+            pool = self.pools.get(key)
+            if pool is not None:
+                total += pool.num_connections
+        return total
+
+
+class CachedResponse(object):
+    __slots__ = ('etag', 'digest', 'body')
+
+    def __init__(self, etag, digest, body):
+        self.etag = etag
+        self.digest = digest
+        self.body = body
+
+
+class ResponseCache(object):
+    """Bounded LRU of the last decoded response body per URL.
+
+    Entries keep the ETag and a digest of the raw body the decoded body came
+    from, so an unchanged response can be recognized without decoding it.
+    A size of 0 disables the cache.
+    """
+
+    def __init__(self, size=32):
+        self.size = size
+        self._lock = threading.Lock()
+        self._entries = collections.OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.not_modified = 0
+
+    def get(self, url):
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is not None:
+                self._entries.move_to_end(url)
+            return entry
+
+    def store(self, url, entry):
+        with self._lock:
+            self._entries[url] = entry
+            self._entries.move_to_end(url)
+            while len(self._entries) > self.size:
+                self._entries.popitem(last=False)
+
+    def record(self, hit, not_modified=False):
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+            if not_modified:
+                self.not_modified += 1
+
+    def summary(self):
+        with self._lock:
+            return {'hits': self.hits,
+                    'misses': self.misses,
+                    'not_modified': self.not_modified,
+                    'entries': len(self._entries)}
+
+
+class CircuitBreaker(object):
+    """Connection failure circuit breaker of one API endpoint.
+
+    After threshold consecutive connection failures the circuit opens and
+    requests are refused for reset_timeout seconds.  A single request is
+    then let through: the circuit closes if it reaches the server, and
+    opens again otherwise.
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half-open'
+
+    def __init__(self, endpoint, threshold=3, reset_timeout=5.0):
+        self.endpoint = endpoint
+        self.threshold = threshold
+        self.reset_timeout = reset_timeout
+        self._lock = threading.Lock()
+        self.failures = 0
+        self.opened_at = None
+        self._probing = False
+
+    @property
+    def state(self):
+        with self._lock:
+            if self.opened_at is None:
+                return self.CLOSED
+            if self._probing or (time.time() - self.opened_at >=
+                                 self.reset_timeout):
+                return self.HALF_OPEN
+            return self.OPEN
+
+    def allow(self):
+        """Return 0 if a request may be sent, else seconds to wait."""
+        with self._lock:
+            if self.opened_at is None:
+                return 0
+            remaining = self.opened_at + self.reset_timeout - time.time()
+            if remaining > 0:
+                return remaining
+            if self._probing:
+                # another request is probing the endpoint
+                return self.reset_timeout
+            self._probing = True
+            return 0
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self._probing = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            self._probing = False
+            if self.failures >= self.threshold:
+                self.opened_at = time.time()
+
+
+class CircuitBreakers(object):
+    """Process-wide circuit breakers, one per endpoint."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._breakers = {}
+
+    def get(self, endpoint, threshold, reset_timeout):
+        with self._lock:
+            breaker = self._breakers.get(endpoint)
+            if breaker is None:
+                breaker = self._breakers[endpoint] = CircuitBreaker(
+                    endpoint, threshold, reset_timeout)
+            return breaker
+
+    def states(self):
+        with self._lock:
+            breakers = dict(self._breakers)
+        return dict((endpoint, breaker.state)
+                    for endpoint, breaker in breakers.items())
+
+
+CIRCUIT_BREAKERS = CircuitBreakers()
@@ -0,0 +1,119 @@
+# Copyright 2026 OpenStack Foundation
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import json
+import os
+import random
+import string
+import time
+
+from oslo_log import log as logging
+from tempest import config
+from tempest.lib.common.utils import test_utils
+from tempest.lib import exceptions
+from testtools import content
+
+from congress_tempest_plugin.services.policy import policy_client
+from congress_tempest_plugin.tests.scenario import helper
+from congress_tempest_plugin.tests.scenario import manager_congress
+
+CONF = config.CONF
+LOG = logging.getLogger(__name__)
+
+
+class BenchmarkTestBase(manager_congress.ScenarioPolicyBase):
+    """Base class of the Congress benchmarks.
+
+    Benchmarks only run when [congress_benchmark] enabled is set.  Each
+    one adds its measurements with record() and they are written as one
+    JSON document per benchmark class to [congress_benchmark]
+    results_dir, and attached to the test results.
+    """
+
+    # name of the results file, without extension
+    benchmark_name = None
+
+    @classmethod
+    def skip_checks(cls):
+        super(BenchmarkTestBase, cls).skip_checks()
+        if not CONF.congress_benchmark.enabled:
+            raise cls.skipException(
+                'Congress benchmarks are disabled, set '
+                '[congress_benchmark] enabled to run them')
+
+    @classmethod
+    def resource_setup(cls):
+        super(BenchmarkTestBase, cls).resource_setup()
+        cls.results = []
+
+    @classmethod
+    def resource_cleanup(cls):
+        if cls.results:
+            cls.write_results()
+        super(BenchmarkTestBase, cls).resource_cleanup()
+
+    @classmethod
+    def write_results(cls):
+        name = cls.benchmark_name or cls.__name__
+        path = os.path.join(CONF.congress_benchmark.results_dir,
+                            '%s.json' % name)
+        document = {
+            'benchmark': name,
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+            'congress_endpoint':
+                cls.os_admin.congress_client.endpoint_override or
+                cls.os_admin.congress_client.base_url,
+            'results': cls.results,
+        }
+        with open(path, 'w') as f:
+            json.dump(document, f, indent=2, sort_keys=True)
+        LOG.info('Benchmark results written to %s', path)
+
+    def record(self, **result):
+        """Add one measurement to the results of the benchmark."""
+        result.setdefault('test', self.id())
+        self.results.append(result)
+        self.addDetail('benchmark-result-%d' % len(self.results),
+                       content.json_content(result))
+        LOG.info('Benchmark result: %s', result)
+        return result
+
+    def _create_datasource(self, driver):
+        """Create a datasource of driver and wait for its service."""
+        client = self.os_admin.congress_client
+        # the name is used as a table prefix in rules, so it must be a
+        # Datalog identifier: no '-' as in data_utils.rand_name
+        name = '%s_bench_%s' % (driver, ''.join(
+            random.choice(string.ascii_lowercase) for x in range(10)))
+        datasource = client.create_datasource({
+            'name': name,
+            'driver': driver,
+            'config': None})
+        self.addCleanup(client.delete_datasource, datasource['id'])
+
+        @helper.retry_on_exception
+        def _check_service():
+            client.list_datasource_status(datasource['id'])
+            return True
+
+        if not test_utils.call_until_true(func=_check_service,
+                                          duration=60, sleep_for=1):
+            raise exceptions.TimeoutException(
+                "%s data source service is not up" % driver)
+        return datasource
+
+    def run_concurrently(self, func, items):
+        return policy_client.run_concurrently(
+            func, items, max_workers=CONF.congress_benchmark.concurrency)
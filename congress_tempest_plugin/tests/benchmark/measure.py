@@ -0,0 +1,98 @@
+# Copyright 2026 OpenStack Foundation
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Timing helpers of the benchmarks.
+
+They only depend on the standard library, so that they can be used (and
+unit tested) without a Congress deployment.
+"""
+
+from concurrent import futures
+import time
+
+
+def percentiles(samples, points=(50, 95, 99)):
+    """Return the nearest-rank percentiles of samples, as 'pNN' keys."""
+    ordered = sorted(samples)
+    result = {}
+    for point in points:
+        if not ordered:
+            result['p%s' % point] = None
+            continue
+        rank = max(1, int(round(point / 100.0 * len(ordered))))
+        result['p%s' % point] = ordered[min(rank, len(ordered)) - 1]
+    return result
+
+
+def latency_summary(samples):
+    """Summarize latencies in seconds: count, mean, max and percentiles."""
+    summary = {'count': len(samples),
+               'mean': sum(samples) / len(samples) if samples else None,
+               'max': max(samples) if samples else None}
+    summary.update(percentiles(samples))
+    return summary
+
+
+def timed(func):
+    """Wrap func to return (result, seconds taken) instead of result."""
+    def call(*args, **kwargs):
+        start = time.time()
+        result = func(*args, **kwargs)
+        return result, time.time() - start
+    return call
+
+
+def wait_until(check, timeout, interval=0.1):
+    """Poll check until it returns true; return the seconds it took.
+
+    Returns None if check still fails after timeout seconds.
+    """
+    start = time.time()
+    while True:
+        if check():
+            return time.time() - start
+        if time.time() - start >= timeout:
+            return None
+        time.sleep(interval)
+
+
+def replay(func, items, rate=None, concurrency=8):
+    """Call func on every item, in order, at a controlled pace.
+
+    Calls start at most rate per second (as fast as possible if rate is
+    not set), with up to concurrency calls in flight.  Returns the
+    latencies of the calls that succeeded, the exceptions of those that
+    failed and the total time taken.
+    """
+    items = list(items)
+    start = time.time()
+
+    def call(i):
+        if rate:
+            delay = start + i / float(rate) - time.time()
+            if delay > 0:
+                time.sleep(delay)
+        sent = time.time()
+        try:
+            func(items[i])
+        except Exception as e:
+            return None, e
+        return time.time() - sent, None
+
+    with futures.ThreadPoolExecutor(max_workers=concurrency) as executor:
+        outcomes = list(executor.map(call, range(len(items))))
+    return ([latency for latency, error in outcomes if error is None],
+            [error for _, error in outcomes if error is not None],
+            time.time() - start)
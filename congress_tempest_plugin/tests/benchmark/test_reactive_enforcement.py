@@ -0,0 +1,185 @@
+# Copyright 2026 OpenStack Foundation
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import threading
+import time
+
+from tempest.common import utils
+from tempest import config
+from tempest.lib.common.utils import data_utils
+from tempest.lib import decorators
+from tempest.lib import exceptions
+import testtools
+
+from congress_tempest_plugin.tests.benchmark import base
+from congress_tempest_plugin.tests.benchmark import measure
+
+CONF = config.CONF
+
+
+class TestReactiveEnforcementBenchmark(base.BenchmarkTestBase):
+    """Trigger-to-action latency of reactive enforcement.
+
+    A server is booted as the stand-in target of the actions.  For each
+    of [congress_benchmark] enforcement_rates, enforcement_changes events
+    are pushed at that rate to a new doctor datasource, each for its own
+    host, and a policy executes nova:servers_set_meta for every host,
+    setting a metadata item named after it on the server.
+
+    The benchmark polls the policy table derived from the events and the
+    server metadata to timestamp when each change is evaluated and its
+    action executed.  Every item seen is deleted; one showing up again
+    is counted as a duplicated action, and one never showing up within
+    [congress_benchmark] enforcement_settle seconds of the last change as
+    a dropped one.
+    """
+
+    benchmark_name = 'reactive_enforcement'
+
+    @staticmethod
+    def _event(host):
+        return {'time': '2016-02-22T11:48:55Z',
+                'type': 'compute.host.down',
+                'details': {'hostname': host,
+                            'status': 'down',
+                            'monitor': 'zabbix1',
+                            'monitor_event_id': host}}
+
+    def _poll(self, server_id, policy_name, hosts, evaluated, executed,
+              deleted):
+        """Timestamp newly evaluated changes and executed actions.
+
+        Returns the number of actions executed again since last poll.
+        """
+        client = self.os_admin.congress_client
+        servers_client = self.os_admin.servers_client
+        now = time.time()
+        for row in client.iter_policy_rows(policy_name, 'triggered'):
+            evaluated.setdefault(row['data'][0], now)
+        metadata = servers_client.list_server_metadata(server_id)['metadata']
+        now = time.time()
+        duplicates = 0
+        for key in metadata:
+            if key not in hosts:
+                continue
+            if key in deleted:
+                duplicates += 1
+            else:
+                executed[key] = now
+            try:
+                servers_client.delete_server_metadata_item(server_id, key)
+            except exceptions.NotFound:
+                pass
+            deleted.add(key)
+        return duplicates
+
+    def _enforce(self, server_id, rate):
+        client = self.os_admin.congress_client
+        changes = CONF.congress_benchmark.enforcement_changes
+        interval = CONF.congress_benchmark.enforcement_poll_interval
+        datasource = self._create_datasource('doctor')
+        policy_name = self._create_random_policy('bench')
+        events = ('%s:events(time, type, host, "down", monitor, id)' %
+                  datasource['name'])
+        client.create_policy_rules_bulk(policy_name, [
+            'triggered(host) :- %s' % events,
+            'execute[nova:servers_set_meta("%s", host, "enforced")] :- %s'
+            % (server_id, events)])
+        prefix = data_utils.rand_name('bench')
+        hosts = ['%s-%d' % (prefix, i) for i in range(changes)]
+        host_set = set(hosts)
+
+        # events are pushed one by one, each push holding every event so
+        # far so that no derived row is ever retracted
+        pushed = []
+        triggered = {}
+        stop = threading.Event()
+
+        def _push(host):
+            if stop.is_set():
+                raise exceptions.TimeoutException('Benchmark timed out')
+            pushed.append(self._event(host))
+            triggered[host] = time.time()
+            client.update_datasource_row(datasource['id'], 'events',
+                                         list(pushed))
+
+        outcome = []
+        sender = threading.Thread(target=lambda: outcome.append(
+            measure.replay(_push, hosts, rate=rate, concurrency=1)))
+        sender.start()
+
+        evaluated = {}
+        executed = {}
+        deleted = set()
+        duplicates = 0
+        timeout = CONF.congress_benchmark.timeout
+        sending_deadline = time.time() + timeout
+        deadline = None
+        try:
+            while True:
+                duplicates += self._poll(server_id, policy_name, host_set,
+                                         evaluated, executed, deleted)
+                now = time.time()
+                if not outcome:
+                    if now >= sending_deadline:
+                        raise exceptions.TimeoutException(
+                            'Changes were still being pushed after %ds' %
+                            timeout)
+                    time.sleep(interval)
+                    continue
+                if deadline is None:
+                    deadline = now + CONF.congress_benchmark.enforcement_settle
+                # once every action ran, keep polling a little to catch late
+                # duplicates
+                if (len(executed) == changes and
+                        now - max(executed.values()) >= 5 * interval or
+                        now >= deadline):
+                    break
+                time.sleep(interval)
+        finally:
+            stop.set()
+            sender.join()
+        _, errors, seconds = outcome[0]
+
+        def _latencies(start, end):
+            return measure.latency_summary([end[host] - start[host]
+                                            for host in hosts
+                                            if host in start and host in end])
+
+        self.record(rate=rate or None, changes=changes,
+                    push_errors=len(errors),
+                    push_seconds=seconds,
+                    changes_per_second=changes / seconds,
+                    poll_interval=interval,
+                    evaluated=len(evaluated),
+                    executed=len(executed),
+                    dropped=changes - len(executed),
+                    duplicated=duplicates,
+                    trigger_to_evaluation=_latencies(triggered, evaluated),
+                    evaluation_to_action=_latencies(evaluated, executed),
+                    trigger_to_action=_latencies(triggered, executed))
+
+    @decorators.attr(type='benchmark')
+    @utils.services('compute')
+    @testtools.skipUnless(CONF.congress_feature_enabled.nova_driver,
+                          'Test involving Nova driver skipped for queens.')
+    def test_reactive_enforcement_latency(self):
+        server = self.create_server(
+            name=data_utils.rand_name('enforcement_target'),
+            image_id=CONF.compute.image_ref,
+            flavor=CONF.compute.flavor_ref,
+            wait_until='ACTIVE')
+        for rate in CONF.congress_benchmark.enforcement_rates:
+            self._enforce(server['id'], rate)
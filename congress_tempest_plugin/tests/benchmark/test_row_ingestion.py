@@ -0,0 +1,95 @@
+# Copyright 2026 OpenStack Foundation
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import time
+
+from tempest import config
+from tempest.lib import decorators
+from tempest.lib import exceptions
+
+from congress_tempest_plugin.tests.benchmark import base
+from congress_tempest_plugin.tests.benchmark import measure
+
+CONF = config.CONF
+
+
+class TestRowIngestionBenchmark(base.BenchmarkTestBase):
+    """Ingestion-to-evaluation throughput of a push datasource.
+
+    For each of [congress_benchmark] ingestion_row_counts, that many
+    synthetic events are pushed at once to a new doctor datasource, and
+    the time until they are all listed by the datasource, then until a
+    policy table derived from them has all its rows, is measured.
+    """
+
+    benchmark_name = 'row_ingestion'
+
+    @staticmethod
+    def _events(count):
+        # every other host is down
+        return [{'time': '2016-02-22T11:48:55Z',
+                 'type': 'compute.host.down',
+                 'details': {'hostname': 'compute%d' % i,
+                             'status': 'down' if i % 2 else 'up',
+                             'monitor': 'zabbix1',
+                             'monitor_event_id': str(i)}}
+                for i in range(count)]
+
+    def _wait_for_count(self, rows_iter, count, start):
+        """Return seconds from start until rows_iter() yields count rows."""
+        timeout = CONF.congress_benchmark.timeout
+
+        def _complete():
+            try:
+                return sum(1 for _ in rows_iter()) == count
+            except exceptions.NotFound:
+                return False
+
+        if measure.wait_until(_complete, timeout,
+                              interval=0.5) is None:
+            raise exceptions.TimeoutException(
+                '%d rows did not show up in %ds' % (count, timeout))
+        return time.time() - start
+
+    def _ingest(self, count):
+        client = self.os_admin.congress_client
+        datasource = self._create_datasource('doctor')
+        policy_name = self._create_random_policy('bench')
+        client.create_policy_rule(policy_name, {
+            'rule': 'down_host(host, event) :- %s:events(time, type, host, '
+                    '"down", monitor, event)' % datasource['name']})
+        events = self._events(count)
+        down = sum(1 for e in events if e['details']['status'] == 'down')
+
+        start = time.time()
+        client.update_datasource_row(datasource['id'], 'events', events)
+        pushed = time.time() - start
+        visible = self._wait_for_count(
+            lambda: client.iter_datasource_rows(datasource['id'], 'events'),
+            count, start)
+        evaluated = self._wait_for_count(
+            lambda: client.iter_policy_rows(policy_name, 'down_host'),
+            down, start)
+        self.record(rows=count, derived_rows=down,
+                    push_seconds=pushed,
+                    visible_seconds=visible,
+                    evaluated_seconds=evaluated,
+                    ingested_rows_per_second=count / visible,
+                    evaluated_rows_per_second=count / evaluated)
+
+    @decorators.attr(type='benchmark')
+    def test_doctor_row_ingestion(self):
+        for count in CONF.congress_benchmark.ingestion_row_counts:
+            self._ingest(count)
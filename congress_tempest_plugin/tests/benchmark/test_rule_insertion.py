@@ -0,0 +1,91 @@
+# Copyright 2026 OpenStack Foundation
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import random
+import string
+import time
+
+from tempest import config
+from tempest.lib import decorators
+
+from congress_tempest_plugin.tests.benchmark import base
+from congress_tempest_plugin.tests.benchmark import measure
+
+CONF = config.CONF
+
+
+class TestRuleInsertionBenchmark(base.BenchmarkTestBase):
+    """Throughput and latency of policy rule insertion.
+
+    For every engine kind and [congress_benchmark] rule_counts, a policy is
+    filled with that many rules one request at a time (serial) and with
+    [congress_benchmark] concurrency requests in flight (concurrent).
+    """
+
+    benchmark_name = 'rule_insertion'
+
+    def _kinds(self):
+        kinds = ['nonrecursive']
+        if CONF.congressz3.enabled:
+            kinds.append('z3')
+        return kinds
+
+    @staticmethod
+    def _rules(count):
+        # half facts, half rules deriving a table from them
+        rules = []
+        for i in range(count):
+            if i % 2:
+                rules.append('derived%d(x, y) :- link(x, y), link(y, %d)'
+                             % (i, i))
+            else:
+                rules.append('link(%d, %d)' % (i, i + 1))
+        return rules
+
+    def _insert(self, kind, rules, mode):
+        client = self.os_admin.congress_client
+        policy = client.create_policy({
+            'name': 'bench_%s' % ''.join(
+                random.choice(string.ascii_lowercase) for x in range(10)),
+            'kind': kind})
+        create = measure.timed(
+            lambda i: client.create_policy_rule(policy['name'],
+                                                {'rule': rules[i]}))
+        try:
+            start = time.time()
+            if mode == 'serial':
+                latencies = [create(i)[1] for i in range(len(rules))]
+            else:
+                results = self.run_concurrently(create, range(len(rules)))
+                latencies = [elapsed for _, elapsed in results.values()]
+            elapsed = time.time() - start
+        finally:
+            # the rules of a policy left behind would weigh on later runs
+            client.delete_policy(policy['id'])
+        self.record(kind=kind, mode=mode, rules=len(rules),
+                    seconds=elapsed, rules_per_second=len(rules) / elapsed,
+                    latency=measure.latency_summary(latencies))
+
+    @decorators.attr(type='benchmark')
+    def test_serial_rule_insertion(self):
+        for kind in self._kinds():
+            for count in CONF.congress_benchmark.rule_counts:
+                self._insert(kind, self._rules(count), 'serial')
+
+    @decorators.attr(type='benchmark')
+    def test_concurrent_rule_insertion(self):
+        for kind in self._kinds():
+            for count in CONF.congress_benchmark.rule_counts:
+                self._insert(kind, self._rules(count), 'concurrent')
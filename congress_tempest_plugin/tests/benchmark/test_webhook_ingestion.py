@@ -0,0 +1,207 @@
+# Copyright 2026 OpenStack Foundation
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import abc
+import copy
+import time
+
+from tempest import config
+from tempest.lib import decorators
+from tempest.lib import exceptions
+
+from congress_tempest_plugin.tests.benchmark import base
+from congress_tempest_plugin.tests.benchmark import measure
+from congress_tempest_plugin.tests.scenario.congress_datasources import (
+    test_monasca)
+from congress_tempest_plugin.tests.scenario.congress_datasources import (
+    test_vitrage)
+from congress_tempest_plugin.tests.scenario import helper
+
+CONF = config.CONF
+
+
+class _WebhookIngestionBenchmark(base.BenchmarkTestBase,
+                                 metaclass=abc.ABCMeta):
+    """Replay alarm webhooks to a webhook driven datasource.
+
+    For each of [congress_benchmark] webhook_rates, [congress_benchmark]
+    webhook_alarms distinct alarms are raised then cleared through
+    webhooks sent at that rate, [congress_benchmark] concurrency at a
+    time, to a new datasource.  The accepted webhooks per second, the
+    error rate and the webhook latencies are recorded, with the lag from
+    the last webhook until the datasource table, then a policy table
+    derived from it, show every alarm cleared.
+
+    Subclasses set the driver, the table of the alarms and its id and
+    state columns, and build the webhooks.
+    """
+
+    driver = None
+    table = None
+    id_column = None
+    state_column = 'state'
+    cleared_state = None
+
+    @abc.abstractmethod
+    def _webhooks(self, alarms):
+        """Return the webhooks raising, then clearing, that many alarms."""
+
+    def _cleared(self, rows_iter, id_position, state_position, count):
+        ids = set(row['data'][id_position] for row in rows_iter()
+                  if row['data'][state_position] == self.cleared_state)
+        return len(ids) == count
+
+    def _wait(self, check, what):
+        """Wait until check passes and return the time it did."""
+        timeout = CONF.congress_benchmark.timeout
+
+        @helper.retry_on_exception
+        def _check():
+            return check()
+
+        if measure.wait_until(_check, timeout, interval=0.5) is None:
+            raise exceptions.TimeoutException(
+                '%s did not show every alarm cleared in %ds' %
+                (what, timeout))
+        return time.time()
+
+    def _ingest(self, rate):
+        client = self.os_admin.congress_client
+        alarms = CONF.congress_benchmark.webhook_alarms
+        datasource = self._create_datasource(self.driver)
+        schema = client.get_datasource_table_schema(datasource['id'],
+                                                    self.table)
+        id_position = schema.index[self.id_column]
+        state_position = schema.index[self.state_column]
+        policy_name = self._create_random_policy('bench')
+        client.create_policy_rule(policy_name, {
+            'rule': 'cleared(id) :- %s:%s(%s=id, %s="%s")' % (
+                datasource['name'], self.table, self.id_column,
+                self.state_column, self.cleared_state)})
+        webhooks = self._webhooks(alarms)
+
+        latencies, errors, seconds = measure.replay(
+            lambda webhook: client.send_datasource_webhook(
+                datasource['id'], webhook),
+            webhooks, rate=rate,
+            concurrency=CONF.congress_benchmark.concurrency)
+        sent = time.time()
+        result = dict(driver=self.driver, alarms=alarms,
+                      rate=rate or None,
+                      concurrency=CONF.congress_benchmark.concurrency,
+                      webhooks=len(webhooks),
+                      accepted=len(latencies),
+                      errors=len(errors),
+                      error_rate=float(len(errors)) / len(webhooks),
+                      send_seconds=seconds,
+                      accepted_per_second=len(latencies) / seconds,
+                      webhook_latency=measure.latency_summary(latencies))
+        if errors:
+            # the final state cannot be reached, only report the errors
+            result['error_samples'] = sorted(set(str(e)
+                                                 for e in errors))[:5]
+            self.record(**result)
+            return
+
+        visible = self._wait(
+            lambda: self._cleared(
+                lambda: client.iter_datasource_rows(datasource['id'],
+                                                    self.table),
+                id_position, state_position, alarms),
+            'Datasource table %s' % self.table)
+        evaluated = self._wait(
+            lambda: sum(1 for _ in client.iter_policy_rows(
+                policy_name, 'cleared')) == alarms,
+            'Policy table cleared')
+        result.update(visible_lag_seconds=visible - sent,
+                      evaluated_lag_seconds=evaluated - sent)
+        self.record(**result)
+
+    def _run(self):
+        for rate in CONF.congress_benchmark.webhook_rates:
+            self._ingest(rate)
+
+
+class TestVitrageWebhookBenchmark(_WebhookIngestionBenchmark):
+
+    benchmark_name = 'vitrage_webhook_ingestion'
+    driver = test_vitrage.DRIVER_NAME
+    table = 'alarms'
+    id_column = 'vitrage_id'
+    cleared_state = 'Inactive'
+
+    @classmethod
+    def skip_checks(cls):
+        super(TestVitrageWebhookBenchmark, cls).skip_checks()
+        if not CONF.congress_feature_enabled.vitrage_webhook:
+            raise cls.skipException(
+                'feature not available in this congress version')
+
+    def _webhooks(self, alarms):
+        raised = []
+        cleared = []
+        for i in range(alarms):
+            vitrage_id = '%08x-0000-4000-8000-%012x' % (i, i)
+            for template, webhooks in (
+                    (test_vitrage.TEST_PAYLOAD_ACTIVATE, raised),
+                    (test_vitrage.TEST_PAYLOAD_DEACTIVATE, cleared)):
+                webhook = copy.deepcopy(template)
+                webhook['payload']['vitrage_id'] = vitrage_id
+                webhook['payload']['name'] = 'Benchmark alarm %d' % i
+                webhook['payload']['resource']['name'] = 'server-%d' % i
+                webhooks.append(webhook)
+        # every alarm is raised before any is cleared, so that webhooks of
+        # one alarm are far enough apart not to be reordered in flight
+        return raised + cleared
+
+    @decorators.attr(type='benchmark')
+    def test_vitrage_webhook_ingestion(self):
+        self._run()
+
+
+class TestMonascaWebhookBenchmark(_WebhookIngestionBenchmark):
+
+    benchmark_name = 'monasca_webhook_ingestion'
+    driver = 'monasca_webhook'
+    table = 'alarm_notification'
+    id_column = 'alarm_id'
+    cleared_state = 'OK'
+
+    @classmethod
+    def skip_checks(cls):
+        super(TestMonascaWebhookBenchmark, cls).skip_checks()
+        if not CONF.congress_feature_enabled.monasca_webhook:
+            raise cls.skipException(
+                'feature not available in this congress version')
+
+    def _webhooks(self, alarms):
+        raised = []
+        cleared = []
+        for i in range(alarms):
+            alarm = copy.deepcopy(test_monasca.TEST_ALARM)
+            alarm['alarm_id'] = '%08x-0000-4000-8000-%012x' % (i, i)
+            alarm['alarm_name'] = 'alarmPerHost%d' % i
+            alarm['metrics'][0]['dimensions']['hostname'] = 'host-%d' % i
+            raised.append(alarm)
+            alarm = copy.deepcopy(alarm)
+            alarm.update(state='OK', old_state='ALARM',
+                         alarm_timestamp=alarm['alarm_timestamp'] + 60,
+                         message='The alarm threshold is no longer exceeded')
+            cleared.append(alarm)
+        return raised + cleared
+
+    @decorators.attr(type='benchmark')
+    def test_monasca_webhook_ingestion(self):
+        self._run()
@@ -0,0 +1,195 @@
+# Copyright 2026 OpenStack Foundation
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import itertools
+import math
+import random
+
+from tempest import config
+from tempest.lib import decorators
+
+from congress_tempest_plugin.tests.benchmark import base
+from congress_tempest_plugin.tests.benchmark import measure
+
+CONF = config.CONF
+
+PATH_RULES = ['path(x, y) :- link(x, y)',
+              'path(x, y) :- link(x, z), path(z, y)']
+
+
+def chain_graph(edges, rng=None):
+    return [(i, i + 1) for i in range(edges)]
+
+
+def tree_graph(edges, rng=None):
+    """Binary tree rooted at 0."""
+    return [((i - 1) // 2, i) for i in range(1, edges + 1)]
+
+
+def random_graph(edges, rng):
+    """Sparse graph of as many nodes as edges, which may have cycles."""
+    links = set()
+    while len(links) < edges:
+        x, y = rng.randrange(edges), rng.randrange(edges)
+        if x != y:
+            links.add((x, y))
+    return sorted(links)
+
+
+def dense_graph(edges, rng):
+    """Graph linking about half of the ordered pairs of its nodes."""
+    nodes = int(math.ceil(math.sqrt(2 * edges))) + 1
+    return sorted(rng.sample(list(itertools.permutations(range(nodes), 2)),
+                             edges))
+
+
+GRAPHS = {
+    'chain': chain_graph,
+    'tree': tree_graph,
+    'random': random_graph,
+    'dense': dense_graph,
+}
+
+
+def closure_size(edges, limit=None):
+    """Return the size of the transitive closure of edges, and its depth.
+
+    The depth is the longest of the shortest paths between two nodes.
+    (None, None) is returned as soon as the closure has more than limit
+    pairs.
+    """
+    successors = {}
+    for x, y in edges:
+        successors.setdefault(x, []).append(y)
+    pairs = 0
+    depth = 0
+    for source in successors:
+        reached = set()
+        frontier = [source]
+        level = 0
+        while frontier:
+            level += 1
+            following = []
+            for node in frontier:
+                for successor in successors.get(node, ()):
+                    if successor not in reached:
+                        reached.add(successor)
+                        following.append(successor)
+            if following:
+                depth = max(depth, level)
+            frontier = following
+        pairs += len(reached)
+        if limit is not None and pairs > limit:
+            return None, None
+    return pairs, depth
+
+
+def unrolled_path_rules(depth):
+    """Return nonrecursive rules computing path up to depth links long."""
+    rules = ['path1(x, y) :- link(x, y)', 'path(x, y) :- path1(x, y)']
+    for length in range(2, depth + 1):
+        rules.append('path%d(x, y) :- link(x, z), path%d(z, y)' %
+                     (length, length - 1))
+        rules.append('path(x, y) :- path%d(x, y)' % length)
+    return rules
+
+
+class TestZ3ScalingBenchmark(base.BenchmarkTestBase):
+    """Transitive closure of generated graphs by the Z3 engine.
+
+    For each of [congress_benchmark] z3_graph_shapes and z3_edge_counts,
+    the graph is loaded as link facts in a z3 policy and the recursive
+    path rules are added; the time to add them and to list every path row
+    is recorded, and the number of rows checked against the closure
+    computed locally.  The nonrecursive engine rejects recursive rules, so
+    it is measured on the same graph with the closure unrolled to the
+    depth of the graph, as long as it is at most
+    [congress_benchmark] z3_max_unrolled_depth.
+
+    Once an engine fails or times out on a shape, it is not tried on the
+    larger graphs of that shape.
+    """
+
+    benchmark_name = 'z3_scaling'
+
+    @classmethod
+    def skip_checks(cls):
+        super(TestZ3ScalingBenchmark, cls).skip_checks()
+        if not CONF.congressz3.enabled:
+            raise cls.skipException('Z3 is not available')
+
+    def _materialize(self, kind, edges, rules):
+        """Return (link load, rule insertion, query) seconds and rows."""
+        client = self.os_admin.congress_client
+        policy_name = self._create_random_policy('bench', kind=kind)
+        bulk_create = measure.timed(client.create_policy_rules_bulk)
+        _, load = bulk_create(policy_name,
+                              ['link(%d, %d)' % edge for edge in edges])
+        _, insert = bulk_create(policy_name, rules)
+        rows, query = measure.timed(
+            lambda: sum(1 for _ in client.iter_policy_rows(policy_name,
+                                                           'path')))()
+        return load, insert, query, rows
+
+    def _run_shape(self, shape):
+        rng = random.Random(shape)
+        failed = set()
+        mismatches = []
+        for count in sorted(CONF.congress_benchmark.z3_edge_counts):
+            edges = GRAPHS[shape](count, rng)
+            pairs, depth = closure_size(
+                edges, CONF.congress_benchmark.z3_max_closure)
+            if pairs is None:
+                self.record(shape=shape, edges=count,
+                            skipped='closure larger than z3_max_closure')
+                break
+            for kind in ('z3', 'nonrecursive'):
+                if kind in failed:
+                    continue
+                result = dict(shape=shape, edges=count, kind=kind,
+                              expected_rows=pairs, depth=depth)
+                if kind == 'nonrecursive':
+                    if depth > CONF.congress_benchmark.z3_max_unrolled_depth:
+                        self.record(skipped='deeper than '
+                                            'z3_max_unrolled_depth',
+                                    **result)
+                        continue
+                    rules = unrolled_path_rules(depth)
+                else:
+                    rules = PATH_RULES
+                try:
+                    load, insert, query, rows = self._materialize(
+                        kind, edges, rules)
+                except Exception as e:
+                    # timeouts and engine errors are results too
+                    failed.add(kind)
+                    self.record(error=str(e), **result)
+                    continue
+                result['rows'] = rows
+                if rows != pairs:
+                    mismatches.append(result)
+                self.record(rules=len(rules),
+                            load_seconds=load,
+                            insert_seconds=insert,
+                            query_seconds=query,
+                            materialize_seconds=insert + query,
+                            **result)
+        self.assertEqual([], mismatches,
+                         'path cardinality differs from the closure')
+
+    @decorators.attr(type='benchmark')
+    def test_z3_scaling(self):
+        for shape in CONF.congress_benchmark.z3_graph_shapes:
+            self._run_shape(shape)
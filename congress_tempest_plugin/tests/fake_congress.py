@@ -0,0 +1,634 @@
+# Copyright 2026 OpenStack Foundation
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""In-process fake of the Congress v1 API.
+
+Serves every URL template used by PolicyClient from an in-memory datastore,
+so the plugin clients and helpers can be exercised without a devstack::
+
+    with fake_congress.FakeCongressServer(latency=0.01) as server:
+        client = server.make_client()
+        client.create_policy({'name': 'p'})
+        client.create_policy_rule('p', {'rule': 'q(1)'})
+        client.list_policy_rows('p', 'q')
+
+Policies only evaluate facts: a rule without a body such as 'q(1, "a")'
+adds a row to table q.  Rows of other policy tables can be seeded with
+FakeCongressData.set_policy_rows.
+"""
+
+import copy
+from http import server as http_server
+import json
+import random
+import re
+import socket
+import socketserver
+import threading
+import time
+from urllib import parse as urlparse
+import uuid
+
+from congress_tempest_plugin.services.policy import policy_client
+
+FACT = re.compile(r'^\s*([\w:]+)\s*\((.*)\)\s*$')
+
+DEFAULT_DRIVERS = {
+    'fake_datasource': {
+        'fake_table': ['id', 'name'],
+    },
+    'doctor': {
+        'events': ['time', 'type', 'hostname', 'status', 'monitor',
+                   'monitor_event_id'],
+    },
+}
+
+
+class NotFound(Exception):
+    pass
+
+
+class BadRequest(Exception):
+    pass
+
+
+def _parse_value(token):
+    token = token.strip()
+    if len(token) >= 2 and token[0] == token[-1] == '"':
+        return token[1:-1]
+    try:
+        return int(token)
+    except ValueError:
+        try:
+            return float(token)
+        except ValueError:
+            return token
+
+
+def parse_fact(rule):
+    """Return (table, row) if rule is a fact like 'p(1, "a")', else None."""
+    if ':-' in rule:
+        return None
+    match = FACT.match(rule)
+    if not match:
+        return None
+    args = match.group(2).strip()
+    row = [_parse_value(t) for t in args.split(',')] if args else []
+    return match.group(1), row
+
+
+class FakeCongressData(object):
+    """Thread-safe in-memory state behind FakeCongressServer."""
+
+    def __init__(self, drivers=None):
+        self.lock = threading.RLock()
+        self.policies = {}
+        self.rules = {}
+        self.policy_rows = {}
+        self.library_policies = {}
+        self.datasources = {}
+        self.datasource_rows = {}
+        self.webhooks = {}
+        self.actions = []
+        self.drivers = {}
+        for name, tables in (drivers or DEFAULT_DRIVERS).items():
+            self.add_driver(name, tables)
+        for name in ('classification', 'action'):
+            self.create_policy({'name': name})
+
+    # lookups
+
+    @staticmethod
+    def _find(collection, name_or_id, kind):
+        if name_or_id in collection:
+            return collection[name_or_id]
+        for item in collection.values():
+            if item['name'] == name_or_id:
+                return item
+        raise NotFound('%s %s not found' % (kind, name_or_id))
+
+    def policy(self, name_or_id):
+        return self._find(self.policies, name_or_id, 'policy')
+
+    def datasource(self, name_or_id):
+        return self._find(self.datasources, name_or_id, 'datasource')
+
+    # drivers
+
+    def add_driver(self, name, tables):
+        """Register a driver; tables maps table names to column names."""
+        with self.lock:
+            self.drivers[name] = {
+                'id': name,
+                'description': 'fake %s driver' % name,
+                'config': {},
+                'tables': [{'table_id': table,
+                            'columns': [{'name': c, 'description': ''}
+                                        for c in columns]}
+                           for table, columns in sorted(tables.items())]}
+
+    # policies
+
+    def create_policy(self, body, library_policy=None):
+        with self.lock:
+            rules = []
+            if library_policy:
+                library = self._find(self.library_policies, library_policy,
+                                     'library policy')
+                body = dict((k, v) for k, v in library.items()
+                            if k not in ('id', 'rules'))
+                rules = library.get('rules', [])
+            body = body or {}
+            if not body.get('name'):
+                raise BadRequest('policy name is required')
+            for policy in self.policies.values():
+                if policy['name'] == body['name']:
+                    raise BadRequest('policy %s already exists' %
+                                     body['name'])
+            policy = {'id': str(uuid.uuid4()),
+                      'name': body['name'],
+                      'owner_id': 'user',
+                      'kind': body.get('kind', 'nonrecursive'),
+                      'abbreviation': body.get('abbreviation',
+                                               body['name'][:5]),
+                      'description': body.get('description', '')}
+            self.policies[policy['id']] = policy
+            self.rules[policy['id']] = {}
+            for rule in rules:
+                self.create_rule(policy['id'], rule)
+            return policy
+
+    def delete_policy(self, name_or_id):
+        with self.lock:
+            policy = self.policy(name_or_id)
+            del self.policies[policy['id']]
+            del self.rules[policy['id']]
+            for key in [k for k in self.policy_rows if k[0] == policy['id']]:
+                del self.policy_rows[key]
+            return policy
+
+    def create_rule(self, policy_name, body):
+        with self.lock:
+            policy = self.policy(policy_name)
+            if not body or not body.get('rule'):
+                raise BadRequest('rule is required')
+            rule = {'id': str(uuid.uuid4()),
+                    'name': body.get('name', ''),
+                    'comment': body.get('comment', ''),
+                    'rule': body['rule']}
+            self.rules[policy['id']][rule['id']] = rule
+            return rule
+
+    def rule(self, policy_name, rule_id):
+        return self._find(self.rules[self.policy(policy_name)['id']],
+                          rule_id, 'rule')
+
+    def delete_rule(self, policy_name, rule_id):
+        with self.lock:
+            rule = self.rule(policy_name, rule_id)
+            del self.rules[self.policy(policy_name)['id']][rule['id']]
+            return rule
+
+    def set_policy_rows(self, policy_name, table, rows):
+        """Seed the rows of a derived policy table."""
+        with self.lock:
+            self.policy_rows[(self.policy(policy_name)['id'], table)] = [
+                list(row) for row in rows]
+
+    def policy_table_rows(self, policy_name, table):
+        with self.lock:
+            policy = self.policy(policy_name)
+            rows = list(self.policy_rows.get((policy['id'], table), []))
+            seen = set(tuple(row) for row in rows)
+            for rule in self.rules[policy['id']].values():
+                fact = parse_fact(rule['rule'])
+                if fact and fact[0] == table and tuple(fact[1]) not in seen:
+                    seen.add(tuple(fact[1]))
+                    rows.append(fact[1])
+            return rows
+
+    def policy_tables(self, policy_name):
+        with self.lock:
+            policy = self.policy(policy_name)
+            tables = set(t for (p, t) in self.policy_rows if p == policy['id'])
+            for rule in self.rules[policy['id']].values():
+                head = rule['rule'].split(':-')[0]
+                match = FACT.match(head)
+                if match:
+                    tables.add(match.group(1))
+            return sorted(tables)
+
+    # library policies
+
+    def create_library_policy(self, body):
+        with self.lock:
+            policy = copy.deepcopy(body)
+            policy['id'] = str(uuid.uuid4())
+            self.library_policies[policy['id']] = policy
+            return policy
+
+    # datasources
+
+    def create_datasource(self, body):
+        with self.lock:
+            if not body or not body.get('name'):
+                raise BadRequest('datasource name is required')
+            if body.get('driver') not in self.drivers:
+                raise BadRequest('unknown driver %s' % body.get('driver'))
+            for ds in self.datasources.values():
+                if ds['name'] == body['name']:
+                    raise BadRequest('datasource %s already exists' %
+                                     body['name'])
+            ds = {'id': str(uuid.uuid4()),
+                  'name': body['name'],
+                  'driver': body['driver'],
+                  'config': body.get('config'),
+                  'description': body.get('description', ''),
+                  'enabled': body.get('enabled', True)}
+            self.datasources[ds['id']] = ds
+            self.datasource_rows[ds['id']] = dict(
+                (t['table_id'], [])
+                for t in self.drivers[ds['driver']]['tables'])
+            ds['_updates'] = 1
+            self.create_policy({'name': ds['name'], 'kind': 'datasource'})
+            return ds
+
+    def delete_datasource(self, name_or_id):
+        with self.lock:
+            ds = self.datasource(name_or_id)
+            del self.datasources[ds['id']]
+            del self.datasource_rows[ds['id']]
+            self.delete_policy(ds['name'])
+            return ds
+
+    def table_spec(self, name_or_id, table):
+        ds = self.datasource(name_or_id)
+        for spec in self.drivers[ds['driver']]['tables']:
+            if spec['table_id'] == table:
+                return spec
+        raise NotFound('table %s not found' % table)
+
+    def set_datasource_rows(self, name_or_id, table, rows):
+        """Replace the rows of a datasource table; rows may be dicts."""
+        with self.lock:
+            ds = self.datasource(name_or_id)
+            columns = [c['name'] for c in self.table_spec(ds['id'],
+                                                          table)['columns']]
+            self.datasource_rows[ds['id']][table] = [
+                self._flatten(row, columns) for row in rows]
+            ds['_updates'] += 1
+
+    @staticmethod
+    def _flatten(row, columns):
+        if not isinstance(row, dict):
+            return list(row)
+        values = {}
+        for key, value in row.items():
+            if isinstance(value, dict):
+                values.update(value)
+            else:
+                values[key] = value
+        return [values.get(c) for c in columns]
+
+    def bump_updates(self, name_or_id):
+        with self.lock:
+            self.datasource(name_or_id)['_updates'] += 1
+
+    def datasource_status(self, name_or_id):
+        ds = self.datasource(name_or_id)
+        return {'initialized': 'True',
+                'number_of_updates': str(ds['_updates']),
+                'last_error': 'None',
+                'subscriptions': [],
+                'subscribers': []}
+
+
+class _Handler(http_server.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def setup(self):
+        http_server.BaseHTTPRequestHandler.setup(self)
+        # answer small keep-alive requests without Nagle delays
+        self.request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status, body=None):
+        data = json.dumps(body).encode('utf-8') if body is not None else b''
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _dispatch(self, method):
+        length = int(self.headers.get('Content-Length') or 0)
+        raw = self.rfile.read(length) if length else b''
+        url = urlparse.urlparse(self.path)
+        query = dict(urlparse.parse_qsl(url.query))
+        server = self.server.fake
+        server.before_request(method, url.path)
+        error = server.pick_error(method, url.path)
+        if error:
+            return self._send(error, {'error': {'message': 'injected'}})
+        try:
+            body = json.loads(raw.decode('utf-8')) if raw else None
+            status, result = server.route(method, url.path, query, body)
+        except NotFound as e:
+            status, result = 404, {'error': {'message': str(e)}}
+        except (BadRequest, ValueError) as e:
+            status, result = 400, {'error': {'message': str(e)}}
+        self._send(status, result)
+
+    def do_GET(self):
+        self._dispatch('GET')
+
+    def do_POST(self):
+        self._dispatch('POST')
+
+    def do_PUT(self):
+        self._dispatch('PUT')
+
+    def do_DELETE(self):
+        self._dispatch('DELETE')
+
+
+class _ThreadingHTTPServer(socketserver.ThreadingMixIn,
+                           http_server.HTTPServer):
+    daemon_threads = True
+
+
+class FakeAuthProvider(object):
+    """Minimal stand-in for a tempest auth provider."""
+
+    def __init__(self, base_url, token='fake-token'):
+        self._base_url = base_url
+        self.token = token
+        self.credentials = None
+
+    def auth_request(self, method, url, headers=None, body=None,
+                     filters=None):
+        headers = dict(headers or {})
+        headers['X-Auth-Token'] = self.token
+        return self._base_url + url, headers, body
+
+    def base_url(self, filters, auth_data=None):
+        return self._base_url
+
+    def get_token(self):
+        return self.token
+
+
+class FakeCongressServer(object):
+    """Congress v1 API served from memory on a local port.
+
+    :param latency: seconds added to every request, or a callable
+                    (method, path) -> seconds
+    :param error_rate: probability of answering any request with
+                       error_status instead of serving it
+    """
+
+    def __init__(self, host='127.0.0.1', port=0, latency=0.0,
+                 error_rate=0.0, error_status=503, data=None):
+        self.data = data or FakeCongressData()
+        self.latency = latency
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.requests = []
+        self._injected = []
+        self._lock = threading.Lock()
+        self._httpd = _ThreadingHTTPServer((host, port), _Handler)
+        self._httpd.fake = self
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._httpd.server_address[:2]
+        return 'http://%s:%d' % (host, port)
+
+    def start(self):
+        self._thread = threading.Thread(target=self._httpd.serve_forever)
+        self._thread.daemon = True
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        self._thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def make_client(self, **kwargs):
+        """Return a PolicyClient talking to this server."""
+        return policy_client.PolicyClient(
+            FakeAuthProvider(self.url), 'policy', 'RegionOne', **kwargs)
+
+    def inject_error(self, status=500, method=None, path=None, count=1):
+        """Fail the next count requests matching method and path regex."""
+        with self._lock:
+            self._injected.append([status, method,
+                                   re.compile(path) if path else None,
+                                   count])
+
+    def before_request(self, method, path):
+        with self._lock:
+            self.requests.append((method, path))
+        latency = self.latency
+        if callable(latency):
+            latency = latency(method, path)
+        if latency:
+            time.sleep(latency)
+
+    def pick_error(self, method, path):
+        with self._lock:
+            for injected in self._injected:
+                status, m, regex, count = injected
+                if ((m is None or m == method) and
+                        (regex is None or regex.search(path))):
+                    injected[3] -= 1
+                    if injected[3] <= 0:
+                        self._injected.remove(injected)
+                    return status
+        if self.error_rate and random.random() < self.error_rate:
+            return self.error_status
+        return None
+
+    def route(self, method, path, query, body):
+        parts = [urlparse.unquote(p) for p in path.strip('/').split('/')]
+        if parts[:1] != ['v1'] or len(parts) < 2:
+            raise NotFound(path)
+        handler = {'policies': self._policies,
+                   'librarypolicies': self._library_policies,
+                   'data-sources': self._datasources,
+                   'system': self._system}.get(parts[1])
+        if handler is None:
+            raise NotFound(path)
+        return handler(method, parts[2:], query, body)
+
+    @staticmethod
+    def _results(items):
+        return 200, {'results': items}
+
+    def _policies(self, method, parts, query, body):
+        data = self.data
+        if not parts:
+            if method == 'GET':
+                return self._results(list(data.policies.values()))
+            if method == 'POST':
+                return 201, data.create_policy(
+                    body, query.get('library_policy'))
+        elif len(parts) == 1:
+            if method == 'GET':
+                return 200, data.policy(parts[0])
+            if method == 'DELETE':
+                return 200, data.delete_policy(parts[0])
+            if method == 'POST':
+                data.policy(parts[0])
+                with data.lock:
+                    data.actions.append((parts[0], query, body))
+                return 200, {}
+        elif parts[1] == 'status' and len(parts) == 2:
+            policy = data.policy(parts[0])
+            return 200, {'name': policy['name'], 'id': policy['id']}
+        elif parts[1] == 'rules':
+            if len(parts) == 2 and method == 'GET':
+                return self._results(list(
+                    data.rules[data.policy(parts[0])['id']].values()))
+            if len(parts) == 2 and method == 'POST':
+                return 201, data.create_rule(parts[0], body)
+            if len(parts) == 3 and method == 'GET':
+                return 200, data.rule(parts[0], parts[2])
+            if len(parts) == 3 and method == 'DELETE':
+                return 200, data.delete_rule(parts[0], parts[2])
+        elif parts[1] == 'tables' and method == 'GET':
+            if len(parts) == 2:
+                return self._results([{'id': t} for t in
+                                      data.policy_tables(parts[0])])
+            if len(parts) == 3:
+                if parts[2] not in data.policy_tables(parts[0]):
+                    raise NotFound('table %s not found' % parts[2])
+                return 200, {'id': parts[2]}
+            if len(parts) == 4 and parts[3] == 'rows':
+                rows = data.policy_table_rows(parts[0], parts[2])
+                result = {'results': [{'data': r} for r in rows]}
+                if query.get('trace', '').lower() == 'true':
+                    result['trace'] = self._trace(parts[2], rows)
+                return 200, result
+        raise NotFound('/'.join(parts))
+
+    @staticmethod
+    def _trace(table, rows):
+        lines = ['Call: %s(x)' % table]
+        for row in rows:
+            lines.append('Exit: %s(%s)' % (
+                table, ', '.join(json.dumps(v) for v in row)))
+        return '\n'.join(lines)
+
+    def _library_policies(self, method, parts, query, body):
+        data = self.data
+        if not parts:
+            if method == 'GET':
+                return self._results(list(data.library_policies.values()))
+            if method == 'POST':
+                return 201, data.create_library_policy(body)
+        elif len(parts) == 1:
+            policy = data._find(data.library_policies, parts[0],
+                                'library policy')
+            if method == 'GET':
+                return 200, policy
+            if method == 'DELETE':
+                with data.lock:
+                    del data.library_policies[policy['id']]
+                return 200, policy
+        raise NotFound('/'.join(parts))
+
+    def _datasources(self, method, parts, query, body):
+        data = self.data
+        if not parts:
+            if method == 'GET':
+                return self._results([
+                    dict((k, v) for k, v in ds.items()
+                         if not k.startswith('_'))
+                    for ds in data.datasources.values()])
+            if method == 'POST':
+                ds = data.create_datasource(body)
+                return 201, dict((k, v) for k, v in ds.items()
+                                 if not k.startswith('_'))
+        elif len(parts) == 1:
+            ds = data.datasource(parts[0])
+            if method == 'DELETE':
+                data.delete_datasource(parts[0])
+                return 200, {}
+            if method == 'POST':
+                action = query.get('action')
+                if action == 'request-refresh':
+                    data.bump_updates(ds['id'])
+                elif action == 'execute':
+                    with data.lock:
+                        data.actions.append((ds['name'], query, body))
+                else:
+                    raise BadRequest('unknown action %s' % action)
+                return 200, {}
+        elif len(parts) == 2 and method == 'GET':
+            if parts[1] == 'status':
+                return 200, data.datasource_status(parts[0])
+            if parts[1] == 'schema':
+                ds = data.datasource(parts[0])
+                return 200, {'tables': data.drivers[ds['driver']]['tables']}
+            if parts[1] == 'tables':
+                ds = data.datasource(parts[0])
+                return self._results([
+                    {'id': t} for t in sorted(data.datasource_rows[ds['id']])])
+        elif len(parts) == 2 and parts[1] == 'webhook' and method == 'POST':
+            ds = data.datasource(parts[0])
+            with data.lock:
+                data.webhooks.setdefault(ds['id'], []).append(body)
+                ds['_updates'] += 1
+            return 200, {}
+        elif parts[1] == 'tables' and len(parts) >= 3:
+            ds = data.datasource(parts[0])
+            spec = data.table_spec(ds['id'], parts[2])
+            if len(parts) == 3 and method == 'GET':
+                return 200, {'id': parts[2]}
+            if len(parts) == 4 and parts[3] == 'spec' and method == 'GET':
+                return 200, {'columns': spec['columns']}
+            if len(parts) == 4 and parts[3] == 'rows':
+                if method == 'GET':
+                    with data.lock:
+                        rows = data.datasource_rows[ds['id']][parts[2]]
+                        return self._results([{'data': list(r)}
+                                              for r in rows])
+                if method == 'PUT':
+                    data.set_datasource_rows(ds['id'], parts[2], body or [])
+                    return 200, None
+        raise NotFound('/'.join(parts))
+
+    def _system(self, method, parts, query, body):
+        if parts[:1] != ['drivers'] or method != 'GET':
+            raise NotFound('/'.join(parts))
+        drivers = self.data.drivers
+        if len(parts) == 1:
+            return self._results([{'id': d['id'],
+                                   'description': d['description']}
+                                  for d in drivers.values()])
+        if len(parts) == 2 and parts[1] in drivers:
+            return 200, drivers[parts[1]]
+        raise NotFound('/'.join(parts))
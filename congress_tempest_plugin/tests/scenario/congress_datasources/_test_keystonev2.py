@@ -50,10 +50,9 @@ class TestKeystoneV2Driver(manager_congress.ScenarioPolicyBase):
     @decorators.attr(type='smoke')
     def test_keystone_users_table(self):
         user_schema = (
-            self.os_admin.congress_client.show_datasource_table_schema(
-                self.datasource_id, 'users')['columns'])
-        user_id_col = next(i for i, c in enumerate(user_schema)
-                           if c['name'] == 'id')
+            self.os_admin.congress_client.get_datasource_table_schema(
+                self.datasource_id, 'users'))
+        user_id_col = user_schema.index['id']
 
         def _check_data_table_keystone_users():
             # Fetch data from keystone each time, because this test may start
@@ -84,19 +83,18 @@ class TestKeystoneV2Driver(manager_congress.ScenarioPolicyBase):
                         return False
             return True
 
-        if not test_utils.call_until_true(
+        if not self.call_until_datasource_converged(
                 func=_check_data_table_keystone_users,
-                duration=100, sleep_for=4):
+                duration=100, max_interval=4):
             raise exceptions.TimeoutException("Data did not converge in time "
                                               "or failure in server")
 
     @decorators.attr(type='smoke')
     def test_keystone_roles_table(self):
         role_schema = (
-            self.os_admin.congress_client.show_datasource_table_schema(
-                self.datasource_id, 'roles')['columns'])
-        role_id_col = next(i for i, c in enumerate(role_schema)
-                           if c['name'] == 'id')
+            self.os_admin.congress_client.get_datasource_table_schema(
+                self.datasource_id, 'roles'))
+        role_id_col = role_schema.index['id']
 
         def _check_data_table_keystone_roles():
             # Fetch data from keystone each time, because this test may start
@@ -120,19 +118,18 @@ class TestKeystoneV2Driver(manager_congress.ScenarioPolicyBase):
                         return False
             return True
 
-        if not test_utils.call_until_true(
+        if not self.call_until_datasource_converged(
                 func=_check_data_table_keystone_roles,
-                duration=100, sleep_for=4):
+                duration=100, max_interval=4):
             raise exceptions.TimeoutException("Data did not converge in time "
                                               "or failure in server")
 
     @decorators.attr(type='smoke')
     def test_keystone_tenants_table(self):
         tenant_schema = (
-            self.os_admin.congress_client.show_datasource_table_schema(
-                self.datasource_id, 'tenants')['columns'])
-        tenant_id_col = next(i for i, c in enumerate(tenant_schema)
-                             if c['name'] == 'id')
+            self.os_admin.congress_client.get_datasource_table_schema(
+                self.datasource_id, 'tenants'))
+        tenant_id_col = tenant_schema.index['id']
 
         def _check_data_table_keystone_tenants():
             # Fetch data from keystone each time, because this test may start
@@ -156,9 +153,9 @@ class TestKeystoneV2Driver(manager_congress.ScenarioPolicyBase):
                         return False
             return True
 
-        if not test_utils.call_until_true(
+        if not self.call_until_datasource_converged(
                 func=_check_data_table_keystone_tenants,
-                duration=100, sleep_for=5):
+                duration=100, max_interval=5):
             raise exceptions.TimeoutException("Data did not converge in time "
                                               "or failure in server")
 
@@ -49,10 +49,9 @@ class TestAodhDriver(manager_congress.ScenarioPolicyBase):
             event_rule={})
 
         alarms_schema = (
-            self.os_admin.congress_client.show_datasource_table_schema(
-                self.datasource_id, 'alarms')['columns'])
-        alarms_id_col = next(i for i, c in enumerate(alarms_schema)
-                             if c['name'] == 'alarm_id')
+            self.os_admin.congress_client.get_datasource_table_schema(
+                self.datasource_id, 'alarms'))
+        alarms_id_col = alarms_schema.index['alarm_id']
 
         def _check_data_table_aodh_alarms():
             # Fetch data from aodh each time, because this test may start
@@ -77,8 +76,9 @@ class TestAodhDriver(manager_congress.ScenarioPolicyBase):
                         return False
             return True
 
-        if not test_utils.call_until_true(func=_check_data_table_aodh_alarms,
-                                          duration=100, sleep_for=5):
+        if not self.call_until_datasource_converged(
+                func=_check_data_table_aodh_alarms,
+                duration=100, max_interval=5):
             raise exceptions.TimeoutException("Data did not converge in time "
                                               "or failure in server")
 
@@ -24,11 +24,6 @@ from congress_tempest_plugin.tests.scenario import manager_congress
 CONF = config.CONF
 
 
-def find_col(schema, name):
-    "Finds the index of a column in a congress table."
-    return next(i for i, c in enumerate(schema) if c['name'] == name)
-
-
 class TestCfgValidatorDriver(manager_congress.ScenarioPolicyBase):
     """Tempest tests for the config datasource.
 
@@ -40,12 +35,10 @@ class TestCfgValidatorDriver(manager_congress.ScenarioPolicyBase):
         super(TestCfgValidatorDriver, self).setUp()
         self.keypairs = {}
         self.servers = []
-        datasources = self.os_admin.congress_client.list_datasources()
-        for datasource in datasources['results']:
-            if datasource['name'] == 'config':
-                self.datasource_id = datasource['id']
-                return
-        self.skipTest('no datasource config configured.')
+        self.datasource_id = (
+            self.os_admin.congress_client.get_datasource_id('config'))
+        if self.datasource_id is None:
+            self.skipTest('no datasource config configured.')
 
     @decorators.attr(type='smoke')
     def test_update_no_error(self):
@@ -63,16 +56,16 @@ class TestCfgValidatorDriver(manager_congress.ScenarioPolicyBase):
 
         client = self.os_admin.congress_client
         schema1 = (
-            client.show_datasource_table_schema(
-                self.datasource_id, 'option')['columns'])
-        col1_name = find_col(schema1, 'name')
-        col1_group = find_col(schema1, 'group')
-        col1_namespace = find_col(schema1, 'namespace')
+            client.get_datasource_table_schema(
+                self.datasource_id, 'option'))
+        col1_name = schema1.index['name']
+        col1_group = schema1.index['group']
+        col1_namespace = schema1.index['namespace']
         schema2 = (
-            client.show_datasource_table_schema(
-                self.datasource_id, 'namespace')['columns'])
-        col2_name = find_col(schema2, 'name')
-        col2_id = find_col(schema2, 'id')
+            client.get_datasource_table_schema(
+                self.datasource_id, 'namespace'))
+        col2_name = schema2.index['name']
+        col2_id = schema2.index['id']
 
         def _check_metadata():
             res1 = (
@@ -94,9 +87,9 @@ class TestCfgValidatorDriver(manager_congress.ScenarioPolicyBase):
             if row1['data'][col1_group] != 'DEFAULT':
                 return False
             return row1['data'][col1_namespace] == row2['data'][col2_id]
-        if not test_utils.call_until_true(
+        if not self.call_until_datasource_converged(
                 func=_check_metadata,
-                duration=100, sleep_for=4):
+                duration=100, max_interval=4):
             raise exceptions.TimeoutException("Data did not converge in time "
                                               "or failure in server")
 
@@ -109,9 +102,9 @@ class TestCfgValidatorDriver(manager_congress.ScenarioPolicyBase):
         auth_strategy = 'keystone'
         client = self.os_admin.congress_client
         schema = (
-            client.show_datasource_table_schema(
-                self.datasource_id, 'binding')['columns'])
-        col_value = find_col(schema, 'val')
+            client.get_datasource_table_schema(
+                self.datasource_id, 'binding'))
+        col_value = schema.index['val']
 
         def _check_value():
             res = (
@@ -123,8 +116,8 @@ class TestCfgValidatorDriver(manager_congress.ScenarioPolicyBase):
                         if r['data'][col_value] == auth_strategy),
                        None)
             return row is not None
-        if not test_utils.call_until_true(
+        if not self.call_until_datasource_converged(
                 func=_check_value,
-                duration=100, sleep_for=4):
+                duration=100, max_interval=4):
             raise exceptions.TimeoutException("Data did not converge in time "
                                               "or failure in server")
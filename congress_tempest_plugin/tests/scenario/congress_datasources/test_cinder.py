@@ -57,10 +57,9 @@ class TestCinderDriver(manager_congress.ScenarioPolicyBase):
     @decorators.attr(type='smoke')
     def test_cinder_volumes_table(self):
         volume_schema = (
-            self.os_admin.congress_client.show_datasource_table_schema(
-                self.datasource_id, 'volumes')['columns'])
-        volume_id_col = next(i for i, c in enumerate(volume_schema)
-                             if c['name'] == 'id')
+            self.os_admin.congress_client.get_datasource_table_schema(
+                self.datasource_id, 'volumes'))
+        volume_id_col = volume_schema.index['id']
 
         def _check_data_table_cinder_volumes():
             # Fetch data from cinder each time, because this test may start
@@ -101,9 +100,9 @@ class TestCinderDriver(manager_congress.ScenarioPolicyBase):
             #             return False
             return True
 
-        if not test_utils.call_until_true(
+        if not self.call_until_datasource_converged(
                 func=_check_data_table_cinder_volumes,
-                duration=100, sleep_for=5):
+                duration=100, max_interval=5):
             raise exceptions.TimeoutException("Data did not converge in time "
                                               "or failure in server")
 
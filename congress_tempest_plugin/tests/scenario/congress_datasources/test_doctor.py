@@ -81,7 +81,7 @@ class TestDoctorDriver(manager_congress.ScenarioPolicyBase):
                          'inserted. row details: %s' % results['results'])
             raise exceptions.InvalidStructure(error_msg)
 
-        if results['results'][0]['data'] != expected_row:
+        if list(results['results'][0]['data']) != expected_row:
             msg = ('inserted row %s is not expected row %s'
                    % (results['results'][0]['data'], expected_row))
             raise exceptions.InvalidStructure(msg)
@@ -53,10 +53,9 @@ class TestGlanceV2Driver(manager_congress.ScenarioPolicyBase):
     @utils.services('image')
     def test_glancev2_images_table(self):
         image_schema = (
-            self.os_admin.congress_client.show_datasource_table_schema(
-                self.datasource_id, 'images')['columns'])
-        image_id_col = next(i for i, c in enumerate(image_schema)
-                            if c['name'] == 'id')
+            self.os_admin.congress_client.get_datasource_table_schema(
+                self.datasource_id, 'images'))
+        image_id_col = image_schema.index['id']
 
         def _check_data_table_glancev2_images():
             # Fetch data from glance each time, because this test may start
@@ -90,9 +89,9 @@ class TestGlanceV2Driver(manager_congress.ScenarioPolicyBase):
                         return False
             return True
 
-        if not test_utils.call_until_true(
+        if not self.call_until_datasource_converged(
                 func=_check_data_table_glancev2_images,
-                duration=100, sleep_for=4):
+                duration=100, max_interval=4):
             raise exceptions.TimeoutException("Data did not converge in time "
                                               "or failure in server")
 
@@ -121,9 +120,9 @@ class TestGlanceV2Driver(manager_congress.ScenarioPolicyBase):
                     return False
             return True
 
-        if not test_utils.call_until_true(
+        if not self.call_until_datasource_converged(
                 func=_check_data_table_glance_images,
-                duration=100, sleep_for=5):
+                duration=100, max_interval=5):
             raise exceptions.TimeoutException("Data did not converge in time "
                                               "or failure in server")
 
@@ -27,6 +27,22 @@ from congress_tempest_plugin.tests.scenario import manager_congress
 CONF = config.CONF
 DRIVER_NAME = 'monasca'
 
+TEST_ALARM = {
+    'metrics': [
+        {u'dimensions': {u'hostname': u'openstack-13.local.lan',
+                         u'service': u'monitoring'},
+         u'id': None,
+         u'name': u'load.avg_1_min'}],
+    'alarm_id': u'3beb4934-053d-4f8f-9704-273bffc2441b',
+    'state': u'ALARM',
+    'alarm_timestamp': 1531821822,
+    'tenant_id': u'3661888238874df098988deab07c599d',
+    'old_state': u'UNDETERMINED',
+    'alarm_description': u'',
+    'message': u'Thresholds were exceeded for the sub-alarms',
+    'alarm_definition_id': u'8e5d033f-28cc-459f-91d4-813307e4ca8a',
+    'alarm_name': u'alarmPerHost23'}
+
 
 class TestMonascaDriver(manager_congress.ScenarioPolicyBase):
 
@@ -117,7 +133,7 @@ class TestMonascaWebhookDriver(manager_congress.ScenarioPolicyBase):
 
             output = []
             for data in result['results']:
-                output.append(data['data'])
+                output.append(list(data['data']))
             output = sorted(output)
             expected_result = sorted(expected_result)
             for index in range(result_length):
@@ -163,22 +179,6 @@ class TestMonascaWebhookDriver(manager_congress.ScenarioPolicyBase):
     @testtools.skipUnless(CONF.congress_feature_enabled.monasca_webhook_rocky,
                           'Test expects monasca webhook rocky schema.')
     def test_monasca_alarm_notification_table_rocky(self):
-        test_alarm = {
-            'metrics': [
-                {u'dimensions': {u'hostname': u'openstack-13.local.lan',
-                                 u'service': u'monitoring'},
-                 u'id': None,
-                 u'name': u'load.avg_1_min'}],
-            'alarm_id': u'3beb4934-053d-4f8f-9704-273bffc2441b',
-            'state': u'ALARM',
-            'alarm_timestamp': 1531821822,
-            'tenant_id': u'3661888238874df098988deab07c599d',
-            'old_state': u'UNDETERMINED',
-            'alarm_description': u'',
-            'message': u'Thresholds were exceeded for the sub-alarms',
-            'alarm_definition_id': u'8e5d033f-28cc-459f-91d4-813307e4ca8a',
-            'alarm_name': u'alarmPerHost23'}
-
         # Check if service is up
         @helper.retry_on_exception
         def _check_service():
@@ -190,7 +190,7 @@ class TestMonascaWebhookDriver(manager_congress.ScenarioPolicyBase):
             raise exceptions.TimeoutException(
                 "Monasca-Webhook data source service is not up")
 
-        self.client.send_datasource_webhook(self.datasource_id, test_alarm)
+        self.client.send_datasource_webhook(self.datasource_id, TEST_ALARM)
         results = self._list_datasource_rows(self.datasource_id,
                                              'alarm_notification')
         if len(results['results']) != 1:
@@ -212,7 +212,7 @@ class TestMonascaWebhookDriver(manager_congress.ScenarioPolicyBase):
                         u'openstack-13.local.lan',
                         u'monitoring']
 
-        if results['results'][0]['data'] != expected_row:
+        if list(results['results'][0]['data']) != expected_row:
             msg = ('inserted row %s is not expected row %s'
                    % (results['results'][0]['data'], expected_row))
             raise exceptions.InvalidStructure(msg)
@@ -55,10 +55,8 @@ class TestMuranoDriver(manager_congress.ScenarioPolicyBase):
         def _delete_policy_rules(policy_name):
             result = self.congress_client.list_policy_rules(
                 policy_name)['results']
-            for rule in result:
-                self.congress_client.delete_policy_rule(
-                    policy_name,
-                    rule['id'])
+            self.congress_client.delete_policy_rules_bulk(
+                policy_name, [rule['id'] for rule in result])
 
         def _create_random_policy():
             policy_name = "murano_%s" % ''.join(
@@ -83,9 +81,6 @@ class TestMuranoDriver(manager_congress.ScenarioPolicyBase):
             except exceptions.Conflict:
                 pass
 
-        def _create_rule(policy_name, rule):
-            self.congress_client.create_policy_rule(policy_name, rule)
-
         def _simulate_policy(policy_name, query):
             resp = self.congress_client.execute_policy_action(
                 policy_name,
@@ -187,14 +182,8 @@ class TestMuranoDriver(manager_congress.ScenarioPolicyBase):
 
         _create_datasource()
         policy_name = _create_random_policy()
-        _create_rule(policy_name, rule1)
-
-        _create_rule(policy_name, rule2)
-        _create_rule(policy_name, rule3)
-        _create_rule(policy_name, rule4)
-        _create_rule(policy_name, rule5)
-        _create_rule(policy_name, rule6)
-        _create_rule(policy_name, rule7)
+        self._create_policy_rules(
+            policy_name, [rule1, rule2, rule3, rule4, rule5, rule6, rule7])
         result = _simulate_policy(policy_name, sim_query1)
         self.assertEmpty(result)
         result = _simulate_policy(policy_name, sim_query2)
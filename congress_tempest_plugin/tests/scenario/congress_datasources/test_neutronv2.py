@@ -24,6 +24,7 @@ from tempest.lib import exceptions
 
 from congress_tempest_plugin.tests.scenario import helper
 from congress_tempest_plugin.tests.scenario import manager_congress
+from congress_tempest_plugin.tests.scenario import table_compare
 
 CONF = config.CONF
 LOG = logging.getLogger(__name__)
@@ -61,33 +62,32 @@ class TestNeutronV2Driver(manager_congress.ScenarioPolicyBase):
     @decorators.attr(type='smoke')
     @utils.services('network')
     def test_neutronv2_networks_table(self):
+        network_schema = (
+            self.os_admin.congress_client.get_datasource_table_schema(
+                self.datasource_id, 'networks'))
+        # every congress row must match a neutron network
+        comparison = table_compare.IncrementalComparison(
+            table_compare.TableComparator(network_schema), subset=True)
 
         @helper.retry_on_exception
         def _check_data():
             networks = self.networks_client.list_networks()
-            network_map = {}
-            for network in networks['networks']:
-                network_map[network['id']] = network
 
             client = self.os_admin.congress_client
             client.request_refresh(self.datasource_id)
             time.sleep(1)
 
-            network_schema = (client.show_datasource_table_schema(
-                self.datasource_id, 'networks')['columns'])
-
             results = (client.list_datasource_rows(
                 self.datasource_id, 'networks'))
-            for row in results['results']:
-                network_row = network_map[row['data'][0]]
-                for index in range(len(network_schema)):
-                    if (str(row['data'][index]) !=
-                            str(network_row[network_schema[index]['name']])):
-                        return False
-            return True
-
-        if not test_utils.call_until_true(func=_check_data,
-                                          duration=200, sleep_for=10):
+            diff = comparison.update(results['results'],
+                                     networks['networks'])
+            if not diff.matches:
+                LOG.debug('Congress networks table mismatch: %s', diff)
+            return diff.matches
+
+        if not self.call_until_datasource_converged(
+                func=_check_data,
+                duration=200, max_interval=10):
             raise exceptions.TimeoutException("Data did not converge in time "
                                               "or failure in server")
 
@@ -95,16 +95,16 @@ class TestNeutronV2Driver(manager_congress.ScenarioPolicyBase):
     @utils.services('network')
     def test_neutronv2_ports_tables(self):
         port_schema = (
-            self.os_admin.congress_client.show_datasource_table_schema(
-                self.datasource_id, 'ports')['columns'])
+            self.os_admin.congress_client.get_datasource_table_schema(
+                self.datasource_id, 'ports'))
 
         port_sec_binding_schema = (
-            self.os_admin.congress_client.show_datasource_table_schema(
-                self.datasource_id, 'security_group_port_bindings')['columns'])
+            self.os_admin.congress_client.get_datasource_table_schema(
+                self.datasource_id, 'security_group_port_bindings'))
 
         fixed_ips_schema = (
-            self.os_admin.congress_client.show_datasource_table_schema(
-                self.datasource_id, 'fixed_ips')['columns'])
+            self.os_admin.congress_client.get_datasource_table_schema(
+                self.datasource_id, 'fixed_ips'))
 
         @helper.retry_on_exception
         def _check_data():
@@ -117,15 +117,12 @@ class TestNeutronV2Driver(manager_congress.ScenarioPolicyBase):
             client.request_refresh(self.datasource_id)
             time.sleep(1)
 
-            ports = (client.list_datasource_rows(self.datasource_id, 'ports'))
-            security_group_port_bindings = (
-                client.list_datasource_rows(
-                    self.datasource_id, 'security_group_port_bindings'))
-            fixed_ips = (
-                client.list_datasource_rows(self.datasource_id, 'fixed_ips'))
+            tables = client.list_datasource_rows_bulk(
+                self.datasource_id,
+                ['ports', 'security_group_port_bindings', 'fixed_ips'])
 
             # Validate ports table
-            for row in ports['results']:
+            for row in tables['ports']:
                 port_row = port_map[row['data'][0]]
                 for index in range(len(port_schema)):
                     if (str(row['data'][index]) !=
@@ -133,7 +130,7 @@ class TestNeutronV2Driver(manager_congress.ScenarioPolicyBase):
                         return False
 
             # validate security_group_port_bindings table
-            for row in security_group_port_bindings['results']:
+            for row in tables['security_group_port_bindings']:
                 port_row = port_map[row['data'][0]]
                 for index in range(len(port_sec_binding_schema)):
                     row_index = port_sec_binding_schema[index]['name']
@@ -148,7 +145,7 @@ class TestNeutronV2Driver(manager_congress.ScenarioPolicyBase):
                             return False
 
             # validate fixed_ips
-            for row in fixed_ips['results']:
+            for row in tables['fixed_ips']:
                 port_row = port_map[row['data'][0]]
                 for index in range(len(fixed_ips_schema)):
                     row_index = fixed_ips_schema[index]['name']
@@ -163,8 +160,9 @@ class TestNeutronV2Driver(manager_congress.ScenarioPolicyBase):
                             return False
             return True
 
-        if not test_utils.call_until_true(func=_check_data,
-                                          duration=200, sleep_for=10):
+        if not self.call_until_datasource_converged(
+                func=_check_data,
+                duration=200, max_interval=10):
             raise exceptions.TimeoutException("Data did not converge in time "
                                               "or failure in server")
 
@@ -172,20 +170,20 @@ class TestNeutronV2Driver(manager_congress.ScenarioPolicyBase):
     @utils.services('network')
     def test_neutronv2_subnets_tables(self):
         subnet_schema = (
-            self.os_admin.congress_client.show_datasource_table_schema(
-                self.datasource_id, 'subnets')['columns'])
+            self.os_admin.congress_client.get_datasource_table_schema(
+                self.datasource_id, 'subnets'))
 
         host_routes_schema = (
-            self.os_admin.congress_client.show_datasource_table_schema(
-                self.datasource_id, 'host_routes')['columns'])
+            self.os_admin.congress_client.get_datasource_table_schema(
+                self.datasource_id, 'host_routes'))
 
         dns_nameservers_schema = (
-            self.os_admin.congress_client.show_datasource_table_schema(
-                self.datasource_id, 'dns_nameservers')['columns'])
+            self.os_admin.congress_client.get_datasource_table_schema(
+                self.datasource_id, 'dns_nameservers'))
 
         allocation_pools_schema = (
-            self.os_admin.congress_client.show_datasource_table_schema(
-                self.datasource_id, 'allocation_pools')['columns'])
+            self.os_admin.congress_client.get_datasource_table_schema(
+                self.datasource_id, 'allocation_pools'))
 
         @helper.retry_on_exception
         def _check_data():
@@ -198,18 +196,12 @@ class TestNeutronV2Driver(manager_congress.ScenarioPolicyBase):
             client.request_refresh(self.datasource_id)
             time.sleep(1)
 
-            subnets = (
-                client.list_datasource_rows(self.datasource_id, 'subnets'))
-            host_routes = (
-                client.list_datasource_rows(self.datasource_id, 'host_routes'))
-            dns_nameservers = (
-                client.list_datasource_rows(
-                    self.datasource_id, 'dns_nameservers'))
-            allocation_pools = (
-                client.list_datasource_rows(
-                    self.datasource_id, 'allocation_pools'))
+            tables = client.list_datasource_rows_bulk(
+                self.datasource_id,
+                ['subnets', 'host_routes', 'dns_nameservers',
+                 'allocation_pools'])
             # Validate subnets table
-            for row in subnets['results']:
+            for row in tables['subnets']:
                 subnet_row = subnet_map[row['data'][0]]
                 for index in range(len(subnet_schema)):
                     if (str(row['data'][index]) !=
@@ -217,7 +209,7 @@ class TestNeutronV2Driver(manager_congress.ScenarioPolicyBase):
                         return False
 
             # validate dns_nameservers
-            for row in dns_nameservers['results']:
+            for row in tables['dns_nameservers']:
                 subnet_row = subnet_map[row['data'][0]]
                 for index in range(len(dns_nameservers_schema)):
                     row_index = dns_nameservers_schema[index]['name']
@@ -227,7 +219,7 @@ class TestNeutronV2Driver(manager_congress.ScenarioPolicyBase):
                             return False
 
             # validate host_routes
-            for row in host_routes['results']:
+            for row in tables['host_routes']:
                 subnet_row = subnet_map[row['data'][0]]
                 for index in range(len(host_routes_schema)):
                     row_index = host_routes_schema[index]['name']
@@ -242,7 +234,7 @@ class TestNeutronV2Driver(manager_congress.ScenarioPolicyBase):
                             return False
 
             # validate allocation_pools
-            for row in allocation_pools['results']:
+            for row in tables['allocation_pools']:
                 subnet_row = subnet_map[row['data'][0]]
                 for index in range(len(allocation_pools_schema)):
                     row_index = allocation_pools_schema[index]['name']
@@ -258,8 +250,9 @@ class TestNeutronV2Driver(manager_congress.ScenarioPolicyBase):
                             return False
             return True
 
-        if not test_utils.call_until_true(func=_check_data,
-                                          duration=200, sleep_for=10):
+        if not self.call_until_datasource_converged(
+                func=_check_data,
+                duration=200, max_interval=10):
             raise exceptions.TimeoutException("Data did not converge in time "
                                               "or failure in server")
 
@@ -267,12 +260,12 @@ class TestNeutronV2Driver(manager_congress.ScenarioPolicyBase):
     @utils.services('network')
     def test_neutronv2_routers_tables(self):
         router_schema = (
-            self.os_admin.congress_client.show_datasource_table_schema(
-                self.datasource_id, 'routers')['columns'])
+            self.os_admin.congress_client.get_datasource_table_schema(
+                self.datasource_id, 'routers'))
 
         ext_gw_info_schema = (
-            self.os_admin.congress_client.show_datasource_table_schema(
-                self.datasource_id, 'external_gateway_infos')['columns'])
+            self.os_admin.congress_client.get_datasource_table_schema(
+                self.datasource_id, 'external_gateway_infos'))
 
         @helper.retry_on_exception
         def _check_data():
@@ -285,15 +278,11 @@ class TestNeutronV2Driver(manager_congress.ScenarioPolicyBase):
             client.request_refresh(self.datasource_id)
             time.sleep(1)
 
-            routers = (
-                client.list_datasource_rows(self.datasource_id, 'routers'))
-
-            ext_gw_info = (
-                client.list_datasource_rows(
-                    self.datasource_id, 'external_gateway_infos'))
+            tables = client.list_datasource_rows_bulk(
+                self.datasource_id, ['routers', 'external_gateway_infos'])
 
             # Validate routers table
-            for row in routers['results']:
+            for row in tables['routers']:
                 router_row = router_map[row['data'][0]]
                 for index in range(len(router_schema)):
                     if (str(row['data'][index]) !=
@@ -301,7 +290,7 @@ class TestNeutronV2Driver(manager_congress.ScenarioPolicyBase):
                         return False
 
             # validate external_gateway_infos
-            for row in ext_gw_info['results']:
+            for row in tables['external_gateway_infos']:
                 router_ext_gw_info = (
                     router_map[row['data'][0]]['external_gateway_info'])
                 # populate router_id
@@ -312,8 +301,9 @@ class TestNeutronV2Driver(manager_congress.ScenarioPolicyBase):
                         return False
             return True
 
-        if not test_utils.call_until_true(func=_check_data,
-                                          duration=200, sleep_for=10):
+        if not self.call_until_datasource_converged(
+                func=_check_data,
+                duration=200, max_interval=10):
             raise exceptions.TimeoutException("Data did not converge in time "
                                               "or failure in server")
 
@@ -321,16 +311,15 @@ class TestNeutronV2Driver(manager_congress.ScenarioPolicyBase):
     @utils.services('network')
     def test_neutronv2_security_groups_table(self):
         sg_schema = (
-            self.os_admin.congress_client.show_datasource_table_schema(
-                self.datasource_id, 'security_groups')['columns'])
+            self.os_admin.congress_client.get_datasource_table_schema(
+                self.datasource_id, 'security_groups'))
+        comparison = table_compare.IncrementalComparison(
+            table_compare.TableComparator(sg_schema), subset=True)
 
         @helper.retry_on_exception
         def _check_data():
             client = self.security_groups_client
             security_groups_neutron = client.list_security_groups()
-            security_groups_map = {}
-            for security_group in security_groups_neutron['security_groups']:
-                security_groups_map[security_group['id']] = security_group
 
             client = self.os_admin.congress_client
             client.request_refresh(self.datasource_id)
@@ -341,16 +330,17 @@ class TestNeutronV2Driver(manager_congress.ScenarioPolicyBase):
                     self.datasource_id, 'security_groups'))
 
             # Validate security_group table
-            for row in security_groups['results']:
-                sg_row = security_groups_map[row['data'][0]]
-                for index in range(len(sg_schema)):
-                    if (str(row['data'][index]) !=
-                            str(sg_row[sg_schema[index]['name']])):
-                        return False
-            return True
-
-        if not test_utils.call_until_true(func=_check_data,
-                                          duration=200, sleep_for=10):
+            diff = comparison.update(
+                security_groups['results'],
+                security_groups_neutron['security_groups'])
+            if not diff.matches:
+                LOG.debug('Congress security_groups table mismatch: %s',
+                          diff)
+            return diff.matches
+
+        if not self.call_until_datasource_converged(
+                func=_check_data,
+                duration=200, max_interval=10):
             raise exceptions.TimeoutException("Data did not converge in time "
                                               "or failure in server")
 
@@ -358,17 +348,17 @@ class TestNeutronV2Driver(manager_congress.ScenarioPolicyBase):
     @utils.services('network')
     def test_neutronv2_security_group_rules_table(self):
         sgrs_schema = (
-            self.os_admin.congress_client.show_datasource_table_schema(
-                self.datasource_id, 'security_group_rules')['columns'])
+            self.os_admin.congress_client.get_datasource_table_schema(
+                self.datasource_id, 'security_group_rules'))
+        comparison = table_compare.IncrementalComparison(
+            table_compare.TableComparator(sgrs_schema), subset=True)
 
         @helper.retry_on_exception
         def _check_data():
             client = self.security_groups_client
             security_groups_neutron = client.list_security_groups()
-            sgrs_map = {}  # security_group_rules
-            for sg in security_groups_neutron['security_groups']:
-                for sgr in sg['security_group_rules']:
-                    sgrs_map[sgr['id']] = sgr
+            sgrs = [sgr for sg in security_groups_neutron['security_groups']
+                    for sgr in sg['security_group_rules']]
 
             client = self.os_admin.congress_client
             client.request_refresh(self.datasource_id)
@@ -379,16 +369,15 @@ class TestNeutronV2Driver(manager_congress.ScenarioPolicyBase):
                     self.datasource_id, 'security_group_rules'))
 
             # Validate security_group_rules table
-            for row in security_group_rules['results']:
-                sg_rule_row = sgrs_map[row['data'][1]]
-                for index in range(len(sgrs_schema)):
-                    if (str(row['data'][index]) !=
-                            str(sg_rule_row[sgrs_schema[index]['name']])):
-                        return False
-            return True
-
-        if not test_utils.call_until_true(func=_check_data,
-                                          duration=200, sleep_for=10):
+            diff = comparison.update(security_group_rules['results'], sgrs)
+            if not diff.matches:
+                LOG.debug('Congress security_group_rules table mismatch: %s',
+                          diff)
+            return diff.matches
+
+        if not self.call_until_datasource_converged(
+                func=_check_data,
+                duration=200, max_interval=10):
             raise exceptions.TimeoutException("Data did not converge in time "
                                               "or failure in server")
 
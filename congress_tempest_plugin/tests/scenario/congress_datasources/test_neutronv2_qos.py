@@ -136,20 +136,20 @@ class TestNeutronV2QosDriver(manager_congress.ScenarioPolicyBase):
     @tempest_utils.services('network')
     def test_neutronv2_ports_tables(self):
         port_schema = (
-            self.os_admin.congress_client.show_datasource_table_schema(
-                self.datasource_id, 'ports')['columns'])
+            self.os_admin.congress_client.get_datasource_table_schema(
+                self.datasource_id, 'ports'))
 
         port_qos_binding_schema = (
-            self.os_admin.congress_client.show_datasource_table_schema(
-                self.datasource_id, 'qos_policy_port_bindings')['columns'])
+            self.os_admin.congress_client.get_datasource_table_schema(
+                self.datasource_id, 'qos_policy_port_bindings'))
 
         qos_policy_schema = (
-            self.os_admin.congress_client.show_datasource_table_schema(
-                self.datasource_id, 'policies')['columns'])
+            self.os_admin.congress_client.get_datasource_table_schema(
+                self.datasource_id, 'policies'))
 
         qos_rule_schema = (
-            self.os_admin.congress_client.show_datasource_table_schema(
-                self.datasource_id, 'rules')['columns'])
+            self.os_admin.congress_client.get_datasource_table_schema(
+                self.datasource_id, 'rules'))
 
         @helper.retry_on_exception
         def _check_data_for_port():
@@ -229,13 +229,15 @@ class TestNeutronV2QosDriver(manager_congress.ScenarioPolicyBase):
                             return False
             return True
 
-        if not test_utils.call_until_true(func=_check_data_for_port,
-                                          duration=200, sleep_for=10):
+        if not self.call_until_datasource_converged(
+                func=_check_data_for_port,
+                duration=200, max_interval=10):
             raise exceptions.TimeoutException("Data did not converge in time "
                                               "or failure in server")
 
-        if not test_utils.call_until_true(func=_check_data_for_qos,
-                                          duration=200, sleep_for=10):
+        if not self.call_until_datasource_converged(
+                func=_check_data_for_qos,
+                duration=200, max_interval=10):
             raise exceptions.TimeoutException("Data did not converge in time "
                                               "or failure in server")
 
@@ -63,8 +63,8 @@ class TestNovaDriver(manager_congress.ScenarioPolicyBase):
     @utils.services('compute', 'network')
     def test_nova_datasource_driver_servers(self):
         server_schema = (
-            self.os_admin.congress_client.show_datasource_table_schema(
-                self.datasource_id, 'servers')['columns'])
+            self.os_admin.congress_client.get_datasource_table_schema(
+                self.datasource_id, 'servers'))
 
         # Convert some of the column names.
 
@@ -111,8 +111,9 @@ class TestNovaDriver(manager_congress.ScenarioPolicyBase):
                     return True
             return False
 
-        if not test_utils.call_until_true(func=_check_data_table_nova_servers,
-                                          duration=100, sleep_for=5):
+        if not self.call_until_datasource_converged(
+                func=_check_data_table_nova_servers,
+                duration=100, max_interval=5):
             raise exceptions.TimeoutException("Data did not converge in time "
                                               "or failure in server")
 
@@ -123,8 +124,8 @@ class TestNovaDriver(manager_congress.ScenarioPolicyBase):
         'test checks nova server addresses added in stein')
     def test_nova_datasource_driver_servers_addresses(self):
         server_addresses_schema = (
-            self.os_admin.congress_client.show_datasource_table_schema(
-                self.datasource_id, 'servers.addresses')['columns'])
+            self.os_admin.congress_client.get_datasource_table_schema(
+                self.datasource_id, 'servers.addresses'))
 
         def convert_col(col):
             if col == 'server_id':
@@ -187,9 +188,9 @@ class TestNovaDriver(manager_congress.ScenarioPolicyBase):
             if match:
                 return True
             return False
-        if not test_utils.call_until_true(
+        if not self.call_until_datasource_converged(
                 func=_check_data_table_nova_servers_addresses,
-                duration=100, sleep_for=5):
+                duration=100, max_interval=5):
             raise exceptions.TimeoutException("Data did not converge in time "
                                               "or failure in server")
 
@@ -227,8 +228,9 @@ class TestNovaDriver(manager_congress.ScenarioPolicyBase):
                     return True
             return False
 
-        if not test_utils.call_until_true(func=_check_data_table_nova_flavors,
-                                          duration=100, sleep_for=5):
+        if not self.call_until_datasource_converged(
+                func=_check_data_table_nova_flavors,
+                duration=100, max_interval=5):
             raise exceptions.TimeoutException("Data did not converge in time "
                                               "or failure in server")
 
@@ -132,7 +132,7 @@ class TestVitrageDriver(manager_congress.ScenarioPolicyBase):
                         u'OK',
                         u'nova.instance']
 
-        if results['results'][0]['data'] != expected_row:
+        if list(results['results'][0]['data']) != expected_row:
             msg = ('inserted row %s is not expected row %s'
                    % (results['results'][0]['data'], expected_row))
             raise exceptions.InvalidStructure(msg)
@@ -159,7 +159,7 @@ class TestVitrageDriver(manager_congress.ScenarioPolicyBase):
                         u'OK',
                         u'nova.instance']
 
-        if results['results'][0]['data'] != expected_row:
+        if list(results['results'][0]['data']) != expected_row:
             msg = ('inserted row %s is not expected row %s'
                    % (results['results'][0]['data'], expected_row))
             raise exceptions.InvalidStructure(msg)
@@ -182,7 +182,8 @@ class TestVitrageDriver(manager_congress.ScenarioPolicyBase):
             elif len(rows) > 1:
                 LOG.debug('Too many rows: %s', rows)
                 return False
-            elif rows[0]['data'] != ['Instance memory performance degraded']:
+            elif (list(rows[0]['data']) !=
+                    ['Instance memory performance degraded']):
                 LOG.debug('Incorrect row data: %s', rows[0]['data'])
                 return False
             return True
@@ -209,7 +210,8 @@ class TestVitrageDriver(manager_congress.ScenarioPolicyBase):
             elif len(rows) > 1:
                 LOG.debug('Too many rows: %s', rows)
                 return False
-            elif rows[0]['data'] != ['Instance memory performance degraded']:
+            elif (list(rows[0]['data']) !=
+                    ['Instance memory performance degraded']):
                 LOG.debug('Incorrect row data: %s', rows[0]['data'])
                 return False
             return True
@@ -128,7 +128,8 @@ class TestHA(manager_congress.ScenarioPolicyBase):
         auth_prov = tempestmanager.get_auth_provider(creds)
         return policy_client.PolicyClient(
             auth_prov, client_type,
-            CONF.identity.region)
+            CONF.identity.region,
+            **manager_congress.congress_client_options())
 
     def _check_replica_server_status(self, client):
         try:
@@ -143,17 +144,18 @@ class TestHA(manager_congress.ScenarioPolicyBase):
                 exceptions.UnexpectedResponseCode):
             LOG.debug("Replica server not ready")
             return False
+        except policy_client.CircuitOpenError as e:
+            LOG.debug("Replica server still down: %s", e)
+            return False
         except Exception:
             raise
         return False
 
     def find_fake(self, client):
-        datasources = client.list_datasources()
-        for r in datasources['results']:
-            if r['name'] == 'fake':
-                LOG.debug('existing fake driver: %s', str(r['id']))
-                return r['id']
-        return None
+        fake_id = client.get_datasource_id('fake')
+        if fake_id is not None:
+            LOG.debug('existing fake driver: %s', str(fake_id))
+        return fake_id
 
     def _check_resource_exists(self, client, resource):
         try:
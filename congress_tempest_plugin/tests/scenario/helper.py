@@ -13,18 +13,36 @@
 #    under the License.
 #
 
+import asyncio
 import os
+import random
+import threading
+import time
 
+from oslo_log import log as logging
 import tenacity
 
+from congress_tempest_plugin.services.policy import async_policy_client
+
+LOG = logging.getLogger(__name__)
+
 
 def retry_check_function_return_value_condition(
         f, check_condition, error_msg=None, retry_interval=1,
         retry_attempts=20):
-    """Check if function f returns value s.t check_condition(value) is True."""
+    """Check if function f returns value s.t check_condition(value) is True.
+
+    f is called up to retry_attempts times.  Waits between attempts start
+    fast and back off exponentially (with jitter) up to retry_interval.
+    """
+
+    wait = (tenacity.wait_exponential(multiplier=retry_interval / 8.0,
+                                      max=retry_interval) +
+            tenacity.wait_random(0, retry_interval / 10.0))
 
-    @tenacity.retry(stop=tenacity.stop_after_attempt(retry_attempts),
-                    wait=tenacity.wait_fixed(retry_interval))
+    @tenacity.retry(
+        stop=tenacity.stop_after_attempt(retry_attempts),
+        wait=wait)
     def retried_function():
         r = f()
         if not check_condition(r):
@@ -54,6 +72,169 @@ def retry_on_exception(f):
     return wrapper
 
 
+class ConvergenceStats(object):
+    """Time-to-converge records of the checks run in this process."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.records = []
+
+    def record(self, name, elapsed, attempts, converged):
+        with self._lock:
+            self.records.append({'name': name, 'elapsed': elapsed,
+                                 'attempts': attempts,
+                                 'converged': converged})
+
+    def summary(self):
+        """Aggregate the records per check name."""
+        summary = {}
+        with self._lock:
+            for r in self.records:
+                s = summary.setdefault(r['name'], {
+                    'count': 0, 'failures': 0, 'total_time': 0.0,
+                    'max_time': 0.0, 'max_attempts': 0})
+                s['count'] += 1
+                s['failures'] += 0 if r['converged'] else 1
+                s['total_time'] += r['elapsed']
+                s['max_time'] = max(s['max_time'], r['elapsed'])
+                s['max_attempts'] = max(s['max_attempts'], r['attempts'])
+        for s in summary.values():
+            s['mean_time'] = s['total_time'] / s['count']
+        return summary
+
+
+CONVERGENCE_STATS = ConvergenceStats()
+
+
+def _probe(update_probe, default=None):
+    try:
+        return update_probe()
+    except Exception:
+        LOG.debug('update probe failed', exc_info=True)
+        return default
+
+
+def _wait_for_update(update_probe, marker, timeout, poll_interval):
+    """Sleep up to timeout seconds, returning early if the probe changes."""
+    if update_probe is None:
+        time.sleep(timeout)
+        return marker
+    end = time.time() + timeout
+    while True:
+        remaining = end - time.time()
+        if remaining <= 0:
+            return marker
+        time.sleep(min(poll_interval, remaining))
+        value = _probe(update_probe, marker)
+        if value != marker:
+            return value
+
+
+def call_until_converged(func, duration=100, max_interval=5,
+                         initial_interval=0.5, fast_probes=3, backoff=2.0,
+                         jitter=0.2, update_probe=None,
+                         update_poll_interval=1, name=None):
+    """Call func until it returns True or duration seconds elapse.
+
+    Adaptive replacement for tempest's call_until_true: the first
+    fast_probes retries are initial_interval seconds apart, then the wait
+    grows by backoff up to max_interval, with +/- jitter.  If update_probe
+    is given (see datasource_update_probe), it is polled every
+    update_poll_interval seconds while waiting and func is retried as soon
+    as its value changes.  The time to converge is recorded in
+    CONVERGENCE_STATS under name.
+
+    :returns: True if func returned True in time, False otherwise.
+    """
+    name = name or getattr(func, '__name__', repr(func))
+    start = time.time()
+    deadline = start + duration
+    interval = initial_interval
+    attempts = 0
+    marker = _probe(update_probe) if update_probe else None
+    while True:
+        attempts += 1
+        if func():
+            converged = True
+            break
+        now = time.time()
+        if now >= deadline:
+            converged = False
+            break
+        if attempts > fast_probes:
+            interval = min(interval * backoff, max_interval)
+        wait = interval * (1 + random.uniform(-jitter, jitter))
+        marker = _wait_for_update(update_probe, marker,
+                                  min(wait, deadline - now),
+                                  update_poll_interval)
+    elapsed = time.time() - start
+    CONVERGENCE_STATS.record(name, elapsed, attempts, converged)
+    LOG.debug('%s %s after %.2fs and %d attempts', name,
+              'converged' if converged else 'did not converge',
+              elapsed, attempts)
+    return converged
+
+
+def datasource_update_probe(client, datasource):
+    """Return a probe for the update counter of a datasource."""
+    return lambda: client.list_datasource_status(
+        datasource)['number_of_updates']
+
+
+class DatasourceSweep(object):
+    """Run a check on every datasource concurrently across retries.
+
+    Each call lists the datasources and runs check(client, datasource) for
+    those that have not passed yet, gathered on an AsyncPolicyClient so
+    that at most max_workers of them are in flight, and returns True once
+    all of them have passed.  Datasources that passed on an earlier call
+    are not probed again.  A check raising an exception counts as not
+    passed, and a failure to list the datasources as a call where none
+    passed.  Meant to be used with call_until_true.
+    """
+
+    def __init__(self, client, check, max_workers=None):
+        self.client = client
+        self.check = check
+        self.max_workers = max_workers or client.bulk_workers
+        self.passed = set()
+
+    def _probe(self, datasource):
+        try:
+            return bool(self.check(self.client, datasource))
+        except Exception as e:
+            LOG.debug('check of datasource %s failed: %s',
+                      datasource['name'], e)
+            return False
+
+    async def _sweep(self):
+        async with async_policy_client.AsyncPolicyClient.from_client(
+                self.client, max_concurrency=self.max_workers) as client:
+            try:
+                datasources = (await client.list_datasources())['results']
+            except Exception as e:
+                LOG.debug('listing datasources failed: %s', e)
+                return None
+            pending = dict((ds['id'], ds) for ds in datasources
+                           if ds['id'] not in self.passed)
+            results = await client.gather_map(
+                lambda ds_id: client.run(self._probe, pending[ds_id]),
+                pending)
+        return pending, results
+
+    def __call__(self):
+        outcome = asyncio.run(self._sweep())
+        if outcome is None:
+            return False
+        pending, results = outcome
+        self.passed.update(ds_id for ds_id, ok in results.items() if ok)
+        stragglers = sorted(pending[ds_id]['name']
+                            for ds_id, ok in results.items() if not ok)
+        if stragglers:
+            LOG.debug('datasources not ready yet: %s', stragglers)
+        return not stragglers
+
+
 def root_path():
     """Return path to root of source code."""
     x = os.path.realpath(__file__)
@@ -18,22 +18,26 @@ import collections
 import random
 import re
 import string
+import time
 
 from oslo_log import log as logging
 from tempest.common import credentials_factory as credentials
 from tempest import config
 from tempest.lib.common.utils import data_utils
-from tempest.lib.common.utils import test_utils
 from tempest.lib import decorators
 from tempest.lib import exceptions
 from tempest import manager as tempestmanager
+from testtools import content
 
 from congress_tempest_plugin.services.congress_network import qos_client
 from congress_tempest_plugin.services.congress_network import qos_rule_client
+from congress_tempest_plugin.services.policy import instrumentation
 from congress_tempest_plugin.services.policy import policy_client
+from congress_tempest_plugin.services.policy import replicated_client
 # use local copy of tempest scenario manager during upstream refactoring
 from congress_tempest_plugin.tests.scenario import helper
 from congress_tempest_plugin.tests.scenario import manager
+from congress_tempest_plugin.tests.scenario import table_compare
 
 CONF = config.CONF
 LOG = logging.getLogger(__name__)
@@ -43,11 +47,28 @@ Floating_IP_tuple = collections.namedtuple('Floating_IP_tuple',
 
 
 def get_datasource_id(client, name):
-    datasources = client.list_datasources()
-    for datasource in datasources['results']:
-        if datasource['name'] == name:
-            return datasource['id']
-    raise Exception("Datasource %s not found." % name)
+    datasource_id = client.get_datasource_id(name)
+    if datasource_id is None:
+        raise Exception("Datasource %s not found." % name)
+    return datasource_id
+
+
+def congress_client_options():
+    """Keyword arguments for PolicyClient built from the [congress] group."""
+    return {
+        'persistent_connections': CONF.congress.persistent_connections,
+        'pool_size': CONF.congress.connection_pool_size,
+        'bulk_workers': CONF.congress.bulk_request_workers,
+        'datasource_cache_ttl': CONF.congress.datasource_cache_ttl,
+        'prefetch_schemas': CONF.congress.prefetch_datasource_schemas,
+        'response_cache_size': CONF.congress.response_cache_size,
+        'compact_rows': CONF.congress.compact_rows,
+        'codec': CONF.congress.json_codec,
+        'retries': CONF.congress.request_retries,
+        'retry_backoff': CONF.congress.request_retry_backoff,
+        'breaker_threshold': CONF.congress.circuit_breaker_threshold,
+        'breaker_reset': CONF.congress.circuit_breaker_reset,
+    }
 
 
 # Note: these tests all use neutron today so we mix with that.
@@ -60,11 +81,41 @@ class ScenarioPolicyBase(manager.NetworkScenarioTest):
         auth_prov = tempestmanager.get_auth_provider(creds)
         cls.setup_required_clients(auth_prov)
 
+    def setUp(self):
+        super(ScenarioPolicyBase, self).setUp()
+        scope = instrumentation.REQUEST_METRICS.open_scope()
+        # registered first so it runs last, after the other cleanups
+        self.addCleanup(self._attach_request_report, scope)
+
+    def _attach_request_report(self, scope):
+        instrumentation.REQUEST_METRICS.close_scope(scope)
+        if scope.endpoints:
+            self.addDetail('congress-request-report',
+                           content.json_content(scope.report()))
+
     @classmethod
     def setup_required_clients(cls, auth_prov):
+        if CONF.congress.request_report_file:
+            instrumentation.write_report_at_exit(
+                CONF.congress.request_report_file)
         # Get congress client
         cls.os_admin.congress_client = policy_client.PolicyClient(
-            auth_prov, "policy", CONF.identity.region)
+            auth_prov, "policy", CONF.identity.region,
+            **congress_client_options())
+        cls.os_admin.congress_replicated_client = None
+        cls.os_admin.congress_replica_clients = []
+        endpoints = CONF.congressha.pe_replica_endpoints or None
+        if endpoints or CONF.congressha.discover_replicas:
+            replicated = replicated_client.ReplicatedPolicyClient(
+                auth_prov, "policy", CONF.identity.region,
+                endpoints=endpoints,
+                strategy=CONF.congressha.replica_balancing,
+                **congress_client_options())
+            # a single discovered endpoint may balance over the replicas,
+            # it is sampled instead
+            if endpoints or len(replicated.replicas) > 1:
+                cls.os_admin.congress_replicated_client = replicated
+                cls.os_admin.congress_replica_clients = replicated.replicas
 
         cls.os_admin.qos_client = qos_client.QosPoliciesClient(
             auth_prov, "network", CONF.identity.region)
@@ -88,6 +139,20 @@ class ScenarioPolicyBase(manager.NetworkScenarioTest):
             cls.os_admin.mistral_client = mistral_client.MistralClientV2(
                 auth_prov, 'workflowv2')
 
+    @classmethod
+    def resource_cleanup(cls):
+        LOG.debug('Congress client request stats: %s',
+                  cls.os_admin.congress_client.get_request_stats())
+        LOG.debug('Congress endpoint metrics: %s',
+                  cls.os_admin.congress_client.get_endpoint_report())
+        replicated = cls.os_admin.congress_replicated_client
+        if replicated:
+            LOG.debug('Congress replica latency: %s',
+                      replicated.get_replica_latency())
+        LOG.debug('Convergence stats: %s',
+                  helper.CONVERGENCE_STATS.summary())
+        super(ScenarioPolicyBase, cls).resource_cleanup()
+
     def _setup_network_and_servers(self):
         self.security_group = self._create_security_group()
         self.network, self.subnet, self.router = self.create_networks()
@@ -142,6 +207,91 @@ class ScenarioPolicyBase(manager.NetworkScenarioTest):
                       'error. Full status: %s', datasource_name, ds_status)
             return False
 
+    def call_until_datasource_converged(self, func, duration=100,
+                                        max_interval=5, datasource=None):
+        """Retry func adaptively until it returns True or time runs out.
+
+        func is also retried as soon as the datasource (self.datasource_id
+        by default) reports a new update.  Returns like call_until_true.
+        """
+        if datasource is None:
+            datasource = self.datasource_id
+        return helper.call_until_converged(
+            func, duration=duration, max_interval=max_interval,
+            update_probe=helper.datasource_update_probe(
+                self.os_admin.congress_client, datasource),
+            name='%s:%s' % (self.id(), getattr(func, '__name__', 'check')))
+
+    def _replica_clients(self):
+        """Return one client per policy engine replica to check.
+
+        Without explicit replica endpoints, the catalog endpoint (which
+        balances over the replicas) is read replica_sync_samples times.
+        This is weaker: the samples may all reach the same replicas, so
+        agreeing samples do not prove every replica is in sync.
+        """
+        if self.os_admin.congress_replica_clients:
+            return self.os_admin.congress_replica_clients
+        LOG.warning('[congressha] pe_replica_endpoints is not set, replica '
+                    'sync is checked by sampling the catalog endpoint, '
+                    'which does not cover every replica')
+        return ([self.os_admin.congress_client] *
+                CONF.congressha.replica_sync_samples)
+
+    @staticmethod
+    def _replica_snapshot(client, policy_name, table):
+        rules = client.list_policy_rules(policy_name)['results']
+        rows = client.list_policy_rows(policy_name, table)['results']
+        return (frozenset(rule['rule'] for rule in rules),
+                frozenset(tuple(row['data']) for row in rows))
+
+    def wait_for_replica_sync(self, policy_name, table, condition=None,
+                              timeout=None):
+        """Wait until every policy engine replica agrees on a policy table.
+
+        Reads the rules of policy_name and the rows of table from every
+        replica and returns the rows (a set of tuples) once all replicas
+        report the same rules and rows and condition(rows) holds.  Fails as
+        soon as replicas with the same rules keep reporting different rows
+        without any change for replica_divergence_timeout seconds.
+        """
+        clients = self._replica_clients()
+        state = {'last': None, 'since': None, 'rows': None}
+
+        def _synced():
+            snapshots = policy_client.run_concurrently(
+                lambda i: self._replica_snapshot(clients[i], policy_name,
+                                                 table),
+                range(len(clients)))
+            snapshots = [snapshots[i] for i in range(len(clients))]
+            if len(set(snapshots)) == 1:
+                state['since'] = None
+                state['rows'] = snapshots[0][1]
+                return condition is None or condition(state['rows'])
+            now = time.time()
+            same_rules = len(set(rules for rules, _ in snapshots)) == 1
+            if not same_rules or snapshots != state['last']:
+                state['since'] = None
+            elif state['since'] is None:
+                state['since'] = now
+            elif (now - state['since'] >=
+                    CONF.congressha.replica_divergence_timeout):
+                self.fail('Policy engine replicas diverged on %s:%s: %s' %
+                          (policy_name, table,
+                           [sorted(rows) for _, rows in snapshots]))
+            state['last'] = snapshots
+            return False
+
+        if not helper.call_until_converged(
+                _synced,
+                duration=timeout or CONF.congressha.replica_sync_timeout,
+                max_interval=5,
+                name='replica_sync:%s:%s' % (policy_name, table)):
+            raise exceptions.TimeoutException(
+                'Policy engine replicas did not sync %s:%s in time' %
+                (policy_name, table))
+        return state['rows']
+
     def _create_server(self, name, network):
         keypair = self.create_keypair()
         self.keypairs[keypair['name']] = keypair
@@ -262,10 +412,12 @@ class ScenarioPolicyBase(manager.NetworkScenarioTest):
                                                          src=floating_ip))
                 raise
 
-    def _create_random_policy(self, prefix='nova'):
+    def _create_random_policy(self, prefix='nova', kind=None):
         policy_name = prefix + "_%s" % ''.join(
             random.choice(string.ascii_lowercase) for x in range(10))
         body = {"name": policy_name}
+        if kind:
+            body['kind'] = kind
         resp = self.os_admin.congress_client.create_policy(body)
         self.addCleanup(self.os_admin.congress_client.delete_policy,
                         resp['id'])
@@ -288,6 +440,22 @@ class ScenarioPolicyBase(manager.NetworkScenarioTest):
             raise Exception('Failed to create policy rule (%s, %s)'
                             % (policy_name, rule))
 
+    def _create_policy_rules(self, policy_name, rules):
+        """Create rules concurrently, with a single cleanup for all."""
+        client = self.os_admin.congress_client
+        created = None
+        try:
+            created = client.create_policy_rules_bulk(policy_name, rules)
+        except policy_client.BulkRequestError as e:
+            # still remove the rules that were created
+            created = list(e.results.values())
+            raise
+        finally:
+            if created:
+                self.addCleanup(client.delete_policy_rules_bulk, policy_name,
+                                [rule['id'] for rule in created])
+        return created
+
     def _create_policy_rule_retry(
             self, policy_name, rule, rule_name=None, comment=None):
         return helper.retry_check_function_return_value_condition(
@@ -304,10 +472,11 @@ class DatasourceDriverTestBase(ScenarioPolicyBase):
         if missing_attributes_allowed is None:
             missing_attributes_allowed = []
         table_schema = (
-            self.os_admin.congress_client.show_datasource_table_schema(
-                self.datasource_id, table_name)['columns'])
-        table_id_col = next(i for i, c in enumerate(table_schema)
-                            if c['name'] == 'id')
+            self.os_admin.congress_client.get_datasource_table_schema(
+                self.datasource_id, table_name))
+        comparison = table_compare.IncrementalComparison(
+            table_compare.TableComparator(
+                table_schema, missing_attributes_allowed))
 
         def _check_data():
             # Fetch data each time, because test may go before service has data
@@ -324,40 +493,16 @@ class DatasourceDriverTestBase(ScenarioPolicyBase):
                     self.datasource_id, table_name)['results'])
             LOG.debug('Congress %s table data: %s', table_name, table_data)
 
-            # check same cardinality
-            if len(service_data) != len(table_data):
-                LOG.debug('Cardinality mismatch between congress %s '
-                          'table and service data', table_name)
+            diff = comparison.update(table_data, service_data)
+            if not diff.matches:
+                LOG.debug('Congress %s table does not match service data '
+                          '(%d rows changed since last check): %s',
+                          table_name, comparison.last_delta, diff)
                 return False
-
-            # construct map from id to service data items
-            service_data_map = {}
-            for data_item in service_data:
-                service_data_map[data_item['id']] = data_item
-
-            for row in table_data:
-                try:
-                    service_item = service_data_map[row['data'][table_id_col]]
-                except KeyError:
-                    return False
-                for index in range(len(table_schema)):
-                    # case: key is not present in service_item, allow
-                    # if it is expected (sometimes an objects won't have key
-                    # when the value is not present, e.g. description not set)
-                    if (str(row['data'][index]) == 'None' and
-                            table_schema[index][
-                                'name'] in missing_attributes_allowed and
-                            table_schema[index]['name'] not in service_item):
-                        return True
-                    # normal case: service_item value must equal
-                    # congress table value
-                    if (str(row['data'][index]) !=
-                            str(service_item[table_schema[index]['name']])):
-                        return False
             return True
 
-        if not test_utils.call_until_true(
-                func=_check_data, duration=100, sleep_for=4):
+        if not self.call_until_datasource_converged(
+                func=_check_data, duration=100, max_interval=4):
             raise exceptions.TimeoutException("Data did not converge in time "
                                               "or failure in server")
 
@@ -375,42 +520,35 @@ class DatasourceDriverTestBase(ScenarioPolicyBase):
                     self.datasource_id, table_name)['results'])
             LOG.debug('Congress %s table data: %s', table_name, table_data)
 
-            # construct map from id to service data items
-            service_data_map = {}
-            for data_item in service_data:
-                service_data_map[data_item['id']] = data_item[
-                    service_subdata_attribute]
-
-            expected_number_of_rows = 0
-
-            for row in table_data:
-                row_id, row_data = row['data'][0], row['data'][1]
-                service_subdata = service_data_map.get(row_id)
-                if not service_subdata or row_data not in service_subdata:
-                    # congress table has item not in service data.
-                    LOG.debug('Congress %s table has row (%s, %s) not in '
-                              'service data', table_name, row_id, row_data)
-                    return False
-                expected_number_of_rows += len(service_subdata)
-
-            # check cardinality
-            if expected_number_of_rows != len(table_data):
-                LOG.debug('Cardinality mismatch between congress %s '
-                          'table and service data', table_name)
+            # rows are (id, value) pairs, one per value of the attribute
+            expected = (
+                (table_compare.normalize(data_item['id']),
+                 table_compare.normalize(value))
+                for data_item in service_data
+                for value in data_item.get(service_subdata_attribute) or ())
+            actual = (
+                (table_compare.normalize(row['data'][0]),
+                 table_compare.normalize(row['data'][1]))
+                for row in table_data)
+            diff = table_compare.diff_rows(actual, expected)
+            if not diff.matches:
+                LOG.debug('Congress %s table does not match service data: '
+                          '%s', table_name, diff)
                 return False
             return True
 
-        if not test_utils.call_until_true(
+        if not self.call_until_datasource_converged(
                 func=_check_data,
-                duration=100, sleep_for=5):
+                duration=100, max_interval=5):
             raise exceptions.TimeoutException("Data did not converge in time "
                                               "or failure in server")
 
     @decorators.attr(type='smoke')
     def test_update_no_error(self):
-        if not test_utils.call_until_true(
+        if not self.call_until_datasource_converged(
                 func=lambda: self.check_datasource_no_error(
                     self.datasource_name),
-                duration=30, sleep_for=5):
+                duration=30, max_interval=5,
+                datasource=self.datasource_name):
             raise exceptions.TimeoutException('Datasource could not poll '
                                               'without error.')
@@ -0,0 +1,344 @@
+# Copyright 2026 OpenStack Foundation
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Compare Congress table rows with the data of the source service.
+
+Rows on both sides are normalized once into hashable tuples of strings and
+counted, so two tables are compared as multisets in O(n) instead of cell by
+cell, duplicated rows included.
+"""
+
+import collections
+
+from congress_tempest_plugin.services.policy import rows as compact_rows
+
+
+class _Missing(object):
+    def __repr__(self):
+        return '<missing>'
+
+
+# Placeholder for an attribute the service item does not have.  It never
+# equals a normalized value, so such rows always show up as mismatches.
+MISSING = _Missing()
+
+
+def normalize(value):
+    """Normalize a cell the way Congress renders it (str(None) == 'None')."""
+    return str(value)
+
+
+def normalize_rows(rows):
+    """Return the Counter of the normalized tuples of Congress API rows."""
+    return collections.Counter(tuple(normalize(v) for v in row['data'])
+                               for row in rows)
+
+
+def _counted(rows):
+    if isinstance(rows, collections.Counter):
+        return rows
+    return collections.Counter(rows)
+
+
+class TableDiff(object):
+    """Structured differences between Congress rows and expected rows.
+
+    missing are expected rows absent from Congress, unexpected are Congress
+    rows absent from the expected data, both as Counters of the missing or
+    extra occurrences of each row.  When the table has a key column,
+    rows present on both sides with different values are reported in
+    changed as {key: {column: (congress_value, expected_value)}} instead.
+    """
+
+    def __init__(self, missing, unexpected, changed=None):
+        self.missing = missing
+        self.unexpected = unexpected
+        self.changed = changed or {}
+
+    @property
+    def matches(self):
+        return not (self.missing or self.unexpected or self.changed)
+
+    def __str__(self, limit=5):
+        if self.matches:
+            return 'no differences'
+        parts = []
+        for label, items in (('missing', self.missing),
+                             ('unexpected', self.unexpected),
+                             ('changed', self.changed)):
+            if items:
+                shown = sorted(items, key=str)[:limit]
+                if label == 'changed':
+                    count = len(items)
+                    shown = ['%s: %s' % (k, items[k]) for k in shown]
+                else:
+                    count = sum(items.values())
+                    shown = ['%s x%d' % (k, items[k]) if items[k] > 1
+                             else str(k) for k in shown]
+                parts.append('%d %s (%s%s)' % (
+                    count, label, ', '.join(shown),
+                    ', ...' if len(items) > limit else ''))
+        return '; '.join(parts)
+
+
+def diff_rows(actual, expected, columns=None, key_index=None):
+    """Diff two multisets of normalized row tuples.
+
+    :param actual: Counter (or iterable) of tuples read from Congress
+    :param expected: Counter (or iterable) of tuples built from the service
+        data
+    :param columns: column names, used to label changed values
+    :param key_index: index of a column identifying a row, if any
+    """
+    actual = _counted(actual)
+    expected = _counted(expected)
+    return _group_changes(expected - actual, actual - expected,
+                          columns=columns, key_index=key_index)
+
+
+def _discard_one(counter, row):
+    counter[row] -= 1
+    if counter[row] <= 0:
+        del counter[row]
+
+
+def _group_changes(missing, unexpected, columns=None, key_index=None):
+    """Pair missing and unexpected rows sharing a key into changed rows."""
+    changed = {}
+    if key_index is not None and missing and unexpected:
+        by_key = dict((row[key_index], row) for row in unexpected)
+        for row in list(missing):
+            other = by_key.get(row[key_index])
+            if other is None:
+                continue
+            changed[row[key_index]] = dict(
+                ((columns[i] if columns else i), (other[i], row[i]))
+                for i in range(len(row)) if row[i] != other[i])
+            _discard_one(missing, row)
+            _discard_one(unexpected, other)
+            if other not in unexpected:
+                del by_key[row[key_index]]
+    return TableDiff(missing, unexpected, changed)
+
+
+class TableComparator(object):
+    """Compare a Congress table with service items, one dict per row.
+
+    The column layout is resolved once from the table schema; each
+    comparison then normalizes every row and item once and diffs them as
+    multisets.
+    """
+
+    def __init__(self, columns, missing_attributes_allowed=None,
+                 key_column='id'):
+        self.columns = tuple(c['name'] for c in columns)
+        self.index = dict((name, i) for i, name in enumerate(self.columns))
+        self.key_index = self.index.get(key_column)
+        self.missing_allowed = frozenset(missing_attributes_allowed or ())
+
+    def _cell(self, item, name):
+        if name in item:
+            return normalize(item[name])
+        # An absent optional attribute shows up as None in Congress.
+        if name in self.missing_allowed:
+            return normalize(None)
+        return MISSING
+
+    def raw_row(self, item):
+        """Return the unnormalized values of an item, in column order."""
+        get = item.get
+        return tuple([get(name, MISSING) for name in self.columns])
+
+    def normalize_raw_row(self, raw):
+        return tuple(
+            MISSING if value is MISSING and name not in self.missing_allowed
+            else normalize(None if value is MISSING else value)
+            for name, value in zip(self.columns, raw))
+
+    def expected_rows(self, service_data):
+        return collections.Counter(
+            tuple(self._cell(item, name) for name in self.columns)
+            for item in service_data)
+
+    def diff(self, table_rows, service_data):
+        return diff_rows(normalize_rows(table_rows),
+                         self.expected_rows(service_data),
+                         columns=self.columns, key_index=self.key_index)
+
+
+# Marks the key of a row with unhashable values, keyed by its normalized
+# values instead.
+_NORMALIZED = object()
+
+
+def _raw_key(values):
+    """Key a row by its raw values followed by their types.
+
+    1, 1.0 and True are equal and hash alike, but are rendered differently;
+    the types keep them apart.  The key is flat, which makes it quicker to
+    compare than a pair of tuples.
+    """
+    return (*values, *map(type, values))
+
+
+def _raw_values(key):
+    return key[:len(key) // 2]
+
+
+class _PolledRows(object):
+    """Normalized rows of one side of a comparison, kept across polls.
+
+    Rows are counted by their raw (unnormalized) key, which is cheap to
+    build and hash; only the rows that were not in the previous poll are
+    normalized.
+    """
+
+    def __init__(self, normalize_key):
+        self._normalize_key = normalize_key
+        self._last = None
+        self._keys = collections.Counter()
+        self._rows = {}
+        # a normalized row may stand for several raw rows (1 and '1')
+        self._counts = collections.Counter()
+
+    def count(self, row):
+        return self._counts.get(row, 0)
+
+    def update(self, keys):
+        """Replace the rows by those of keys, a list of raw keys.
+
+        Returns the normalized rows whose count changed, or None when keys
+        are the rows of the previous poll.
+        """
+        # polls usually list the same rows in the same order, which is
+        # quicker to compare than to count
+        if keys == self._last:
+            return None
+        self._last = keys
+        keys = _count_keys(keys, self._normalize_key)
+        if keys == self._keys:
+            return None
+        changed = set()
+        for key, n in (self._keys - keys).items():
+            row = self._rows[key]
+            if key not in keys:
+                del self._rows[key]
+            self._counts[row] -= n
+            if self._counts[row] <= 0:
+                del self._counts[row]
+            changed.add(row)
+        for key, n in (keys - self._keys).items():
+            row = self._rows.get(key)
+            if row is None:
+                row = self._rows[key] = self._normalize_key(key)
+            self._counts[row] += n
+            changed.add(row)
+        self._keys = keys
+        return changed
+
+
+def _hashable(key, normalize_key):
+    try:
+        hash(key)
+    except TypeError:
+        return (_NORMALIZED, normalize_key(key))
+    return key
+
+
+def _count_keys(keys, normalize_key):
+    try:
+        return collections.Counter(keys)
+    except TypeError:
+        # only rows with unhashable values pay for the check
+        return collections.Counter(_hashable(key, normalize_key)
+                                   for key in keys)
+
+
+class IncrementalComparison(object):
+    """Compare successive polls of a table, re-verifying only deltas.
+
+    Each side keeps the rows of the previous poll, counted by their raw
+    values, along with the missing/unexpected counts.  An update
+    normalizes only the rows added since then, re-checks only the rows
+    whose count changed on either side, and returns the previous result
+    untouched when neither side changed (or the very same compact RowSet
+    is passed again, as cached listings are).
+
+    With subset=True only rows present in Congress are verified: expected
+    rows Congress does not have yet are not reported as missing.
+    """
+
+    def __init__(self, comparator, subset=False):
+        self.comparator = comparator
+        self.subset = subset
+        self._actual = _PolledRows(self._normalize_actual)
+        self._expected = _PolledRows(self._normalize_expected)
+        self._missing = collections.Counter()
+        self._unexpected = collections.Counter()
+        self._table_rows = None
+        self._diff = None
+        self.last_delta = None
+
+    @staticmethod
+    def _normalize_actual(key):
+        if key and key[0] is _NORMALIZED:
+            return key[1]
+        return tuple(normalize(v) for v in _raw_values(key))
+
+    def _normalize_expected(self, key):
+        if key and key[0] is _NORMALIZED:
+            return key[1]
+        return self.comparator.normalize_raw_row(_raw_values(key))
+
+    @staticmethod
+    def _actual_keys(table_rows):
+        return [_raw_key(row['data']) for row in table_rows]
+
+    def _expected_keys(self, service_data):
+        raw_row = self.comparator.raw_row
+        return [_raw_key(raw_row(item)) for item in service_data]
+
+    def update(self, table_rows, service_data):
+        """Return the TableDiff of a new poll of the table."""
+        changed = set()
+        # row sets are immutable, the same one is the same rows
+        if not (isinstance(table_rows, compact_rows.RowSet) and
+                table_rows is self._table_rows):
+            changed.update(self._actual.update(
+                self._actual_keys(table_rows)) or ())
+            self._table_rows = table_rows
+        changed.update(self._expected.update(
+            self._expected_keys(service_data)) or ())
+        self.last_delta = len(changed)
+        if self._diff is not None and not changed:
+            return self._diff
+
+        for row in changed:
+            extra = self._actual.count(row) - self._expected.count(row)
+            self._missing.pop(row, None)
+            self._unexpected.pop(row, None)
+            if extra > 0:
+                self._unexpected[row] = extra
+            elif extra < 0:
+                self._missing[row] = -extra
+
+        diff = _group_changes(collections.Counter(self._missing),
+                              collections.Counter(self._unexpected),
+                              columns=self.comparator.columns,
+                              key_index=self.comparator.key_index)
+        if self.subset:
+            diff.missing = collections.Counter()
+        self._diff = diff
+        return diff
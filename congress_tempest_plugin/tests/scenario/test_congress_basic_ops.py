@@ -15,7 +15,6 @@
 #    under the License.
 
 import testtools
-import time
 
 from tempest.common import utils
 from tempest import config
@@ -114,22 +113,21 @@ class TestPolicyBasicOps(manager_congress.ScenarioPolicyBase):
         ports = self.os_admin.ports_client.list_ports(
             device_id=self.servers[0]['id'])['ports']
 
+        expected_row = (ports[0]['id'],
+                        self.servers[0]['security_groups'][0]['name'])
+
         def check_data():
             results = self.os_admin.congress_client.list_policy_rows(
                 'classification', 'port_security_group')
-            for row in results['results']:
-                if (row['data'][0] == ports[0]['id'] and
-                    row['data'][1] ==
-                        self.servers[0]['security_groups'][0]['name']):
-                        return True
-            else:
-                return False
-
-        time.sleep(65)  # sleep for replicated PE sync
-        # Note(ekcs): do not use retry because we want to make sure the call
-        # succeeds on the first try after adequate time.
-        # If retry used, it may pass based on succeding on one replica but
-        # failing on all others.
+            return expected_row in [tuple(row['data'])
+                                    for row in results['results']]
+
+        # Note(ekcs): the data must show up on every replicated PE, not just
+        # on the one that happens to answer a retried call, so wait for all
+        # replicas to agree on it before checking.
+        self.wait_for_replica_sync(
+            'classification', 'port_security_group',
+            condition=lambda rows: expected_row in rows)
         self.assertTrue(check_data(),
                         "Data did not converge in time or failure in server")
 
@@ -159,14 +157,23 @@ class TestPolicyBasicOps(manager_congress.ScenarioPolicyBase):
 
         for rule in rules:
             self._create_policy_rule(policy_name, rule)
-        f = lambda: servers_client.show_server_metadata_item(server['id'],
-                                                             meta_key)
-        time.sleep(80)  # sleep for replicated PE sync
-        # Note: seems reactive enforcement takes a bit longer
-        # succeeds on the first try after adequate time.
-        # If retry used, it may pass based on succeding on one replica but
-        # failing on all others.
-        self.assertEqual(f(), meta_data)
+
+        @helper.retry_on_exception
+        def check_meta():
+            return servers_client.show_server_metadata_item(
+                server['id'], meta_key) == meta_data
+
+        # Wait until every replicated PE derives the triggering row, then
+        # for the execute action to reach nova.
+        self.wait_for_replica_sync(
+            policy_name, 'test_servers',
+            condition=lambda rows: (server['id'],) in rows)
+        self.assertTrue(
+            test_utils.call_until_true(
+                func=check_meta,
+                duration=CONF.congressha.reactive_action_timeout,
+                sleep_for=1),
+            'Reactive enforcement action did not take effect in time')
 
 
 class TestPolicyLibraryBasicOps(manager_congress.ScenarioPolicyBase):
@@ -254,41 +261,26 @@ class TestCongressDataSources(manager_congress.ScenarioPolicyBase):
             raise cls.skipException(msg)
 
     def test_all_loaded_datasources_are_initialized(self):
+        sweep = helper.DatasourceSweep(
+            self.os_admin.congress_client,
+            lambda client, ds: client.list_datasource_status(
+                ds['id'])['initialized'] == 'True')
 
-        @helper.retry_on_exception
-        def _check_all_datasources_are_initialized():
-            datasources = self.os_admin.congress_client.list_datasources()
-            for datasource in datasources['results']:
-                results = (
-                    self.os_admin.congress_client.list_datasource_status(
-                        datasource['id']))
-                if results['initialized'] != 'True':
-                    return False
-            return True
-
-        if not test_utils.call_until_true(
-            func=_check_all_datasources_are_initialized,
-                duration=100, sleep_for=5):
+        if not test_utils.call_until_true(func=sweep,
+                                          duration=100, sleep_for=5):
             raise exceptions.TimeoutException("Data did not converge in time "
                                               "or failure in server")
 
     def test_all_datasources_have_tables(self):
-
-        @helper.retry_on_exception
-        def check_data():
-            datasources = self.os_admin.congress_client.list_datasources()
-            for datasource in datasources['results']:
-                results = (
-                    self.os_admin.congress_client.list_datasource_tables(
-                        datasource['id']))
-                # NOTE(arosen): if there are no results here we return false as
-                # there is something wrong with a driver as it doesn't expose
-                # any tables.
-                if not results['results']:
-                    return False
-            return True
-
-        if not test_utils.call_until_true(func=check_data,
+        # NOTE(arosen): if there are no results here we return false as
+        # there is something wrong with a driver as it doesn't expose
+        # any tables.
+        sweep = helper.DatasourceSweep(
+            self.os_admin.congress_client,
+            lambda client, ds: client.list_datasource_tables(
+                ds['id'])['results'])
+
+        if not test_utils.call_until_true(func=sweep,
                                           duration=100, sleep_for=5):
             raise exceptions.TimeoutException("Data did not converge in time "
                                               "or failure in server")
@@ -44,8 +44,8 @@ class TestZ3(manager_congress.ScenarioPolicyBase):
         def cleanup(policy_name):
             """Removes the policy"""
             result = client.list_policy_rules(policy_name)
-            for rule in result['results']:
-                client.delete_policy_rule(policy_name, rule['id'])
+            client.delete_policy_rules_bulk(
+                policy_name, [rule['id'] for rule in result['results']])
             client.delete_policy(policy_name)
 
         suffix = ''.join(
@@ -63,6 +63,10 @@ class TestZ3(manager_congress.ScenarioPolicyBase):
         self.os_admin.congress_client.create_policy_rule(
             policy_name, {'rule': rule})
 
+    def _add_rules(self, policy_name, rules):
+        """Shortcut to add several rules to a policy concurrently"""
+        self._create_policy_rules(policy_name, rules)
+
     @decorators.attr(type='smoke')
     def test_z3_recursivity(self):
         """Recursivity in Z3
@@ -73,8 +77,10 @@ class TestZ3(manager_congress.ScenarioPolicyBase):
         expected = [(1, 2), (1, 3), (1, 4), (1, 5), (1, 6),
                     (2, 3), (2, 4), (2, 5), (2, 6),
                     (4, 5), (4, 6)]
-        for pair in [(1, 2), (2, 3), (2, 4), (4, 5), (4, 6)]:
-            self._add_rule(computations, 'link(%d, %d)' % pair)
+        self._add_rules(
+            computations,
+            ['link(%d, %d)' % pair
+             for pair in [(1, 2), (2, 3), (2, 4), (4, 5), (4, 6)]])
 
         self._add_rule(computations, 'path(x, y) :- link(x, y)')
         self._add_rule(computations,
@@ -98,8 +104,10 @@ class TestZ3(manager_congress.ScenarioPolicyBase):
         formatter = self._add_policy("form")
         computations = self._add_policy("comp", "z3")
         expected = []
-        for pair in [(1, 2), (2, 3), (2, 4), (4, 5), (4, 6)]:
-            self._add_rule(facts, 'link("N%d", "N%d")' % pair)
+        self._add_rules(
+            facts,
+            ['link("N%d", "N%d")' % pair
+             for pair in [(1, 2), (2, 3), (2, 4), (4, 5), (4, 6)]])
         for pair in [(1, 2), (1, 3), (1, 4), (1, 5), (1, 6),
                      (2, 3), (2, 4), (2, 5), (2, 6),
                      (4, 5), (4, 6)]:
@@ -136,7 +144,7 @@ class TestZ3(manager_congress.ScenarioPolicyBase):
              'builtin:and(x,y,d), builtin:or(x,y,e), builtin:bnot(x,f)'))
         result = self.os_admin.congress_client.list_policy_rows(
             policy, "arith")
-        extracted = [row['data'] for row in result['results']]
+        extracted = [list(row['data']) for row in result['results']]
         expected = [[x + y, x - y, x * y, x & y, x | y, ~x & 0xffffffff]]
         self.assertEqual(expected, extracted)
 
@@ -169,10 +177,10 @@ class TestZ3(manager_congress.ScenarioPolicyBase):
             ('gteq(y,x)', y >= x),
             ('gteq(x,x)', x >= x)
         ]
-        for (num, (pred, _)) in enumerate(checks):
-            self._add_rule(
-                policy,
-                ('check(%d) :- x(x), y(y), builtin:%s' % (num, pred)))
+        self._add_rules(
+            policy,
+            ['check(%d) :- x(x), y(y), builtin:%s' % (num, pred)
+             for (num, (pred, _)) in enumerate(checks)])
         result = self.os_admin.congress_client.list_policy_rows(
             policy, "check")
         extracted = [row['data'][0] for row in result['results']]
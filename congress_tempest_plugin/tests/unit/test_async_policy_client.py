@@ -0,0 +1,79 @@
+# Copyright 2026 OpenStack Foundation
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import asyncio
+import inspect
+
+from tempest.lib import exceptions
+import testtools
+
+from congress_tempest_plugin.services.policy import async_policy_client
+from congress_tempest_plugin.services.policy import policy_client
+from congress_tempest_plugin.tests import fake_congress
+
+
+class TestAsyncPolicyClient(testtools.TestCase):
+
+    def setUp(self):
+        super(TestAsyncPolicyClient, self).setUp()
+        self.server = fake_congress.FakeCongressServer().start()
+        self.addCleanup(self.server.stop)
+        self.client = async_policy_client.AsyncPolicyClient.from_client(
+            self.server.make_client(persistent_connections=True,
+                                    pool_size=4), max_concurrency=4)
+        self.addCleanup(self.client.close)
+
+    def test_every_call_is_mirrored(self):
+        for name, value in vars(policy_client.PolicyClient).items():
+            if (name.startswith('_') or not inspect.isfunction(value) or
+                    name.startswith(('iter_', 'get_request', 'get_endpoint',
+                                     'get_response')) or name == 'request'):
+                continue
+            self.assertTrue(
+                inspect.iscoroutinefunction(
+                    getattr(async_policy_client.AsyncPolicyClient, name)),
+                '%s is not mirrored' % name)
+
+    def test_calls(self):
+        async def run():
+            await self.client.create_policy({'name': 'p'})
+            await asyncio.gather(*[
+                self.client.create_policy_rule('p', {'rule': 'q(%d)' % i})
+                for i in range(10)])
+            rows = await self.client.list_policy_rows_many('p', ['q'])
+            streamed = [row async for row in
+                        self.client.iter_policy_rows('p', 'q')]
+            return rows, streamed
+
+        rows, streamed = asyncio.run(run())
+        self.assertEqual(list(range(10)),
+                         sorted(row['data'][0] for row in rows['q']))
+        self.assertEqual(rows['q'], streamed)
+        self.assertEqual(13, self.client.get_request_stats()['count'])
+
+    def test_gather_map_errors(self):
+        e = self.assertRaises(
+            policy_client.BulkRequestError, asyncio.run,
+            self.client.list_datasource_status_many(['unknown']))
+        self.assertIsInstance(e.errors['unknown'], exceptions.NotFound)
+
+    def test_run(self):
+        async def run():
+            return await asyncio.gather(*[
+                self.client.run(self.client.client.create_policy,
+                                {'name': 'p%d' % i}) for i in range(3)])
+
+        self.assertEqual(['p0', 'p1', 'p2'],
+                         [policy['name'] for policy in asyncio.run(run())])
@@ -0,0 +1,93 @@
+# Copyright 2026 OpenStack Foundation
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import time
+
+from tempest.lib import exceptions
+import testtools
+
+from congress_tempest_plugin.tests import fake_congress
+
+
+class TestFakeCongress(testtools.TestCase):
+
+    def setUp(self):
+        super(TestFakeCongress, self).setUp()
+        self.server = fake_congress.FakeCongressServer().start()
+        self.addCleanup(self.server.stop)
+        self.client = self.server.make_client()
+
+    def test_parse_fact(self):
+        self.assertEqual(('q', [1, 'a', 2.5]),
+                         fake_congress.parse_fact('q(1, "a", 2.5)'))
+        self.assertIsNone(fake_congress.parse_fact('q(x) :- p(x)'))
+
+    def test_policies(self):
+        self.client.create_policy({'name': 'p'})
+        rule = self.client.create_policy_rule('p', {'rule': 'q(1, "a")'})
+        self.client.create_policy_rule('p', {'rule': 'r(x) :- q(x, y)'})
+        self.server.data.set_policy_rows('p', 'r', [[1]])
+        self.assertEqual(['q', 'r'], sorted(
+            t['id'] for t in self.client.list_policy_tables('p')['results']))
+        self.assertEqual([[1, 'a']], [
+            row['data'] for row in
+            self.client.list_policy_rows('p', 'q')['results']])
+        self.assertEqual([[1]], [
+            row['data'] for row in
+            self.client.list_policy_rows('p', 'r')['results']])
+        self.client.delete_policy_rule('p', rule['id'])
+        self.assertEqual([], self.client.list_policy_rows('p',
+                                                          'q')['results'])
+        self.client.delete_policy('p')
+        self.assertRaises(exceptions.NotFound, self.client.show_policy, 'p')
+
+    def test_datasources(self):
+        ds = self.client.create_datasource({'name': 'ds',
+                                            'driver': 'fake_datasource'})
+        self.assertEqual('datasource', self.client.show_policy('ds')['kind'])
+        self.client.update_datasource_row(ds['id'], 'fake_table',
+                                          [{'id': '1', 'name': 'a'}])
+        self.assertEqual([['1', 'a']], [
+            row['data'] for row in
+            self.client.list_datasource_rows('ds', 'fake_table')['results']])
+        status = self.client.list_datasource_status('ds')
+        self.assertEqual('2', status['number_of_updates'])
+        self.client.request_refresh('ds')
+        self.client.send_datasource_webhook('ds', {'alarm': 1})
+        self.assertEqual('4', self.client.list_datasource_status(
+            'ds')['number_of_updates'])
+        self.assertEqual([{'alarm': 1}], self.server.data.webhooks[ds['id']])
+        self.assertRaises(exceptions.BadRequest,
+                          self.client.create_datasource,
+                          {'name': 'ds', 'driver': 'fake_datasource'})
+        self.client.delete_datasource(ds['id'])
+        self.assertRaises(exceptions.NotFound,
+                          self.client.list_datasource_status, 'ds')
+
+    def test_inject_error(self):
+        self.server.inject_error(409, 'GET', '/status$', count=2)
+        self.client.create_policy({'name': 'p'})
+        for i in range(2):
+            self.assertRaises(exceptions.Conflict,
+                              self.client.list_policy_status, 'p')
+        self.client.list_policy_status('p')
+        self.assertEqual(('POST', '/v1/policies'), self.server.requests[0])
+
+    def test_latency(self):
+        self.server.latency = (
+            lambda method, path: 0.05 if method == 'GET' else 0)
+        start = time.time()
+        self.client.list_policy()
+        self.assertGreaterEqual(time.time() - start, 0.05)
@@ -0,0 +1,158 @@
+# Copyright 2026 OpenStack Foundation
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import threading
+import time
+
+import tenacity
+import testtools
+
+from congress_tempest_plugin.tests import fake_congress
+from congress_tempest_plugin.tests.scenario import helper
+
+
+class TestRetryCheck(testtools.TestCase):
+
+    def test_attempt_budget(self):
+        calls = []
+
+        def slow():
+            calls.append(None)
+            # slower than the whole wait budget of the old time-based stop
+            time.sleep(0.02)
+            return False
+
+        self.assertRaises(tenacity.RetryError,
+                          helper.retry_check_function_return_value_condition,
+                          slow, bool, retry_interval=0.001,
+                          retry_attempts=5)
+        self.assertEqual(5, len(calls))
+
+    def test_returns_value(self):
+        values = iter([1, 2, 3])
+        self.assertEqual(3, helper.retry_check_function_return_value_condition(
+            lambda: next(values), lambda v: v == 3, retry_interval=0.001))
+
+
+class TestCallUntilConverged(testtools.TestCase):
+
+    def test_converges(self):
+        calls = []
+
+        def check():
+            calls.append(None)
+            return len(calls) == 3
+
+        self.assertTrue(helper.call_until_converged(
+            check, duration=5, initial_interval=0.001, name='unit_converges'))
+        self.assertEqual(3, len(calls))
+        record = [r for r in helper.CONVERGENCE_STATS.records
+                  if r['name'] == 'unit_converges'][-1]
+        self.assertTrue(record['converged'])
+        self.assertEqual(3, record['attempts'])
+
+    def test_times_out(self):
+        self.assertFalse(helper.call_until_converged(
+            lambda: False, duration=0.05, initial_interval=0.01,
+            max_interval=0.01, name='unit_times_out'))
+        summary = helper.CONVERGENCE_STATS.summary()['unit_times_out']
+        self.assertEqual(1, summary['failures'])
+
+    def test_update_probe_cuts_wait(self):
+        updates = [0]
+        timer = threading.Timer(0.1, lambda: updates.append(1))
+        timer.start()
+        self.addCleanup(timer.cancel)
+        # without the probe the first retry would only come after 30s
+        self.assertTrue(helper.call_until_converged(
+            lambda: len(updates) > 1, duration=30, initial_interval=30,
+            jitter=0, update_probe=lambda: len(updates),
+            update_poll_interval=0.01))
+
+    def test_failing_probe(self):
+        def probe():
+            raise Exception('unreachable')
+
+        self.assertFalse(helper.call_until_converged(
+            lambda: False, duration=0.05, initial_interval=0.01,
+            update_probe=probe, update_poll_interval=0.01))
+
+
+class TestDatasourceSweep(testtools.TestCase):
+
+    def setUp(self):
+        super(TestDatasourceSweep, self).setUp()
+        self.server = fake_congress.FakeCongressServer().start()
+        self.addCleanup(self.server.stop)
+        self.client = self.server.make_client()
+        for name in ('ds1', 'ds2'):
+            self.client.create_datasource({'name': name,
+                                           'driver': 'fake_datasource'})
+
+    def test_sweep(self):
+        ready = set(['ds1'])
+        checked = []
+
+        def check(client, datasource):
+            checked.append(datasource['name'])
+            if datasource['name'] not in ready:
+                raise Exception('not ready')
+            return True
+
+        sweep = helper.DatasourceSweep(self.client, check)
+        self.assertFalse(sweep())
+        self.assertEqual(['ds1', 'ds2'], sorted(checked))
+        del checked[:]
+        ready.add('ds2')
+        self.assertTrue(sweep())
+        # ds1 passed on the first call and was not checked again
+        self.assertEqual(['ds2'], checked)
+
+    def test_max_workers(self):
+        running = []
+        overlaps = []
+
+        def check(client, datasource):
+            running.append(datasource['name'])
+            overlaps.append(len(running) > 1)
+            time.sleep(0.05)
+            running.remove(datasource['name'])
+            return True
+
+        self.assertTrue(helper.DatasourceSweep(self.client, check,
+                                               max_workers=1)())
+        self.assertEqual([False, False], overlaps)
+
+    def test_listing_failure(self):
+        sweep = helper.DatasourceSweep(self.client, lambda c, ds: True)
+        self.server.inject_error(500, 'GET', '^/v1/data-sources$')
+        self.assertFalse(sweep())
+        self.assertTrue(sweep())
+
+    def test_with_call_until_converged(self):
+        def check(client, datasource):
+            status = client.list_datasource_status(datasource['id'])
+            return int(status['number_of_updates']) > 1
+
+        def refresh():
+            for name in ('ds1', 'ds2'):
+                self.server.data.bump_updates(name)
+
+        timer = threading.Timer(0.1, refresh)
+        timer.start()
+        self.addCleanup(timer.cancel)
+        self.assertTrue(helper.call_until_converged(
+            helper.DatasourceSweep(self.client, check), duration=10,
+            initial_interval=0.05, max_interval=0.1))
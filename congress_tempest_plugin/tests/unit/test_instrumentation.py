@@ -0,0 +1,97 @@
+# Copyright 2026 OpenStack Foundation
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import os
+from unittest import mock
+
+from tempest.lib import exceptions
+import testtools
+
+from congress_tempest_plugin.services.policy import instrumentation
+from congress_tempest_plugin.tests import fake_congress
+
+
+class TestRequestMetrics(testtools.TestCase):
+
+    def test_histogram_percentiles(self):
+        histogram = instrumentation.Histogram()
+        for value in range(1, 1001):
+            histogram.record(value)
+        summary = histogram.summary()
+        self.assertEqual(1000, summary['count'])
+        self.assertEqual(1000, summary['max'])
+        self.assertAlmostEqual(500, summary['p50'], delta=500 / 64.0)
+        self.assertAlmostEqual(990, summary['p99'], delta=990 / 64.0)
+
+    def test_url_templates(self):
+        templates = instrumentation.URLTemplates([
+            '/v1/policies/%s', '/v1/policies/%s/tables/%s/rows',
+            '/v1/policies/%s/status'])
+        self.assertEqual('/v1/policies/%s/status',
+                         templates.template('/v1/policies/p/status'))
+        self.assertEqual('/v1/policies/%s/tables/%s/rows?trace',
+                         templates.template(
+                             '/v1/policies/p/tables/q/rows?trace=True'))
+
+    def test_parent_and_scopes(self):
+        parent = instrumentation.RequestMetrics()
+        scope = parent.open_scope()
+        child = instrumentation.RequestMetrics(parent=parent)
+        child.record('GET /v1/policies', 200, 0.5, 10)
+        child.record('POST /v1/policies', 'error', 0.25, 0, failed=True)
+        parent.close_scope(scope)
+        parent.record('GET /v1/policies', 200, 1.5, 10)
+        self.assertEqual(2, len(scope.report()))
+        self.assertEqual(
+            2, parent.report()['GET /v1/policies']['latency_us']['count'])
+        self.assertEqual({'count': 2,
+                          'errors': 1,
+                          'total_time': 0.75,
+                          'mean_time': 0.375,
+                          'max_time': 0.5,
+                          'by_method': {
+                              'GET': {'count': 1, 'total_time': 0.5},
+                              'POST': {'count': 1, 'total_time': 0.25}}},
+                         child.totals())
+
+    def test_write_report_at_exit(self):
+        self.addCleanup(instrumentation._report_paths.clear)
+        with mock.patch('atexit.register') as register:
+            instrumentation.write_report_at_exit('/tmp/100%-%(pid)s.json')
+            instrumentation.write_report_at_exit('/tmp/100%-%(pid)s.json')
+        register.assert_called_once_with(
+            instrumentation.REQUEST_METRICS.write_report,
+            '/tmp/100%%-%d.json' % os.getpid())
+
+
+class TestClientMetrics(testtools.TestCase):
+
+    def test_requests_recorded_once(self):
+        with fake_congress.FakeCongressServer() as server:
+            metrics = instrumentation.RequestMetrics()
+            client = server.make_client(metrics=metrics)
+            client.list_policy()
+            client.show_policy('classification')
+            self.assertRaises(exceptions.NotFound, client.show_policy,
+                              'unknown')
+        stats = client.get_request_stats()
+        self.assertEqual(3, stats['count'])
+        self.assertEqual(1, stats['errors'])
+        self.assertEqual(3, stats['by_method']['GET']['count'])
+        self.assertEqual(3, stats['connections_opened'])
+        report = client.get_endpoint_report()
+        self.assertEqual({'200': 1, '404': 1},
+                         report['GET /v1/policies/%s']['statuses'])
+        self.assertEqual(1, report['GET /v1/policies']['latency_us']['count'])
@@ -0,0 +1,72 @@
+# Copyright 2026 OpenStack Foundation
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import importlib
+from unittest import mock
+
+from tempest.lib import exceptions
+import testtools
+
+from congress_tempest_plugin.services.policy import json_codec
+from congress_tempest_plugin.tests import fake_congress
+
+
+def _not_installed():
+    return json_codec.Codec('missing', None, importlib.import_module(
+        'congress_tempest_plugin_no_such_module'))
+
+
+class TestJsonCodec(testtools.TestCase):
+
+    def setUp(self):
+        super(TestJsonCodec, self).setUp()
+        for patcher in (mock.patch.dict(json_codec.CODECS,
+                                        missing=_not_installed),
+                        mock.patch.dict(json_codec._loaded, clear=True)):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_get_codec(self):
+        codec = json_codec.get_codec('json')
+        self.assertEqual('json', codec.name)
+        self.assertEqual({'a': [1]}, codec.loads(codec.dumps({'a': [1]})))
+        self.assertIs(codec, json_codec.get_codec('json'))
+        self.assertEqual('jsonutils', json_codec.get_codec().name)
+
+    def test_unknown_or_missing(self):
+        self.assertRaises(exceptions.InvalidConfiguration,
+                          json_codec.get_codec, 'unknown')
+        self.assertRaises(exceptions.InvalidConfiguration,
+                          json_codec.get_codec, 'missing')
+        self.assertNotIn('missing', json_codec.available_codecs())
+        self.assertIn('json', json_codec.available_codecs())
+
+    def test_auto_falls_back(self):
+        with mock.patch.object(json_codec, 'PREFERENCE',
+                               ('missing', 'json')):
+            self.assertEqual('json', json_codec.get_codec('auto').name)
+        expected = [name for name in json_codec.PREFERENCE
+                    if name in json_codec.available_codecs()][0]
+        self.assertEqual(expected, json_codec.get_codec('auto').name)
+
+    def test_clients(self):
+        with fake_congress.FakeCongressServer() as server:
+            for name in json_codec.available_codecs():
+                client = server.make_client(codec=name)
+                policy = 'p_%s' % name
+                client.create_policy({'name': policy})
+                client.create_policy_rule(policy, {'rule': 'q(1, "a")'})
+                rows = client.list_policy_rows(policy, 'q')['results']
+                self.assertEqual([[1, 'a']], [row['data'] for row in rows])
@@ -0,0 +1,57 @@
+# Copyright 2026 OpenStack Foundation
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import time
+
+import testtools
+
+from congress_tempest_plugin.tests.benchmark import measure
+
+
+class TestMeasure(testtools.TestCase):
+
+    def test_latency_summary(self):
+        summary = measure.latency_summary([float(i) for i in range(1, 101)])
+        self.assertEqual({'count': 100, 'mean': 50.5, 'max': 100.0,
+                          'p50': 50.0, 'p95': 95.0, 'p99': 99.0}, summary)
+        self.assertEqual({'count': 0, 'mean': None, 'max': None,
+                          'p50': None, 'p95': None, 'p99': None},
+                         measure.latency_summary([]))
+        self.assertEqual({'p10': 1}, measure.percentiles([3, 1, 2], (10,)))
+
+    def test_timed(self):
+        result, elapsed = measure.timed(
+            lambda x: time.sleep(0.01) or x)('a')
+        self.assertEqual('a', result)
+        self.assertGreaterEqual(elapsed, 0.01)
+
+    def test_wait_until(self):
+        deadline = time.time() + 0.05
+        self.assertIsNotNone(measure.wait_until(
+            lambda: time.time() >= deadline, 1, interval=0.01))
+        self.assertIsNone(measure.wait_until(lambda: False, 0.05,
+                                             interval=0.01))
+
+    def test_replay(self):
+        def func(item):
+            if item == 'bad':
+                raise ValueError(item)
+
+        latencies, errors, seconds = measure.replay(
+            func, ['a', 'bad', 'b', 'c', 'd'], rate=50, concurrency=2)
+        self.assertEqual(4, len(latencies))
+        self.assertEqual(['bad'], [str(e) for e in errors])
+        # five calls at 50 per second start over at least 80ms
+        self.assertGreaterEqual(seconds, 0.08)
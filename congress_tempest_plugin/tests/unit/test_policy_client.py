@@ -0,0 +1,293 @@
+# Copyright 2026 OpenStack Foundation
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import time
+from unittest import mock
+
+from tempest.lib import exceptions
+import testtools
+
+from congress_tempest_plugin.services.policy import policy_client
+from congress_tempest_plugin.tests import fake_congress
+
+
+class PolicyClientTestBase(testtools.TestCase):
+
+    def setUp(self):
+        super(PolicyClientTestBase, self).setUp()
+        self.server = fake_congress.FakeCongressServer(data=self._data())
+        self.server.start()
+        self.addCleanup(self.server.stop)
+        self.client = self.server.make_client()
+        self.client.create_policy({'name': 'p'})
+        self.datasource = self.client.create_datasource(
+            {'name': 'ds', 'driver': 'fake_datasource'})
+
+    @staticmethod
+    def _data():
+        drivers = dict(fake_congress.DEFAULT_DRIVERS)
+        drivers['fake_datasource'] = dict(
+            ('table%d' % i, ['id', 'name']) for i in range(5))
+        drivers['fake_datasource']['fake_table'] = ['id', 'name']
+        return fake_congress.FakeCongressData(drivers)
+
+    def _requests(self, method, path):
+        return [r for r in self.server.requests if r == (method, path)]
+
+
+class TestRunConcurrently(testtools.TestCase):
+
+    def test_results(self):
+        self.assertEqual({1: 2, 2: 4, 3: 6}, policy_client.run_concurrently(
+            lambda x: 2 * x, [1, 2, 3], max_workers=2))
+        self.assertEqual({}, policy_client.run_concurrently(
+            lambda x: x, []))
+
+    def test_errors(self):
+        def func(x):
+            if x % 2:
+                raise ValueError(x)
+            return x
+
+        e = self.assertRaises(policy_client.BulkRequestError,
+                              policy_client.run_concurrently, func,
+                              range(4))
+        self.assertEqual([1, 3], sorted(e.errors))
+        self.assertEqual({0: 0, 2: 2}, e.results)
+        self.assertIn('1 (1)', str(e))
+
+
+class TestBulkDatasourceRows(PolicyClientTestBase):
+
+    def test_list_datasource_rows_bulk(self):
+        tables = ['table%d' % i for i in range(5)]
+        for i, table in enumerate(tables):
+            self.server.data.set_datasource_rows(
+                'ds', table, [[str(i), 'name-%d' % j] for j in range(i)])
+        self.server.latency = 0.05
+        rows = self.client.list_datasource_rows_bulk('ds', tables,
+                                                     max_workers=5)
+        self.assertEqual(tables, sorted(rows))
+        for i, table in enumerate(tables):
+            self.assertEqual([[str(i), 'name-%d' % j] for j in range(i)],
+                             [row['data'] for row in rows[table]])
+
+    def test_list_datasource_rows_bulk_failure(self):
+        e = self.assertRaises(policy_client.BulkRequestError,
+                              self.client.list_datasource_rows_bulk,
+                              'ds', ['table0', 'unknown'])
+        self.assertEqual(['unknown'], list(e.errors))
+        self.assertIsInstance(e.errors['unknown'], exceptions.NotFound)
+        self.assertEqual([], e.results['table0'])
+
+
+class TestDatasourceRegistry(PolicyClientTestBase):
+
+    def test_find_datasource(self):
+        self.assertEqual(self.datasource['id'],
+                         self.client.get_datasource_id('ds'))
+        self.assertEqual('ds', self.client.get_datasource_name(
+            self.datasource['id']))
+        # the second lookup was served from the registry
+        self.assertEqual(1, len(self._requests('GET', '/v1/data-sources')))
+        self.assertIsNone(self.client.get_datasource_id('unknown'))
+
+    def test_create_datasource_invalidates_registry(self):
+        self.client.get_datasource_id('ds')
+        self.client.create_datasource({'name': 'other',
+                                       'driver': 'fake_datasource'})
+        self.assertIsNotNone(self.client.get_datasource_id('other'))
+        self.assertEqual(2, len(self._requests('GET', '/v1/data-sources')))
+
+    def test_registry_per_endpoint(self):
+        self.client.get_datasource_id('ds')
+        with fake_congress.FakeCongressServer() as other_server:
+            other = other_server.make_client()
+            self.assertIsNot(self.client.datasource_registry,
+                             other.datasource_registry)
+            self.assertIsNone(other.get_datasource_id('ds'))
+            other.create_datasource({'name': 'ds2',
+                                     'driver': 'fake_datasource'})
+        # creating a datasource elsewhere left this registry alone
+        self.assertEqual(self.datasource['id'],
+                         self.client.get_datasource_id('ds'))
+        self.assertEqual(1, len(self._requests('GET', '/v1/data-sources')))
+        # replicas of the endpoint share its registry
+        replica = self.server.make_client(endpoint_override='http://replica')
+        self.assertIs(self.client.datasource_registry,
+                      replica.datasource_registry)
+
+
+class TestDatasourceSchemaCache(PolicyClientTestBase):
+
+    def test_table_schema(self):
+        client = self.server.make_client(prefetch_schemas=True)
+        schema = client.get_datasource_table_schema('ds', 'fake_table')
+        self.assertEqual({'id': 0, 'name': 1}, schema.index)
+        client.get_datasource_table_schema('ds', 'table0')
+        # the whole datasource schema was fetched once, with the first
+        # table
+        self.assertEqual([('GET', '/v1/data-sources/ds/schema')],
+                         [r for r in self.server.requests
+                          if 'schema' in r[1] or r[1].endswith('/spec')])
+
+    def test_table_schema_without_prefetch(self):
+        for i in range(2):
+            self.client.get_datasource_table_schema('ds', 'fake_table')
+        self.assertEqual(
+            [('GET', '/v1/data-sources/ds/tables/fake_table/spec')],
+            [r for r in self.server.requests
+             if 'schema' in r[1] or r[1].endswith('/spec')])
+
+
+class TestRowStreaming(PolicyClientTestBase):
+
+    def _check_iter_rows(self):
+        rows = [[str(i), 'name-%d' % i] for i in range(100)]
+        self.server.data.set_datasource_rows('ds', 'fake_table', rows)
+        self.server.data.set_policy_rows('p', 'q', [[1], [2]])
+        self.assertEqual(
+            rows, [row['data'] for row in
+                   self.client.iter_datasource_rows('ds', 'fake_table')])
+        self.assertEqual(
+            [[1], [2]],
+            [row['data'] for row in self.client.iter_policy_rows('p', 'q')])
+
+    def test_iter_rows(self):
+        self._check_iter_rows()
+
+    def test_iter_rows_without_streaming(self):
+        with mock.patch.object(policy_client, 'GET_STREAMS', False):
+            self._check_iter_rows()
+
+    def test_iter_rows_stopped_early(self):
+        self.server.data.set_datasource_rows(
+            'ds', 'fake_table', [[str(i), 'n'] for i in range(10)])
+        rows = self.client.iter_datasource_rows('ds', 'fake_table')
+        self.assertEqual(['0', 'n'], next(rows)['data'])
+        rows.close()
+        # the client is still usable once the stream was abandoned
+        self.assertEqual(10, len(self.client.list_datasource_rows(
+            'ds', 'fake_table')['results']))
+
+
+class TestResponseCache(PolicyClientTestBase):
+
+    def test_reuses_unchanged_rows(self):
+        self.server.data.set_datasource_rows('ds', 'fake_table',
+                                             [['1', 'a']])
+        first = self.client.list_datasource_rows('ds', 'fake_table')
+        second = self.client.list_datasource_rows('ds', 'fake_table')
+        self.assertIs(first['results'], second['results'])
+        stats = self.client.get_response_cache_stats()
+        self.assertEqual(1, stats['hits'])
+        self.assertEqual(1, stats['misses'])
+
+        self.server.data.set_datasource_rows('ds', 'fake_table',
+                                             [['2', 'b']])
+        third = self.client.list_datasource_rows('ds', 'fake_table')
+        self.assertEqual([{'data': ['2', 'b']}], third['results'])
+        self.assertEqual(2, self.client.get_response_cache_stats()['misses'])
+
+    def test_disabled(self):
+        client = self.server.make_client(response_cache_size=0)
+        client.list_datasource_rows('ds', 'fake_table')
+        client.list_datasource_rows('ds', 'fake_table')
+        stats = client.get_response_cache_stats()
+        self.assertEqual(0, stats['hits'])
+        self.assertEqual(0, stats['entries'])
+
+
+class TestBulkPolicyRules(PolicyClientTestBase):
+
+    def test_create_policy_rules_bulk(self):
+        rules = ['q(%d)' % i for i in range(20)]
+        created = self.client.create_policy_rules_bulk('p', rules,
+                                                       max_workers=4)
+        self.assertEqual(rules, [rule['rule'] for rule in created])
+        self.client.delete_policy_rules_bulk(
+            'p', [rule['id'] for rule in created[:10]])
+        self.assertEqual(
+            sorted(rules[10:]),
+            sorted(rule['rule'] for rule in
+                   self.client.list_policy_rules('p')['results']))
+
+    def test_create_policy_rules_bulk_failure(self):
+        self.server.inject_error(400, 'POST', '/rules$')
+        e = self.assertRaises(policy_client.BulkRequestError,
+                              self.client.create_policy_rules_bulk,
+                              'p', ['q(1)', 'q(2)', 'q(3)'], max_workers=1)
+        self.assertEqual(1, len(e.errors))
+        self.assertEqual(2, len(e.results))
+        self.assertIsInstance(list(e.errors.values())[0],
+                              exceptions.BadRequest)
+
+
+class TestPolicyClientFailures(PolicyClientTestBase):
+
+    def test_no_retry_by_default(self):
+        self.server.inject_error(503, 'GET')
+        self.assertRaises(exceptions.UnexpectedResponseCode,
+                          self.client.list_policy)
+
+    def test_retry_unavailable(self):
+        client = self.server.make_client(retries=2, retry_backoff=0)
+        self.server.inject_error(503, 'GET', count=2)
+        policies = client.list_policy()['results']
+        self.assertIn('classification', [p['name'] for p in policies])
+        self.assertEqual(3, len(self._requests('GET', '/v1/policies')))
+
+    def test_retries_exhausted(self):
+        client = self.server.make_client(retries=1, retry_backoff=0)
+        self.server.inject_error(502, 'GET', count=2)
+        self.assertRaises(exceptions.UnexpectedResponseCode,
+                          client.list_policy)
+        self.assertEqual(2, len(self._requests('GET', '/v1/policies')))
+
+    def test_no_retry_on_client_error_or_post(self):
+        client = self.server.make_client(retries=2, retry_backoff=0)
+        self.server.inject_error(404, 'GET')
+        self.assertRaises(exceptions.NotFound, client.list_policy)
+        posts = len(self._requests('POST', '/v1/policies'))
+        self.server.inject_error(503, 'POST')
+        self.assertRaises(exceptions.UnexpectedResponseCode,
+                          client.create_policy, {'name': 'p2'})
+        self.assertEqual(posts + 1,
+                         len(self._requests('POST', '/v1/policies')))
+
+    def test_circuit_breaker(self):
+        client = self.server.make_client(breaker_threshold=2,
+                                         breaker_reset=60)
+        self.server.inject_error(503, 'GET', count=2)
+        for i in range(2):
+            self.assertRaises(exceptions.UnexpectedResponseCode,
+                              client.list_policy)
+        self.assertRaises(policy_client.CircuitOpenError,
+                          client.list_policy)
+        # the breaker is shared by the clients of the endpoint
+        other = self.server.make_client(breaker_threshold=2)
+        self.assertRaises(policy_client.CircuitOpenError,
+                          other.list_policy)
+        self.assertEqual(2, len(self._requests('GET', '/v1/policies')))
+
+    def test_circuit_breaker_closes(self):
+        client = self.server.make_client(breaker_threshold=1,
+                                         breaker_reset=0.01)
+        self.server.inject_error(503, 'GET')
+        self.assertRaises(exceptions.UnexpectedResponseCode,
+                          client.list_policy)
+        time.sleep(0.02)
+        client.list_policy()
+        client.list_policy()
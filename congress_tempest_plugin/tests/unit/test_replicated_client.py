@@ -0,0 +1,97 @@
+# Copyright 2026 OpenStack Foundation
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+from tempest.lib import exceptions
+import testtools
+
+from congress_tempest_plugin.services.policy import replicated_client
+from congress_tempest_plugin.tests import fake_congress
+
+
+class TestReplicatedPolicyClient(testtools.TestCase):
+
+    def setUp(self):
+        super(TestReplicatedPolicyClient, self).setUp()
+        self.servers = []
+        for i in range(3):
+            server = fake_congress.FakeCongressServer().start()
+            self.addCleanup(server.stop)
+            self.servers.append(server)
+
+    def _client(self, strategy, **kwargs):
+        return replicated_client.ReplicatedPolicyClient(
+            fake_congress.FakeAuthProvider(self.servers[0].url), 'policy',
+            'RegionOne', endpoints=[s.url for s in self.servers],
+            strategy=strategy, **kwargs)
+
+    def _reads(self):
+        return [len([r for r in server.requests
+                     if r == ('GET', '/v1/policies')])
+                for server in self.servers]
+
+    def test_round_robin(self):
+        client = self._client('round_robin')
+        for i in range(6):
+            client.list_policy()
+        self.assertEqual([2, 2, 2], self._reads())
+        client.create_policy({'name': 'p'})
+        self.assertEqual(1, len(self.servers[0].requests) -
+                         self._reads()[0])
+
+    def test_least_latency(self):
+        self.servers[0].latency = 0.05
+        self.servers[2].latency = 0.05
+        client = self._client('least_latency', reprobe_interval=5)
+        for i in range(20):
+            client.list_policy()
+        # one read to measure each replica, then every fifth read
+        # re-probes the replica left unread the longest
+        reads = self._reads()
+        self.assertEqual(20, sum(reads))
+        self.assertEqual([3, 14, 3], reads)
+        latency = client.get_replica_latency()
+        self.assertGreater(latency[self.servers[0].url]['recent_time'],
+                           latency[self.servers[1].url]['recent_time'])
+
+    def test_failing_replica(self):
+        self.servers[1].stop()
+        for strategy in replicated_client.ReplicatedPolicyClient.STRATEGIES:
+            client = self._client(strategy, reprobe_interval=0)
+            for i in range(6):
+                client.list_policy()
+            stats = client.get_replica_latency()[self.servers[1].url]
+            self.assertTrue(stats['failing'])
+            self.assertEqual(0, stats['recent_time'])
+        # least_latency stopped sending reads to the stopped replica
+        self.assertEqual(1, stats['errors'])
+
+    def test_unavailable_replica_recovers(self):
+        client = self._client('least_latency', reprobe_interval=2)
+        self.servers[0].inject_error(503, 'GET', count=1)
+        client.list_policy()
+        self.assertTrue(
+            client.get_replica_latency()[self.servers[0].url]['failing'])
+        for i in range(6):
+            client.list_policy()
+        self.assertFalse(
+            client.get_replica_latency()[self.servers[0].url]['failing'])
+
+    def test_request_errors_not_retried(self):
+        client = self._client('round_robin')
+        self.assertRaises(exceptions.NotFound, client.show_policy,
+                          'unknown')
+        self.assertEqual(1, sum(
+            len([r for r in server.requests if 'unknown' in r[1]])
+            for server in self.servers))
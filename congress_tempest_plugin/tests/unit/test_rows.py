@@ -0,0 +1,71 @@
+# Copyright 2026 OpenStack Foundation
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+from oslo_serialization import jsonutils
+import testtools
+
+from congress_tempest_plugin.services.policy import rows
+
+COLUMNS = [{'name': 'id'}, {'name': 'name'}]
+
+
+class TestRowSet(testtools.TestCase):
+
+    def setUp(self):
+        super(TestRowSet, self).setUp()
+        self.rows = rows.RowSet([{'data': ['1', 'a']}, {'data': ['2', 'b']},
+                                 {'data': ['1', 'a']}], COLUMNS)
+
+    def test_rows(self):
+        self.assertEqual(3, len(self.rows))
+        self.assertEqual(('2', 'b'), self.rows[1]['data'])
+        self.assertEqual(['1', '2', '1'], self.rows.column('id'))
+        self.assertEqual('b', self.rows[1].value('name'))
+        self.assertEqual(self.rows[1], self.rows.by('name')['b'])
+        self.assertRaises(KeyError, rows.RowSet([['1']]).column, 'id')
+        # equal rows share one tuple
+        self.assertIs(self.rows[0].data, self.rows[2].data)
+
+    def test_equality(self):
+        self.assertEqual(self.rows[0], self.rows[2])
+        self.assertNotEqual(self.rows[0], self.rows[1])
+        self.assertEqual(1, len(set([self.rows[0], self.rows[2]])))
+        self.assertIn(['2', 'b'], self.rows)
+        self.assertIn({'data': ['2', 'b']}, self.rows)
+        self.assertNotIn(['3', 'c'], self.rows)
+        self.assertEqual(set([('1', 'a')]),
+                         self.rows - rows.RowSet([['2', 'b']]))
+
+    def test_distinct_types(self):
+        row_set = rows.RowSet([[1], [True], [1.0]])
+        self.assertEqual([int, bool, float],
+                         [type(row['data'][0]) for row in row_set])
+        self.assertEqual(set([('1',), ('True',), ('1.0',)]),
+                         row_set.normalized())
+
+    def test_compact_body(self):
+        body = {'results': [{'data': ['1', 'a']}]}
+        compact = rows.compact_body(body, COLUMNS)
+        self.assertIsInstance(compact['results'], rows.RowSet)
+        self.assertEqual(('id', 'name'), compact['results'].columns)
+        self.assertEqual([{'data': ['1', 'a']}], body['results'])
+        self.assertEqual({}, rows.compact_body({}))
+
+    def test_json_round_trip(self):
+        body = {'results': [{'data': ['1', 'a']}, {'data': [2, None]}]}
+        compact = rows.compact_body(body)
+        self.assertEqual(body, jsonutils.loads(jsonutils.dumps(compact)))
+        self.assertEqual(compact['results'].values(), rows.compact_body(
+            jsonutils.loads(jsonutils.dumps(compact)))['results'].values())
@@ -0,0 +1,178 @@
+# Copyright 2026 OpenStack Foundation
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import collections
+import random
+
+import testtools
+
+from congress_tempest_plugin.tests.scenario import table_compare
+
+COLUMNS = [{'name': 'id'}, {'name': 'name'}, {'name': 'size'}]
+
+
+def _rows(*rows):
+    return [{'data': list(row)} for row in rows]
+
+
+class TestTableComparator(testtools.TestCase):
+
+    def setUp(self):
+        super(TestTableComparator, self).setUp()
+        self.comparator = table_compare.TableComparator(
+            COLUMNS, missing_attributes_allowed=['size'])
+
+    def test_diff(self):
+        diff = self.comparator.diff(
+            _rows(('1', 'a', 'None'), ('2', 'b', '3'), ('4', 'd', '1')),
+            [{'id': 1, 'name': 'a'}, {'id': 2, 'name': 'c', 'size': 3},
+             {'id': 5, 'name': 'e'}])
+        self.assertFalse(diff.matches)
+        self.assertEqual({('5', 'e', 'None'): 1}, diff.missing)
+        self.assertEqual({('4', 'd', '1'): 1}, diff.unexpected)
+        self.assertEqual({'2': {'name': ('b', 'c')}}, diff.changed)
+
+    def test_matches(self):
+        self.assertTrue(self.comparator.diff(
+            _rows((1, 'a', None), ('2', 'b', '3')),
+            [{'id': '1', 'name': 'a'},
+             {'id': 2, 'name': 'b', 'size': 3}]).matches)
+
+    def test_missing_attribute(self):
+        comparator = table_compare.TableComparator(COLUMNS)
+        diff = comparator.diff(_rows(('1', 'a', 'None')),
+                               [{'id': 1, 'name': 'a'}])
+        self.assertEqual({'1': {'size': ('None', table_compare.MISSING)}},
+                         diff.changed)
+
+    def test_duplicates(self):
+        items = [{'id': 1, 'name': 'a', 'size': 1}] * 2
+        diff = self.comparator.diff(_rows((1, 'a', 1)), items)
+        self.assertFalse(diff.matches)
+        self.assertEqual({('1', 'a', '1'): 1}, diff.missing)
+        self.assertTrue(self.comparator.diff(
+            _rows((1, 'a', 1), (1, 'a', 1)), items).matches)
+        diff = self.comparator.diff(_rows((1, 'a', 1), (1, 'a', 1)),
+                                    items[:1])
+        self.assertEqual({('1', 'a', '1'): 1}, diff.unexpected)
+
+    def test_booleans_are_not_integers(self):
+        diff = self.comparator.diff(_rows((1, 'a', True)),
+                                    [{'id': 1, 'name': 'a', 'size': 1}])
+        self.assertEqual({'1': {'size': ('True', '1')}}, diff.changed)
+
+    def test_diff_rows(self):
+        diff = table_compare.diff_rows(
+            [('1', 'a'), ('1', 'a'), ('2', 'b')],
+            collections.Counter({('1', 'a'): 1, ('2', 'c'): 1}),
+            columns=('id', 'name'), key_index=0)
+        self.assertEqual({}, diff.missing)
+        self.assertEqual({('1', 'a'): 1}, diff.unexpected)
+        self.assertEqual({'2': {'name': ('b', 'c')}}, diff.changed)
+        self.assertEqual("1 unexpected (('1', 'a')); "
+                         "1 changed (2: {'name': ('b', 'c')})", str(diff))
+        diff = table_compare.diff_rows([('1',)] * 3, [])
+        self.assertEqual("3 unexpected (('1',) x3)", str(diff))
+
+
+class TestIncrementalComparisonCounts(testtools.TestCase):
+
+    def setUp(self):
+        super(TestIncrementalComparisonCounts, self).setUp()
+        self.comparison = table_compare.IncrementalComparison(
+            table_compare.TableComparator(COLUMNS))
+
+    def test_duplicates(self):
+        items = [{'id': 1, 'name': 'a', 'size': 1}] * 2
+        diff = self.comparison.update(_rows((1, 'a', 1)), items)
+        self.assertEqual({('1', 'a', '1'): 1}, diff.missing)
+        self.assertTrue(self.comparison.update(
+            _rows((1, 'a', 1), (1, 'a', 1)), items).matches)
+        diff = self.comparison.update(_rows((1, 'a', 1), (1, 'a', 1)),
+                                      items[:1])
+        self.assertEqual({('1', 'a', '1'): 1}, diff.unexpected)
+
+    def test_booleans_are_not_integers(self):
+        items = [{'id': 1, 'name': 'a', 'size': 1}]
+        self.assertTrue(self.comparison.update(_rows((1, 'a', 1)),
+                                               items).matches)
+        diff = self.comparison.update(_rows((1, 'a', True)), items)
+        self.assertEqual({'1': {'size': ('True', '1')}}, diff.changed)
+        diff = self.comparison.update(
+            _rows((1, 'a', 1)), [{'id': 1, 'name': 'a', 'size': 1.0}])
+        self.assertEqual({'1': {'size': ('1', '1.0')}}, diff.changed)
+
+
+class TestIncrementalComparison(testtools.TestCase):
+
+    def setUp(self):
+        super(TestIncrementalComparison, self).setUp()
+        self.comparator = table_compare.TableComparator(
+            COLUMNS, missing_attributes_allowed=['size'])
+
+    def test_update_follows_changes(self):
+        comparison = table_compare.IncrementalComparison(self.comparator)
+        items = [{'id': 1, 'name': 'a'}]
+        diff = comparison.update(_rows(), items)
+        self.assertEqual({('1', 'a', 'None'): 1}, diff.missing)
+
+        rows = _rows(('1', 'a', 'None'))
+        self.assertTrue(comparison.update(rows, items).matches)
+        self.assertEqual(1, comparison.last_delta)
+        # nothing changed, the previous result is returned as is
+        self.assertIs(comparison.update(rows, items),
+                      comparison.update(list(rows), list(items)))
+        self.assertEqual(0, comparison.last_delta)
+
+        items.append({'id': 2, 'name': 'b', 'size': [1]})
+        diff = comparison.update(rows, items)
+        self.assertEqual({('2', 'b', '[1]'): 1}, diff.missing)
+        self.assertTrue(comparison.update(
+            rows + _rows(('2', 'b', '[1]')), items).matches)
+
+    def test_subset(self):
+        comparison = table_compare.IncrementalComparison(self.comparator,
+                                                         subset=True)
+        items = [{'id': 1, 'name': 'a'}, {'id': 2, 'name': 'b'}]
+        self.assertTrue(comparison.update(
+            _rows(('1', 'a', 'None')), items).matches)
+        self.assertEqual({('3', 'c', 'None'): 1}, comparison.update(
+            _rows(('1', 'a', 'None'), ('3', 'c', 'None')),
+            items).unexpected)
+
+    def test_matches_full_diff(self):
+        rng = random.Random(0)
+        comparison = table_compare.IncrementalComparison(self.comparator)
+        rows = {}
+        items = {}
+        for poll in range(100):
+            for i in range(rng.randrange(4)):
+                key = rng.randrange(20)
+                if key in rows:
+                    del rows[key]
+                else:
+                    rows[key] = (str(key), rng.choice('ab'),
+                                 rng.choice(['None', '1']))
+                key = rng.randrange(20)
+                if key in items:
+                    del items[key]
+                else:
+                    items[key] = {'id': key, 'name': rng.choice('ab')}
+            table_rows = _rows(*rows.values())
+            expected = self.comparator.diff(table_rows, items.values())
+            diff = comparison.update(table_rows, items.values())
+            self.assertEqual(
+                (expected.missing, expected.unexpected, expected.changed),
+                (diff.missing, diff.unexpected, diff.changed))
@@ -0,0 +1,92 @@
+# Copyright 2026 OpenStack Foundation
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import testtools
+
+from congress_tempest_plugin.services.policy import trace
+
+TRACE = '''\
+Clas  : Call: error(x)
+Clas  : | Call: nova:servers(x, y)
+Clas  : | Exit: nova:servers("a", "b")
+Clas  : | Call: not p(x)
+Clas  : | | Call: p("a")
+Clas  : | | Fail: p("a")
+Clas  : | Exit: not p("a")
+Clas  : | Redo: nova:servers("a", "b")
+Clas  : | Exit: nova:servers("c", "d")
+Clas  : | Call: not p(x)
+Clas  : | | Call: p("c")
+Clas  : | | Exit: p("c")
+Clas  : | Fail: not p("c")
+Clas  : | Fail: nova:servers(x, y)
+Clas  : Exit: error("a")
+'''
+
+
+class TestTrace(testtools.TestCase):
+
+    def test_parse(self):
+        parsed = trace.parse(TRACE)
+        self.assertEqual(0, parsed.unparsed)
+        self.assertEqual(1, len(parsed.roots))
+        root = parsed.roots[0]
+        self.assertEqual(('error', 1, 0), (root.table, root.exits,
+                                           root.fails))
+        self.assertEqual(['nova:servers', 'not p', 'not p'],
+                         [node.name for node in root.children])
+        self.assertEqual(2, parsed.max_depth())
+
+    def test_negated_profile(self):
+        profiles = trace.parse(TRACE).profile()
+        self.assertEqual(['error', 'not p', 'nova:servers', 'p'],
+                         sorted(profiles))
+        negated = profiles['not p'].summary()
+        self.assertEqual(('p', True, 2, 1, 1),
+                         (negated['table'], negated['negated'],
+                          negated['calls'], negated['exits'],
+                          negated['fails']))
+        positive = profiles['p'].summary()
+        self.assertEqual((False, 2, 1, 1, 2),
+                         (positive['negated'], positive['calls'],
+                          positive['exits'], positive['fails'],
+                          positive['min_depth']))
+        servers = profiles['nova:servers']
+        self.assertEqual((1, 2, 1, 1), (servers.calls, servers.exits,
+                                        servers.fails, servers.redos))
+
+    def test_timed_trace(self):
+        parsed = trace.parse('[1.0] Call: q(x)\n'
+                             '[1.5] | Call: r(x)\n'
+                             '[3.0] | Exit: r(1)\n'
+                             '[3.5] Exit: q(1)\n'
+                             'garbage\n')
+        self.assertEqual(1, parsed.unparsed)
+        self.assertEqual(['q', 'r'],
+                         [p.table for p in parsed.hot_tables()])
+        self.assertEqual(2.5, parsed.profile()['q'].time)
+
+    def test_hot_rules(self):
+        rules = [{'id': '1', 'rule': 'error(x) :- nova:servers(x, y), '
+                                     'not p(x)'},
+                 {'id': '2', 'rule': 'p(x) :- q(x)'}]
+        report = trace.hot_rules(trace.parse(TRACE), rules,
+                                 policy_name='Clas')
+        self.assertEqual(
+            [('error', False, ['1']), ('p', False, ['2']),
+             ('p', True, ['2'])],
+            sorted((entry['table'], entry['negated'],
+                    [r['id'] for r in entry['rules']])
+                   for entry in report))
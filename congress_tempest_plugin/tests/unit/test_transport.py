@@ -0,0 +1,63 @@
+# Copyright 2026 OpenStack Foundation
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import testtools
+
+from congress_tempest_plugin.services.policy import policy_client
+from congress_tempest_plugin.services.policy import transport
+from congress_tempest_plugin.tests import fake_congress
+
+
+class TestPooledHttp(testtools.TestCase):
+
+    def setUp(self):
+        super(TestPooledHttp, self).setUp()
+        self.server = fake_congress.FakeCongressServer().start()
+        self.addCleanup(self.server.stop)
+
+    def test_response(self):
+        http = transport.PooledHttp()
+        self.addCleanup(http.clear)
+        resp, body = http.request(self.server.url + '/v1/policies', 'GET')
+        self.assertEqual(200, resp.status)
+        self.assertEqual('200', resp['status'])
+        self.assertEqual('application/json', resp['content-type'])
+        self.assertEqual(self.server.url + '/v1/policies',
+                         resp['content-location'])
+        self.assertIn(b'classification', body)
+
+    def test_connections_reused(self):
+        client = self.server.make_client(persistent_connections=True)
+        self.assertIsInstance(client.http_obj, transport.PooledHttp)
+        for i in range(10):
+            client.list_policy()
+        stats = client.get_request_stats()
+        self.assertEqual(10, stats['count'])
+        self.assertEqual(1, stats['connections_opened'])
+
+    def test_concurrent_connections_bounded(self):
+        client = self.server.make_client(persistent_connections=True,
+                                         pool_size=2)
+        self.server.latency = 0.01
+        policy_client.run_concurrently(lambda i: client.list_policy(),
+                                       range(20), max_workers=2)
+        self.assertEqual(2, client.get_request_stats()['connections_opened'])
+
+    def test_closing_transport(self):
+        client = self.server.make_client()
+        self.assertNotIsInstance(client.http_obj, transport.PooledHttp)
+        client.list_policy()
+        client.list_policy()
+        self.assertEqual(2, client.get_request_stats()['connections_opened'])
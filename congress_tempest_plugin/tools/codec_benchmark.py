@@ -0,0 +1,125 @@
+# Copyright 2026 OpenStack Foundation
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Compare the PolicyClient JSON codecs on Congress API payloads.
+
+Payloads are response or request bodies saved from a Congress API, e.g.::
+
+    curl -H "X-Auth-Token: $TOKEN" \\
+        $CONGRESS/v1/data-sources/nova/tables/servers/rows > servers.json
+    python -m congress_tempest_plugin.tools.codec_benchmark servers.json
+
+Without files, payloads shaped like a 10,000 row doctor event listing, a
+monasca webhook notification and a datasource listing are generated.  For
+each payload and installed codec, the best time of several rounds of
+decoding and encoding it is printed.
+"""
+
+import argparse
+import os
+import sys
+import timeit
+
+from congress_tempest_plugin.services.policy import json_codec
+
+
+def sample_payloads(rows=10000):
+    """Return generated payloads as a dict of name to encoded body."""
+    events = {'results': [
+        {'data': ['2026-01-01T00:00:%02d.%06dZ' % (i % 60, i),
+                  'compute.host.down', 'compute-%d' % (i % 500),
+                  'down', 'zabbix', 'event-%d' % i]}
+        for i in range(rows)]}
+    alarm = {
+        'metrics': [{'dimensions': {'hostname': 'openstack-13.local.lan',
+                                    'service': 'monitoring'},
+                     'id': None, 'name': 'load.avg_1_min'}],
+        'alarm_id': '3beb4934-053d-4f8f-9704-273bffc2441b',
+        'state': 'ALARM',
+        'alarm_timestamp': 1531821822,
+        'tenant_id': '3661888238874df098988deab07c599d',
+        'old_state': 'UNDETERMINED',
+        'alarm_description': '',
+        'message': 'Thresholds were exceeded for the sub-alarms',
+        'alarm_definition_id': '8e5d033f-28cc-459f-91d4-813307e4ca8a',
+        'alarm_name': 'alarmPerHost23'}
+    datasources = {'results': [
+        {'id': '%08d-0000-0000-0000-000000000000' % i,
+         'name': 'datasource%d' % i, 'driver': 'nova', 'enabled': True,
+         'description': None, 'type': None,
+         'config': {'username': 'admin', 'tenant_name': 'admin',
+                    'password': '<hidden>',
+                    'auth_url': 'http://127.0.0.1/identity',
+                    'poll_time': '10'}}
+        for i in range(20)]}
+    codec = json_codec.get_codec('json')
+    return dict((name, codec.dumps(body).encode('utf-8'))
+                for name, body in (('doctor_events_%d' % rows, events),
+                                   ('monasca_webhook', alarm),
+                                   ('datasources', datasources)))
+
+
+def bench(codec, payload, rounds=5):
+    """Return the best (decode, encode) times of payload with codec."""
+    body = codec.loads(payload)
+    timer = timeit.Timer(lambda: codec.loads(payload))
+    number, _ = timer.autorange()
+    decode = min(timer.repeat(rounds, number)) / number
+    timer = timeit.Timer(lambda: codec.dumps(body))
+    number, _ = timer.autorange()
+    encode = min(timer.repeat(rounds, number)) / number
+    return decode, encode
+
+
+def run(payloads, codecs=None, rounds=5, out=sys.stdout):
+    codecs = codecs or json_codec.available_codecs()
+    out.write('%-24s %-10s %12s %12s %12s\n' % (
+        'payload', 'codec', 'bytes', 'decode (ms)', 'encode (ms)'))
+    results = {}
+    for name in sorted(payloads):
+        payload = payloads[name]
+        for codec_name in codecs:
+            decode, encode = bench(json_codec.get_codec(codec_name),
+                                   payload, rounds)
+            results[(name, codec_name)] = (decode, encode)
+            out.write('%-24s %-10s %12d %12.3f %12.3f\n' % (
+                name, codec_name, len(payload), decode * 1e3,
+                encode * 1e3))
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('payloads', nargs='*',
+                        help='files holding saved Congress API bodies')
+    parser.add_argument('--codec', action='append',
+                        help='codec to compare (default: all installed)')
+    parser.add_argument('--rows', type=int, default=10000,
+                        help='rows of the generated listing payload')
+    parser.add_argument('--rounds', type=int, default=5)
+    args = parser.parse_args(argv)
+
+    if args.payloads:
+        payloads = {}
+        for path in args.payloads:
+            with open(path, 'rb') as f:
+                payloads[os.path.basename(path)] = f.read()
+    else:
+        payloads = sample_payloads(args.rows)
+    run(payloads, args.codec, args.rounds)
+
+
+if __name__ == '__main__':
+    main()